@@ -0,0 +1,123 @@
+"""
+Import-time benchmark for EvoVerse packages.
+
+Each target is imported in a fresh interpreter (so nothing is already in
+sys.modules) and timed end to end; ``-X importtime`` output is used to
+list the slowest modules it pulled in.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 5 --top 15 evoverse.knowledge
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_TARGETS = [
+    "evoverse.config",
+    "evoverse.literature",
+    "evoverse.knowledge",
+    "evoverse.knowledge.embeddings",
+    "evoverse.knowledge.vector_db",
+]
+
+# Statements timed after import; none of them should load the model
+SNIPPETS = {
+    "get_config() x1000": (
+        "from evoverse.config import get_config\n"
+        "for _ in range(1000): get_config()"
+    ),
+    "get_embedder()": (
+        "from evoverse.knowledge import get_embedder\n"
+        "get_embedder()"
+    ),
+}
+
+HEAVY_MODULES = ["torch", "sentence_transformers", "chromadb", "py2neo", "matplotlib", "networkx"]
+
+
+def time_statement(statement: str, repeat: int) -> Tuple[float, List[str]]:
+    """
+    Run statement in fresh interpreters.
+
+    Returns:
+        Tuple of (median wall time in seconds, heavy modules left in sys.modules)
+    """
+    probe = (
+        f"import sys\n{statement}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    timings = []
+    loaded: List[str] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=REPO_ROOT, capture_output=True, text=True
+        )
+        timings.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        lines = result.stdout.strip().splitlines()
+        loaded = [m for m in lines[-1].split(",") if m] if lines else []
+    return statistics.median(timings), loaded
+
+
+def slowest_imports(module: str, top: int) -> List[Tuple[str, float]]:
+    """Top modules by cumulative import time (seconds) from ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    cumulative: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumul, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cumul) / 1e6
+    return sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure EvoVerse import times")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS, help="Modules to import")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per target")
+    parser.add_argument("--top", type=int, default=10, help="Slowest sub-imports to list")
+    args = parser.parse_args()
+
+    baseline, _ = time_statement("pass", args.repeat)
+    print(f"Interpreter startup: {baseline * 1000:.0f} ms\n")
+
+    print(f"{'target':<40} {'ms':>8}  heavy modules loaded")
+    for target in args.targets:
+        try:
+            elapsed, loaded = time_statement(f"import {target}", args.repeat)
+        except RuntimeError as e:
+            print(f"{target:<40} {'error':>8}  {e}")
+            continue
+        print(f"{target:<40} {(elapsed - baseline) * 1000:>8.0f}  {', '.join(loaded) or '-'}")
+
+    for label, statement in SNIPPETS.items():
+        try:
+            elapsed, loaded = time_statement(statement, args.repeat)
+        except RuntimeError as e:
+            print(f"{label:<40} {'error':>8}  {e}")
+            continue
+        print(f"{label:<40} {(elapsed - baseline) * 1000:>8.0f}  {', '.join(loaded) or '-'}")
+
+    for target in args.targets:
+        print(f"\nSlowest imports under {target}:")
+        for name, seconds in slowest_imports(target, args.top):
+            print(f"  {seconds * 1000:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
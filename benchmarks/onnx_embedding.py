@@ -0,0 +1,140 @@
+"""
+Embedding backend benchmark: PyTorch vs ONNX Runtime (fp32 and int8).
+
+Encodes the same texts with every backend variant and reports throughput
+and agreement with the PyTorch fp32 reference:
+- cosine: per-text cosine similarity to the reference vector (mean / min)
+- top-k overlap: mean overlap of each text's k nearest neighbours within
+  the set, i.e. how much retrieval results would change
+
+Usage:
+    python benchmarks/onnx_embedding.py --papers papers.jsonl --threads 1 4
+    python benchmarks/onnx_embedding.py --synthetic 512
+
+``--papers`` takes JSON lines with "title" and "abstract" fields.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from evoverse.knowledge.embedding_backends import EmbeddingBackend, create_backend  # noqa: E402
+
+WORDS = (
+    "protein gene expression neural network cell signaling graph citation "
+    "transformer catalyst alloy synapse cortex sequencing model inference "
+    "regression pathway mutation lattice diffusion attention receptor"
+).split()
+
+
+def load_texts(papers_path: str, synthetic: int, seed: int) -> List[str]:
+    """Paper texts in PaperEmbedder's ``title [SEP] abstract`` format."""
+    if papers_path:
+        texts = []
+        with open(papers_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    paper = json.loads(line)
+                    texts.append(f"{paper.get('title', '')} [SEP] {paper.get('abstract', '')}")
+        return texts
+
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choices(WORDS, k=rng.randint(6, 14)))
+        + " [SEP] "
+        + " ".join(rng.choices(WORDS, k=rng.randint(80, 250)))
+        for _ in range(synthetic)
+    ]
+
+
+def run(backend: EmbeddingBackend, texts: List[str], batch_size: int) -> Tuple[np.ndarray, float]:
+    """Encode texts; returns (embeddings, texts per second) excluding warm-up."""
+    backend.encode(texts[:batch_size], batch_size=batch_size)
+    start = time.perf_counter()
+    embeddings = backend.encode(texts, batch_size=batch_size)
+    return embeddings, len(texts) / (time.perf_counter() - start)
+
+
+def normalize(embeddings: np.ndarray) -> np.ndarray:
+    return embeddings / np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+
+
+def agreement(reference: np.ndarray, candidate: np.ndarray, k: int) -> Dict[str, float]:
+    """Cosine and top-k neighbour agreement of candidate with reference."""
+    ref = normalize(reference)
+    cand = normalize(candidate)
+    cosines = np.sum(ref * cand, axis=1)
+
+    k = min(k, len(ref) - 1)
+    overlap = float("nan")
+    if k > 0:
+        def neighbours(vectors: np.ndarray) -> np.ndarray:
+            sims = vectors @ vectors.T
+            np.fill_diagonal(sims, -np.inf)
+            return np.argpartition(-sims, k - 1, axis=1)[:, :k]
+
+        ref_nn = neighbours(ref)
+        cand_nn = neighbours(cand)
+        overlap = float(np.mean([
+            len(set(r) & set(c)) / k for r, c in zip(ref_nn, cand_nn)
+        ]))
+
+    return {
+        "cos_mean": float(cosines.mean()),
+        "cos_min": float(cosines.min()),
+        "topk_overlap": overlap
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PaperEmbedder backends")
+    parser.add_argument("--model", default="allenai/specter", help="Model name or path")
+    parser.add_argument("--revision", default=None, help="Model revision")
+    parser.add_argument("--papers", default="", help="JSON lines file with title/abstract")
+    parser.add_argument("--synthetic", type=int, default=256, help="Synthetic texts if no --papers")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, nargs="+", default=[0], help="ONNX intra-op thread counts")
+    parser.add_argument("--onnx-dir", default=".onnx_models", help="Exported ONNX model directory")
+    parser.add_argument("--top-k", type=int, default=10, help="Neighbours for retrieval agreement")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    texts = load_texts(args.papers, args.synthetic, args.seed)
+    print(f"{len(texts)} texts, batch size {args.batch_size}\n")
+
+    reference_backend = create_backend("torch", args.model, device="cpu", revision=args.revision)
+    reference, reference_rate = run(reference_backend, texts, args.batch_size)
+    del reference_backend
+
+    print(f"{'variant':<24} {'texts/s':>9} {'speedup':>8} {'cos mean':>9} {'cos min':>8} {'top-k':>6}")
+    print(f"{'torch fp32':<24} {reference_rate:>9.1f} {1.0:>8.2f} {1.0:>9.4f} {1.0:>8.4f} {1.0:>6.3f}")
+
+    for quantize in (False, True):
+        for threads in args.threads:
+            backend = create_backend(
+                "onnx",
+                args.model,
+                revision=args.revision,
+                onnx_dir=args.onnx_dir,
+                quantize=quantize,
+                num_threads=threads
+            )
+            embeddings, rate = run(backend, texts, args.batch_size)
+            scores = agreement(reference, embeddings, args.top_k)
+            label = f"onnx {'int8' if quantize else 'fp32'} t={threads or 'auto'}"
+            print(
+                f"{label:<24} {rate:>9.1f} {rate / reference_rate:>8.2f} "
+                f"{scores['cos_mean']:>9.4f} {scores['cos_min']:>8.4f} {scores['topk_overlap']:>6.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Vector backend benchmark: ChromaDB vs FAISS HNSW.
+
+For each backend, on the same synthetic clustered vectors:
+- build: time to write the corpus (batched upserts with metadata and a
+  short document, plus flush) and peak RSS of the building process
+- open: cold start in a fresh process (open backend and collection, run
+  the first query) and RSS after it
+- query: single-query latency (p50 / p95) and batched throughput
+- recall@k: overlap with exact cosine top-k from numpy
+
+Each phase runs in its own process so RSS figures are not mixed. With
+several --ef-search values, later rows reuse the already imported
+library, so only the first row's open time includes the import.
+
+Usage:
+    python benchmarks/vector_backends.py --n 100000 --dim 768
+    python benchmarks/vector_backends.py --backends faiss --ef-search 32 64 128
+"""
+
+import argparse
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from evoverse.knowledge.vector_backends import create_vector_backend  # noqa: E402
+
+COLLECTION = "bench"
+
+
+def make_centers(args) -> np.ndarray:
+    return np.random.default_rng(args.seed).normal(size=(args.clusters, args.dim)).astype(np.float32)
+
+
+def make_points(centers: np.ndarray, n: int, seed: int) -> np.ndarray:
+    """Points scattered around random cluster centers."""
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, len(centers), size=n)
+    return (centers[labels] + 0.6 * rng.normal(size=(n, centers.shape[1]))).astype(np.float32)
+
+
+def rss_mb() -> float:
+    """Current resident set size."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def open_backend(args, ef_search: int):
+    return create_vector_backend(
+        args.backend,
+        args.path,
+        hnsw_m=args.m,
+        hnsw_ef_construction=args.ef_construction,
+        hnsw_ef_search=ef_search
+    )
+
+
+def run_build(args) -> Dict[str, Any]:
+    corpus = make_points(make_centers(args), args.n, args.seed + 1)
+    backend = open_backend(args, args.ef_search[0])
+    collection = backend.create_collection(COLLECTION, metadata={"hnsw:space": "cosine"})
+    batch = min(args.batch_size, backend.max_batch_size)
+
+    start = time.perf_counter()
+    for i in range(0, args.n, batch):
+        end = min(i + batch, args.n)
+        collection.upsert(
+            ids=[f"p{j}" for j in range(i, end)],
+            embeddings=backend.prepare_embeddings(corpus[i:end]),
+            metadatas=[{"year": 2000 + j % 25} for j in range(i, end)],
+            documents=[f"paper {j}" for j in range(i, end)]
+        )
+    backend.flush()
+    return {"build_s": time.perf_counter() - start, "build_peak_rss_mb": peak_rss_mb()}
+
+
+def run_serve(args) -> Dict[str, Any]:
+    centers = make_centers(args)
+    queries = make_points(centers, args.queries, args.seed + 2)
+    base_rss = rss_mb()
+
+    results: Dict[str, Any] = {}
+    for ef_search in args.ef_search:
+        start = time.perf_counter()
+        backend = open_backend(args, ef_search)
+        collection = backend.get_collection(COLLECTION)
+        collection.query(query_embeddings=backend.prepare_embeddings(queries[:1]), n_results=args.top_k)
+        open_s = time.perf_counter() - start
+        open_rss = rss_mb() - base_rss
+
+        latencies = []
+        found: List[List[str]] = []
+        for q in queries:
+            start = time.perf_counter()
+            response = collection.query(query_embeddings=backend.prepare_embeddings(q[None]), n_results=args.top_k)
+            latencies.append(time.perf_counter() - start)
+            found.append(response["ids"][0])
+
+        start = time.perf_counter()
+        for i in range(0, len(queries), 64):
+            collection.query(query_embeddings=backend.prepare_embeddings(queries[i:i + 64]), n_results=args.top_k)
+        batch_qps = len(queries) / (time.perf_counter() - start)
+
+        results[str(ef_search)] = {
+            "open_s": open_s,
+            "open_rss_mb": open_rss,
+            "p50_ms": 1000 * float(np.percentile(latencies, 50)),
+            "p95_ms": 1000 * float(np.percentile(latencies, 95)),
+            "batch_qps": batch_qps,
+            "found": found
+        }
+        del collection, backend
+
+    # Exact top-k, computed after the RSS readings
+    corpus = make_points(centers, args.n, args.seed + 1)
+    corpus /= np.linalg.norm(corpus, axis=1, keepdims=True)
+    normalized = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    exact = np.argsort(-(normalized @ corpus.T), axis=1)[:, :args.top_k]
+    for stats in results.values():
+        stats["recall"] = float(np.mean([
+            len({f"p{j}" for j in truth} & set(hits)) / args.top_k
+            for truth, hits in zip(exact, stats.pop("found"))
+        ]))
+    return results
+
+
+def child(args, phase: str) -> Dict[str, Any]:
+    """Run one phase in a fresh interpreter."""
+    command = [
+        sys.executable, __file__, "--phase", phase, "--backend", args.backend, "--path", args.path,
+        "--n", str(args.n), "--dim", str(args.dim), "--clusters", str(args.clusters),
+        "--queries", str(args.queries), "--top-k", str(args.top_k), "--batch-size", str(args.batch_size),
+        "--m", str(args.m), "--ef-construction", str(args.ef_construction), "--seed", str(args.seed),
+        "--ef-search", *[str(ef) for ef in args.ef_search]
+    ]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PaperVectorDB storage backends")
+    parser.add_argument("--backends", nargs="+", default=["chroma", "faiss"])
+    parser.add_argument("--n", type=int, default=20000, help="Corpus size")
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--clusters", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=2000, help="Rows per upsert")
+    parser.add_argument("--m", type=int, default=32, help="FAISS HNSW M")
+    parser.add_argument("--ef-construction", type=int, default=200, help="FAISS HNSW efConstruction")
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[64], help="FAISS HNSW efSearch values")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--phase", choices=["build", "serve"], help=argparse.SUPPRESS)
+    parser.add_argument("--backend", help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.phase:
+        result = run_build(args) if args.phase == "build" else run_serve(args)
+        print(json.dumps(result))
+        return
+
+    print(f"{args.n} x {args.dim} vectors, {args.queries} queries, top-{args.top_k}\n")
+    print(
+        f"{'backend':<18} {'build s':>8} {'build MB':>9} {'open s':>7} {'open MB':>8} "
+        f"{'p50 ms':>7} {'p95 ms':>7} {'batch q/s':>10} {'recall':>7}"
+    )
+    for backend in args.backends:
+        args.backend = backend
+        args.path = tempfile.mkdtemp(prefix=f"vector-bench-{backend}-")
+        # Chroma has no efSearch knob here; run it once
+        ef_values = args.ef_search
+        if backend != "faiss":
+            args.ef_search = ef_values[:1]
+        try:
+            build = child(args, "build")
+            serve = child(args, "serve")
+        finally:
+            shutil.rmtree(args.path, ignore_errors=True)
+            args.ef_search = ef_values
+
+        for ef_search, stats in serve.items():
+            label = f"faiss ef={ef_search}" if backend == "faiss" else backend
+            print(
+                f"{label:<18} {build['build_s']:>8.2f} {build['build_peak_rss_mb']:>9.0f} "
+                f"{stats['open_s']:>7.3f} {stats['open_rss_mb']:>8.0f} {stats['p50_ms']:>7.2f} "
+                f"{stats['p95_ms']:>7.2f} {stats['batch_qps']:>10.0f} {stats['recall']:>7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ import logging
 from evoverse.agents.base_agent import BaseAgent
 from evoverse.literature.unified_search import UnifiedLiteratureSearch
 from evoverse.literature.base_client import PaperMetadata, PaperAnalysis
+from evoverse.literature.sections import select_sections
 from evoverse.core.llm_client import LLMClient
 import hashlib
 import time
@@ -22,6 +23,11 @@ logger = logging.getLogger(__name__)
 class LiteratureAgent(BaseAgent):
     """MVP 版本文献 Agent。"""
 
+    # 摘要与深度分析发送给 LLM 的全文字符预算
+    FULL_TEXT_CHARS = 5000
+    # 摘要与深度分析只需要这些章节（参考文献不解析、不发送）
+    PROMPT_SECTIONS = ["abstract", "methods", "results", "discussion", "conclusion"]
+
     def __init__(
         self,
         agent_id: Optional[str] = None,
@@ -62,6 +68,7 @@ class LiteratureAgent(BaseAgent):
             deduplicate=True,
             # 对齐 Kosmos：默认提取全文，后续摘要优先使用全文内容
             extract_full_text=True,
+            full_text_until_section="references",
         )
         for i, p in enumerate(papers, start=1):
             logger.info(
@@ -94,6 +101,7 @@ class LiteratureAgent(BaseAgent):
         year = getattr(paper, "year", None)
         abstract = getattr(paper, "abstract", None) or getattr(paper, "summary", "")
         full_text = getattr(paper, "full_text", None) or ""
+        sections = getattr(paper, "sections", None) or []
         source = getattr(paper, "source", None)
         primary_id = getattr(paper, "primary_identifier", None)
 
@@ -125,11 +133,24 @@ class LiteratureAgent(BaseAgent):
             "year": year,
             # 对齐 Kosmos：保留全文，摘要阶段优先使用
             "full_text": full_text,
+            "sections": sections,     # full_text 中各章节的位置，构造 prompt 时按需选取
             "abstract": abstract,
             "summary": "",            # 这里先留空，后面 _summarize_paper 再填
         }
     
 
+    def _full_text_excerpt(self, paper: Dict[str, Any]) -> str:
+        """按章节选取全文片段；未识别出章节时退回到截断全文。"""
+        full_text = paper.get("full_text") or ""
+        sections = paper.get("sections") or []
+
+        excerpt = ""
+        if sections:
+            excerpt = select_sections(
+                full_text, sections, self.PROMPT_SECTIONS, max_chars=self.FULL_TEXT_CHARS
+            )
+        return excerpt or full_text[:self.FULL_TEXT_CHARS]
+
     def _summarize_paper(self, paper: Dict[str, Any]) -> str:
         """使用 LLM 为单篇文献生成结构化分析摘要。"""
         title = paper.get("title", "")
@@ -138,7 +159,7 @@ class LiteratureAgent(BaseAgent):
 
         # 对齐 Kosmos：优先使用全文，其次摘要，如果都没有就直接返回空
         if full_text:
-            base_text = f"全文（截断）：\n{full_text[:5000]}"
+            base_text = f"全文（节选）：\n{self._full_text_excerpt(paper)}"
         elif abstract:
             base_text = f"摘要：\n{abstract}"
         else:
@@ -197,7 +218,7 @@ class LiteratureAgent(BaseAgent):
 
         text = f"标题：{title}\n\n"
         if full_text:
-            text += f"全文（截断）：\n{full_text[:5000]}"
+            text += f"全文（节选）：\n{self._full_text_excerpt(paper)}"
         elif abstract:
             text += f"摘要：\n{abstract}"
         else:
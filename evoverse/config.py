@@ -1,6 +1,7 @@
 # evoverse/config.py
 from pydantic_settings import BaseSettings
 from pydantic import Field
+from functools import lru_cache
 from typing import Optional
 
 
@@ -78,6 +79,11 @@ class LiteratureConfig(BaseSettings):
     max_cache_size_mb: int = Field(default=1000, description="缓存最大大小 (MB)")
     max_results_per_query: int = Field(default=100, description="单次检索最大结果数")
     pdf_download_timeout: int = Field(default=30, description="PDF 下载超时 (秒)")
+    pdf_download_workers: int = Field(default=8, description="PDF 并发下载线程数")
+    pdf_parse_workers: int = Field(default=4, description="PDF 解析进程数 (<=1 时在主进程解析)")
+    pdf_parse_timeout: int = Field(default=60, description="单篇 PDF 解析超时 (秒)")
+    pdf_cache_max_size_mb: int = Field(default=2000, description="PDF 存储最大大小 (MB, 超出按 LRU 淘汰)")
+    pdf_revalidate_after_hours: int = Field(default=168, description="PDF 重新校验间隔 (小时, 0 表示不校验)")
 
     model_config = {
         "env_prefix": "LITERATURE_",
@@ -91,8 +97,24 @@ class KnowledgeConfig(BaseSettings):
     """知识图谱系统配置"""
     enable_neo4j: bool = Field(default=True, description="启用 Neo4j 知识图谱")
     enable_vector_db: bool = Field(default=True, description="启用向量数据库")
-    vector_db_path: str = Field(default="./vector_db", description="向量数据库路径")
+    vector_db_path: str = Field(default="./vector_db", description="向量数据库路径 (faiss 后端)")
+    vector_backend: str = Field(default="chroma", description="向量库后端: chroma 或 faiss")
+    faiss_hnsw_m: int = Field(default=32, description="FAISS HNSW 每个节点的邻居数 M (新建集合时生效)")
+    faiss_hnsw_ef_construction: int = Field(default=200, description="FAISS HNSW 建索引候选列表大小 efConstruction")
+    faiss_hnsw_ef_search: int = Field(default=64, description="FAISS HNSW 查询候选列表大小 efSearch (越大召回越高、越慢)")
     chroma_persist_directory: str = Field(default=".chroma_db", description="ChromaDB 持久化目录")
+    embedding_cache_dir: str = Field(default=".embedding_cache", description="论文嵌入缓存目录 (空字符串表示禁用)")
+    embedder: str = Field(default="specter", description="默认嵌入模型 (注册名或模型路径)")
+    embedding_backend: str = Field(default="torch", description="嵌入推理后端: torch、onnx 或 service")
+    onnx_model_dir: str = Field(default=".onnx_models", description="导出的 ONNX 模型目录")
+    onnx_quantize: bool = Field(default=True, description="ONNX 后端使用 int8 动态量化")
+    onnx_num_threads: int = Field(default=0, description="ONNX Runtime 算子内线程数 (0 表示默认)")
+    embedding_workers: int = Field(default=1, description="批量索引嵌入进程数 (1 表示单进程, 0 表示按核数自动)")
+    embedding_threads_per_worker: int = Field(default=4, description="每个嵌入进程绑定的核数/线程数")
+    embedding_service_address: str = Field(default="", description="共享嵌入服务地址 (embedding_backend=service 时使用)")
+    embedding_service_authkey: str = Field(default="evoverse", description="共享嵌入服务认证密钥")
+    embedding_service_max_batch: int = Field(default=64, description="嵌入服务微批最大文本数")
+    embedding_service_max_wait_ms: float = Field(default=5.0, description="嵌入服务微批最长等待时间（毫秒）")
 
     model_config = {
         "env_prefix": "KNOWLEDGE_",
@@ -117,5 +139,12 @@ class EvoVerseConfig(BaseSettings):
     }
 
 
+@lru_cache(maxsize=1)
 def get_config() -> EvoVerseConfig:
+    """Parsed configuration (environment and .env are read once per process)."""
     return EvoVerseConfig()
+
+
+def reset_config():
+    """Drop the cached configuration so the next get_config() re-reads it."""
+    get_config.cache_clear()
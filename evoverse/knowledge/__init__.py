@@ -2,84 +2,184 @@
 Knowledge and literature management for EvoVerse.
 
 Provides:
-- Paper embeddings (SPECTER)
-- Vector database (ChromaDB)
+- Paper embeddings (SPECTER; PyTorch or ONNX Runtime)
+- Vector database (ChromaDB or FAISS)
 - Semantic search
 - Knowledge graph (Neo4j)
 - Concept extraction (LLM)
 - Graph building and visualization
 """
 
-# Embeddings
-from evoverse.knowledge.embeddings import (
-    PaperEmbedder,
-    get_embedder,
-    reset_embedder
-)
-
-# Vector database
-from evoverse.knowledge.vector_db import (
-    PaperVectorDB,
-    get_vector_db,
-    reset_vector_db
-)
-
-# Semantic search
-from evoverse.knowledge.semantic_search import (
-    SemanticLiteratureSearch
-)
-
-# Knowledge graph
-from evoverse.knowledge.graph import (
-    KnowledgeGraph,
-    get_knowledge_graph,
-    reset_knowledge_graph
-)
-
-# Concept extraction
-from evoverse.knowledge.concept_extractor import (
-    ConceptExtractor,
-    ExtractedConcept,
-    ExtractedMethod,
-    ConceptRelationship,
-    ExtractionResult,
-    get_concept_extractor,
-    reset_concept_extractor
-)
-
-# Graph building
-from evoverse.knowledge.graph_builder import (
-    GraphBuilder,
-    get_graph_builder,
-    reset_graph_builder
-)
-
-# Graph visualization
-from evoverse.knowledge.graph_visualizer import (
-    GraphVisualizer,
-    LayoutAlgorithm,
-    VisualizationMode,
-    get_graph_visualizer,
-    reset_graph_visualizer
-)
-
-# Domain knowledge base (unified ontologies)
-from evoverse.knowledge.domain_kb import (
-    DomainKnowledgeBase,
-    Domain,
-    DomainConcept,
-    CrossDomainMapping
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    # Embeddings
+    from evoverse.knowledge.embeddings import (
+        PaperEmbedder,
+        EmbedderSpec,
+        register_embedder,
+        get_embedder_spec,
+        list_embedders,
+        get_embedder,
+        reset_embedder
+    )
+    from evoverse.knowledge.embedding_backends import (
+        EmbeddingBackend,
+        SentenceTransformerBackend,
+        OnnxEmbeddingBackend
+    )
+    from evoverse.knowledge.embedding_service import (
+        EmbeddingServer,
+        ServiceEmbeddingBackend
+    )
+    from evoverse.knowledge.embedding_pool import EmbeddingPool
+    from evoverse.knowledge.embedding_matrix import EmbeddingMatrix
+
+    # Vector database
+    from evoverse.knowledge.vector_db import (
+        PaperVectorDB,
+        ReindexJob,
+        get_vector_db,
+        reset_vector_db
+    )
+    from evoverse.knowledge.vector_backends import (
+        VectorBackend,
+        VectorCollection,
+        ChromaBackend,
+        FaissBackend
+    )
+
+    # Semantic search
+    from evoverse.knowledge.semantic_search import (
+        SemanticLiteratureSearch
+    )
+
+    # Knowledge graph
+    from evoverse.knowledge.graph import (
+        KnowledgeGraph,
+        get_knowledge_graph,
+        reset_knowledge_graph
+    )
+
+    # Concept extraction
+    from evoverse.knowledge.concept_extractor import (
+        ConceptExtractor,
+        ExtractedConcept,
+        ExtractedMethod,
+        ConceptRelationship,
+        ExtractionResult,
+        get_concept_extractor,
+        reset_concept_extractor
+    )
+
+    # Graph building
+    from evoverse.knowledge.graph_builder import (
+        GraphBuilder,
+        get_graph_builder,
+        reset_graph_builder
+    )
+
+    # Graph visualization
+    from evoverse.knowledge.graph_visualizer import (
+        GraphVisualizer,
+        LayoutAlgorithm,
+        VisualizationMode,
+        get_graph_visualizer,
+        reset_graph_visualizer
+    )
+
+    # Domain knowledge base (unified ontologies)
+    from evoverse.knowledge.domain_kb import (
+        DomainKnowledgeBase,
+        Domain,
+        DomainConcept,
+        CrossDomainMapping
+    )
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# the package does not pull in torch, chromadb, py2neo or matplotlib.
+_LAZY_IMPORTS = {
+    # Embeddings
+    "PaperEmbedder": "evoverse.knowledge.embeddings",
+    "EmbedderSpec": "evoverse.knowledge.embeddings",
+    "register_embedder": "evoverse.knowledge.embeddings",
+    "get_embedder_spec": "evoverse.knowledge.embeddings",
+    "list_embedders": "evoverse.knowledge.embeddings",
+    "get_embedder": "evoverse.knowledge.embeddings",
+    "reset_embedder": "evoverse.knowledge.embeddings",
+    "EmbeddingBackend": "evoverse.knowledge.embedding_backends",
+    "SentenceTransformerBackend": "evoverse.knowledge.embedding_backends",
+    "OnnxEmbeddingBackend": "evoverse.knowledge.embedding_backends",
+    "EmbeddingServer": "evoverse.knowledge.embedding_service",
+    "ServiceEmbeddingBackend": "evoverse.knowledge.embedding_service",
+    "EmbeddingPool": "evoverse.knowledge.embedding_pool",
+    "EmbeddingMatrix": "evoverse.knowledge.embedding_matrix",
+    # Vector database
+    "PaperVectorDB": "evoverse.knowledge.vector_db",
+    "ReindexJob": "evoverse.knowledge.vector_db",
+    "get_vector_db": "evoverse.knowledge.vector_db",
+    "reset_vector_db": "evoverse.knowledge.vector_db",
+    "VectorBackend": "evoverse.knowledge.vector_backends",
+    "VectorCollection": "evoverse.knowledge.vector_backends",
+    "ChromaBackend": "evoverse.knowledge.vector_backends",
+    "FaissBackend": "evoverse.knowledge.vector_backends",
+    # Semantic search
+    "SemanticLiteratureSearch": "evoverse.knowledge.semantic_search",
+    # Knowledge graph
+    "KnowledgeGraph": "evoverse.knowledge.graph",
+    "get_knowledge_graph": "evoverse.knowledge.graph",
+    "reset_knowledge_graph": "evoverse.knowledge.graph",
+    # Concept extraction
+    "ConceptExtractor": "evoverse.knowledge.concept_extractor",
+    "ExtractedConcept": "evoverse.knowledge.concept_extractor",
+    "ExtractedMethod": "evoverse.knowledge.concept_extractor",
+    "ConceptRelationship": "evoverse.knowledge.concept_extractor",
+    "ExtractionResult": "evoverse.knowledge.concept_extractor",
+    "get_concept_extractor": "evoverse.knowledge.concept_extractor",
+    "reset_concept_extractor": "evoverse.knowledge.concept_extractor",
+    # Graph building
+    "GraphBuilder": "evoverse.knowledge.graph_builder",
+    "get_graph_builder": "evoverse.knowledge.graph_builder",
+    "reset_graph_builder": "evoverse.knowledge.graph_builder",
+    # Graph visualization
+    "GraphVisualizer": "evoverse.knowledge.graph_visualizer",
+    "LayoutAlgorithm": "evoverse.knowledge.graph_visualizer",
+    "VisualizationMode": "evoverse.knowledge.graph_visualizer",
+    "get_graph_visualizer": "evoverse.knowledge.graph_visualizer",
+    "reset_graph_visualizer": "evoverse.knowledge.graph_visualizer",
+    # Domain knowledge base (unified ontologies)
+    "DomainKnowledgeBase": "evoverse.knowledge.domain_kb",
+    "Domain": "evoverse.knowledge.domain_kb",
+    "DomainConcept": "evoverse.knowledge.domain_kb",
+    "CrossDomainMapping": "evoverse.knowledge.domain_kb",
+}
 
 __all__ = [
     # Embeddings
     "PaperEmbedder",
+    "EmbedderSpec",
+    "register_embedder",
+    "get_embedder_spec",
+    "list_embedders",
     "get_embedder",
     "reset_embedder",
+    "EmbeddingBackend",
+    "SentenceTransformerBackend",
+    "OnnxEmbeddingBackend",
+    "EmbeddingServer",
+    "ServiceEmbeddingBackend",
+    "EmbeddingPool",
+    "EmbeddingMatrix",
     # Vector database
     "PaperVectorDB",
+    "ReindexJob",
     "get_vector_db",
     "reset_vector_db",
+    "VectorBackend",
+    "VectorCollection",
+    "ChromaBackend",
+    "FaissBackend",
     # Semantic search
     "SemanticLiteratureSearch",
     # Knowledge graph
@@ -110,3 +210,16 @@ __all__ = [
     "DomainConcept",
     "CrossDomainMapping",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
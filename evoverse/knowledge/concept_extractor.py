@@ -19,6 +19,7 @@ import time
 from evoverse.config import get_config
 from evoverse.core.llm_client import LLMClient
 from evoverse.literature.base_client import PaperMetadata
+from evoverse.literature.sections import select_sections
 
 logger = logging.getLogger(__name__)
 
@@ -421,8 +422,17 @@ class ConceptExtractor:
         text = f"Title: {paper.title}\n\n"
 
         if paper.full_text:
-            # Use first 3000 characters of full text
-            text += f"Text: {paper.full_text[:3000]}"
+            # Prefer the sections that carry concepts and methods; fall back
+            # to the first 3000 characters when no sections were detected
+            excerpt = ""
+            if paper.sections:
+                excerpt = select_sections(
+                    paper.full_text,
+                    paper.sections,
+                    ["abstract", "introduction", "methods", "results"],
+                    max_chars=3000
+                )
+            text += f"Text: {excerpt or paper.full_text[:3000]}"
         elif paper.abstract:
             text += f"Abstract: {paper.abstract}"
         else:
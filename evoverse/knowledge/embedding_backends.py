@@ -0,0 +1,448 @@
+"""
+Inference backends for PaperEmbedder.
+
+- ``torch``: sentence-transformers on PyTorch (CPU or GPU)
+- ``onnx``: the same transformer exported to ONNX and run under ONNX
+  Runtime, optionally with dynamic int8 quantization; meant for CPU-only
+  nodes
+- ``service``: thin client of a shared embedding service process
+  (see embedding_service)
+
+Backends produce vectors that differ slightly, so ``cache_tag`` becomes
+part of the embedding cache key.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import importlib.util
+import json
+import logging
+import re
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Optional dependencies - only presence is checked at import time
+HAS_SENTENCE_TRANSFORMERS = importlib.util.find_spec("sentence_transformers") is not None
+HAS_ONNXRUNTIME = importlib.util.find_spec("onnxruntime") is not None
+
+BACKENDS = ("torch", "onnx", "service")
+
+_ONNX_OPSET = 14
+
+
+class EmbeddingBackend(ABC):
+    """Encodes texts into embedding vectors."""
+
+    #: Short backend name ("torch", "onnx", "service")
+    name: str = ""
+
+    @property
+    @abstractmethod
+    def embedding_dim(self) -> int:
+        """Embedding dimension."""
+
+    @abstractmethod
+    def encode(self, texts: List[str], batch_size: int = 32, show_progress: bool = False) -> np.ndarray:
+        """
+        Encode texts.
+
+        Args:
+            texts: Texts to encode
+            batch_size: Batch size for inference
+            show_progress: Whether to show progress bar
+
+        Returns:
+            float32 array of shape (len(texts), embedding_dim)
+        """
+
+    def prepare(self, texts: List[str]) -> Tuple[List[str], np.ndarray]:
+        """
+        Truncate texts to what the model will read and measure them.
+
+        Backends with a tokenizer cut each text at the model's token limit
+        and return token counts; the default leaves texts as they are and
+        uses character counts, which order texts nearly the same way.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Tuple of (texts to encode, length of each)
+        """
+        return list(texts), np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+
+    def describe(self) -> Dict[str, Any]:
+        """Backend settings for logs and stats."""
+        return {"backend": self.name}
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """sentence-transformers model on PyTorch."""
+
+    name = "torch"
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: Optional[str] = None,
+        device: Optional[str] = None,
+        revision: Optional[str] = None
+    ):
+        """
+        Load the model.
+
+        Args:
+            model_name: Model name or path
+            cache_dir: Directory to cache model files
+            device: Device to use ("cuda", "cpu", or None for auto)
+            revision: Model revision
+        """
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(
+            model_name,
+            cache_folder=cache_dir,
+            device=device,
+            revision=revision
+        )
+
+    @property
+    def embedding_dim(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: List[str], batch_size: int = 32, show_progress: bool = False) -> np.ndarray:
+        embeddings = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=show_progress
+        )
+        return embeddings.astype(np.float32, copy=False)
+
+    def prepare(self, texts: List[str]) -> Tuple[List[str], np.ndarray]:
+        return truncate_to_tokens(self.model.tokenizer, texts, self.model.max_seq_length)
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "device": str(self.model.device)}
+
+
+class OnnxEmbeddingBackend(EmbeddingBackend):
+    """
+    Transformer exported to ONNX, run under ONNX Runtime.
+
+    The first use exports the model (needs sentence-transformers and torch)
+    into ``{onnx_dir}/{model}@{revision}/``: ``model.onnx``, optionally
+    ``model.int8.onnx``, the tokenizer files and ``pooling.json``. Later
+    runs only need onnxruntime and transformers' tokenizer.
+    """
+
+    name = "onnx"
+
+    def __init__(
+        self,
+        model_name: str,
+        onnx_dir: str,
+        cache_dir: Optional[str] = None,
+        revision: Optional[str] = None,
+        quantize: bool = True,
+        num_threads: int = 0
+    ):
+        """
+        Load (exporting first if needed) the ONNX model.
+
+        Args:
+            model_name: Model name or path
+            onnx_dir: Root directory for exported ONNX models
+            cache_dir: Directory to cache the original model files (export only)
+            revision: Model revision
+            quantize: Use the dynamically int8-quantized model
+            num_threads: ONNX Runtime intra-op threads (0 = runtime default)
+        """
+        if not HAS_ONNXRUNTIME:
+            raise ImportError("onnxruntime not installed. Install with: pip install onnxruntime")
+
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        self.model_name = model_name
+        self.revision = revision
+        self.quantize = quantize
+        self.num_threads = num_threads
+
+        slug = re.sub(r'[^\w.\-]+', '_', f"{model_name}@{revision or 'default'}")
+        self.export_dir = Path(onnx_dir) / slug
+        fp32_path = self.export_dir / "model.onnx"
+        if not fp32_path.exists():
+            export_onnx(model_name, self.export_dir, cache_dir=cache_dir, revision=revision)
+
+        model_path = fp32_path
+        if quantize:
+            model_path = self.export_dir / "model.int8.onnx"
+            if not model_path.exists():
+                quantize_onnx(fp32_path, model_path)
+
+        with open(self.export_dir / "pooling.json", 'r') as f:
+            pooling = json.load(f)
+        self.pooling_mode = pooling["mode"]
+        self.normalize = pooling.get("normalize", False)
+        self.max_seq_length = pooling["max_seq_length"]
+        self._embedding_dim = pooling["embedding_dim"]
+
+        self.tokenizer = AutoTokenizer.from_pretrained(str(self.export_dir))
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+        logger.info(f"Loaded ONNX model {model_path} (threads={num_threads or 'default'})")
+
+    @property
+    def embedding_dim(self) -> int:
+        return self._embedding_dim
+
+    def encode(self, texts: List[str], batch_size: int = 32, show_progress: bool = False) -> np.ndarray:
+        embeddings = np.zeros((len(texts), self._embedding_dim), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            encoded = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            feeds = {
+                name: value.astype(np.int64)
+                for name, value in encoded.items()
+                if name in self._input_names
+            }
+            hidden = self.session.run(None, feeds)[0]
+            embeddings[start:start + len(batch)] = _pool(hidden, encoded["attention_mask"], self.pooling_mode)
+            if show_progress:
+                logger.info(f"ONNX encode: {min(start + batch_size, len(texts))}/{len(texts)}")
+
+        if self.normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.maximum(norms, 1e-12)
+        return embeddings
+
+    def prepare(self, texts: List[str]) -> Tuple[List[str], np.ndarray]:
+        return truncate_to_tokens(self.tokenizer, texts, self.max_seq_length)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "quantized": self.quantize,
+            "num_threads": self.num_threads,
+            "export_dir": str(self.export_dir)
+        }
+
+
+def cache_tag(backend: str, quantize: bool) -> str:
+    """
+    Suffix distinguishing a backend's vectors in the embedding cache.
+
+    Known without loading the model; empty for the reference torch backend.
+    """
+    if backend == "onnx":
+        return "onnx-int8" if quantize else "onnx"
+    return ""
+
+
+def truncate_to_tokens(tokenizer: Any, texts: List[str], max_seq_length: int) -> Tuple[List[str], np.ndarray]:
+    """
+    Cut texts at the model's token limit using its tokenizer.
+
+    One batched tokenizer call (fast tokenizers: offsets in the original
+    text) replaces word-count heuristics; the budget leaves room for the
+    special tokens the model adds.
+
+    Args:
+        tokenizer: Hugging Face tokenizer
+        texts: Texts to truncate
+        max_seq_length: Model's maximum sequence length in tokens
+
+    Returns:
+        Tuple of (truncated texts, token count of each including special tokens)
+    """
+    if not texts:
+        return [], np.zeros(0, dtype=np.int64)
+
+    special = tokenizer.num_special_tokens_to_add(pair=False)
+    budget = max(max_seq_length - special, 1)
+
+    if not getattr(tokenizer, "is_fast", False):
+        # Slow tokenizers have no offsets; count only and let the model truncate
+        encoded = tokenizer(texts, add_special_tokens=False, verbose=False)
+        lengths = [min(len(ids), budget) + special for ids in encoded["input_ids"]]
+        return list(texts), np.asarray(lengths, dtype=np.int64)
+
+    encoded = tokenizer(
+        texts,
+        add_special_tokens=False,
+        return_offsets_mapping=True,
+        return_attention_mask=False,
+        verbose=False
+    )
+    truncated = []
+    lengths = np.empty(len(texts), dtype=np.int64)
+    for i, (text, ids, offsets) in enumerate(zip(texts, encoded["input_ids"], encoded["offset_mapping"])):
+        if len(ids) > budget:
+            text = text[:offsets[budget - 1][1]]
+        truncated.append(text)
+        lengths[i] = min(len(ids), budget) + special
+    return truncated, lengths
+
+
+def _pool(hidden: np.ndarray, attention_mask: np.ndarray, mode: str) -> np.ndarray:
+    """Pool token states (batch, seq, dim) into sentence vectors."""
+    if mode == "cls":
+        return hidden[:, 0]
+    mask = attention_mask[:, :, None].astype(hidden.dtype)
+    if mode == "max":
+        return np.where(mask > 0, hidden, -np.inf).max(axis=1)
+    counts = np.maximum(mask.sum(axis=1), 1e-9)
+    return (hidden * mask).sum(axis=1) / counts
+
+
+def export_onnx(
+    model_name: str,
+    export_dir: Path,
+    cache_dir: Optional[str] = None,
+    revision: Optional[str] = None
+) -> Path:
+    """
+    Export a sentence-transformers model's transformer to ONNX.
+
+    Writes ``model.onnx`` (outputs token states; pooling is done in numpy),
+    the tokenizer and ``pooling.json`` into export_dir.
+
+    Returns:
+        Path of the exported model
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    export_dir = Path(export_dir)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Exporting {model_name} to ONNX: {export_dir}")
+
+    st_model = SentenceTransformer(model_name, cache_folder=cache_dir, device="cpu", revision=revision)
+    transformer = st_model[0]
+    auto_model = transformer.auto_model.eval()
+
+    pooling_mode = "mean"
+    normalize = False
+    for module in list(st_model)[1:]:
+        config = getattr(module, "get_config_dict", lambda: {})()
+        if config.get("pooling_mode_cls_token"):
+            pooling_mode = "cls"
+        elif config.get("pooling_mode_max_tokens"):
+            pooling_mode = "max"
+        if type(module).__name__ == "Normalize":
+            normalize = True
+
+    dummy = transformer.tokenizer(["paper title [SEP] abstract"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in dummy]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    model_path = export_dir / "model.onnx"
+    with torch.no_grad():
+        torch.onnx.export(
+            auto_model,
+            tuple(dummy[name] for name in input_names),
+            str(model_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=_ONNX_OPSET,
+            do_constant_folding=True
+        )
+
+    transformer.tokenizer.save_pretrained(str(export_dir))
+    with open(export_dir / "pooling.json", 'w') as f:
+        json.dump({
+            "mode": pooling_mode,
+            "normalize": normalize,
+            "max_seq_length": st_model.max_seq_length,
+            "embedding_dim": st_model.get_sentence_embedding_dimension()
+        }, f)
+
+    return model_path
+
+
+def quantize_onnx(model_path: Path, output_path: Path) -> Path:
+    """
+    Dynamically quantize an ONNX model's weights to int8.
+
+    Returns:
+        Path of the quantized model
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    logger.info(f"Quantizing {model_path} to int8")
+    quantize_dynamic(str(model_path), str(output_path), weight_type=QuantType.QInt8)
+    return Path(output_path)
+
+
+def create_backend(
+    backend: str,
+    model_name: str,
+    cache_dir: Optional[str] = None,
+    device: Optional[str] = None,
+    revision: Optional[str] = None,
+    onnx_dir: str = ".onnx_models",
+    quantize: bool = True,
+    num_threads: int = 0,
+    service_address: Optional[str] = None,
+    service_authkey: bytes = b""
+) -> EmbeddingBackend:
+    """
+    Create an embedding backend by name.
+
+    Args:
+        backend: One of BACKENDS
+        model_name: Model name or path
+        cache_dir: Directory to cache model files
+        device: Device for the torch backend
+        revision: Model revision
+        onnx_dir: Root directory for exported ONNX models
+        quantize: Use int8 weights (onnx backend)
+        num_threads: Intra-op threads (onnx backend; 0 = runtime default)
+        service_address: Embedding service address (service backend)
+        service_authkey: Embedding service secret (service backend)
+
+    Returns:
+        EmbeddingBackend instance
+    """
+    if backend == "torch":
+        return SentenceTransformerBackend(model_name, cache_dir=cache_dir, device=device, revision=revision)
+    if backend == "onnx":
+        return OnnxEmbeddingBackend(
+            model_name,
+            onnx_dir=onnx_dir,
+            cache_dir=cache_dir,
+            revision=revision,
+            quantize=quantize,
+            num_threads=num_threads
+        )
+    if backend == "service":
+        if not service_address:
+            raise ValueError("Embedding service backend requires an address")
+        from evoverse.knowledge.embedding_service import ServiceEmbeddingBackend
+        return ServiceEmbeddingBackend(
+            service_address,
+            authkey=service_authkey,
+            model_name=model_name,
+            revision=revision
+        )
+    raise ValueError(f"Unknown embedding backend: {backend!r} (expected one of {BACKENDS})")
@@ -0,0 +1,253 @@
+"""
+Persistent embedding cache.
+
+Stores embedding vectors keyed by (model name, model revision, SHA-256 of
+the embedded text) so each distinct paper text is encoded once per model.
+Vectors live in a memory-mapped float32 array; a parallel append-only file
+of 32-byte digests maps keys to rows.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_SIZE = 32  # sha256
+
+
+class EmbeddingCache:
+    """
+    Disk-backed embedding store for one (model name, revision) pair.
+
+    Layout under ``{cache_dir}/{model}@{revision}/``:
+    - ``meta.json``: model name, revision, embedding dimension
+    - ``vectors.f32``: float32 matrix (capacity x dim), grown by doubling
+    - ``keys.bin``: digest of row i at bytes [32 * i, 32 * (i + 1))
+
+    Vectors are written before their keys, so a crash can only lose the
+    tail of a batch, never map a key to a missing vector. Writes are
+    serialized within a process; use one writer process per cache directory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        model_name: str,
+        revision: Optional[str],
+        embedding_dim: int,
+        initial_capacity: int = 1024
+    ):
+        """
+        Initialize (or open) the cache for a model.
+
+        Args:
+            cache_dir: Root cache directory
+            model_name: Embedding model name
+            revision: Model revision (None for unversioned models)
+            embedding_dim: Embedding dimension
+            initial_capacity: Rows to allocate for a new cache
+        """
+        self.model_name = model_name
+        self.revision = revision or "default"
+        self.embedding_dim = embedding_dim
+
+        self.cache_dir = self._model_dir(cache_dir, model_name, revision)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._meta_path = self.cache_dir / "meta.json"
+        self._vectors_path = self.cache_dir / "vectors.f32"
+        self._keys_path = self.cache_dir / "keys.bin"
+
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, int] = {}
+        self._vectors: Optional[np.memmap] = None
+        self._count = 0
+
+        self._open(initial_capacity)
+
+    @staticmethod
+    def _model_dir(cache_dir: str, model_name: str, revision: Optional[str]) -> Path:
+        """Directory holding the cache of one (model, revision) pair."""
+        slug = re.sub(r'[^\w.\-]+', '_', f"{model_name}@{revision or 'default'}")
+        return Path(cache_dir) / slug
+
+    @classmethod
+    def stored_dim(cls, cache_dir: str, model_name: str, revision: Optional[str]) -> Optional[int]:
+        """
+        Embedding dimension recorded by an existing cache, without opening it.
+
+        Lets callers size the cache before (or instead of) loading the model.
+
+        Returns:
+            Stored dimension, or None if no cache exists for the model
+        """
+        meta_path = cls._model_dir(cache_dir, model_name, revision) / "meta.json"
+        try:
+            with open(meta_path, 'r') as f:
+                return int(json.load(f)["embedding_dim"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def text_key(text: str) -> bytes:
+        """Cache key of an embedded text."""
+        return hashlib.sha256(text.encode('utf-8')).digest()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def lookup(self, keys: Sequence[bytes]) -> Tuple[np.ndarray, List[int]]:
+        """
+        Fetch cached vectors.
+
+        Args:
+            keys: Keys from ``text_key``
+
+        Returns:
+            Tuple of (float32 array (len(keys), dim) with hits filled in and
+            zeros elsewhere, positions of keys that missed)
+        """
+        result = np.zeros((len(keys), self.embedding_dim), dtype=np.float32)
+        positions = []
+        rows = []
+        missing = []
+        with self._lock:
+            for position, key in enumerate(keys):
+                row = self._index.get(key)
+                if row is None:
+                    missing.append(position)
+                else:
+                    positions.append(position)
+                    rows.append(row)
+            if rows:
+                # One fancy-indexing read from the memmap
+                result[positions] = self._vectors[rows]
+        return result, missing
+
+    def put(self, keys: Sequence[bytes], vectors: np.ndarray):
+        """
+        Store vectors (keys already cached are skipped).
+
+        Args:
+            keys: Keys from ``text_key``
+            vectors: Array of shape (len(keys), dim)
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != self.embedding_dim:
+            raise ValueError(
+                f"Expected vectors of shape (n, {self.embedding_dim}), got {vectors.shape}"
+            )
+
+        with self._lock:
+            new_keys = []
+            new_rows = []
+            seen = set()
+            for position, key in enumerate(keys):
+                if key in self._index or key in seen:
+                    continue
+                seen.add(key)
+                new_keys.append(key)
+                new_rows.append(position)
+            if not new_keys:
+                return
+
+            start = self._count
+            self._ensure_capacity(start + len(new_keys))
+            self._vectors[start:start + len(new_keys)] = vectors[new_rows]
+            self._vectors.flush()
+
+            with open(self._keys_path, 'ab') as f:
+                f.write(b"".join(new_keys))
+
+            for offset, key in enumerate(new_keys):
+                self._index[key] = start + offset
+            self._count += len(new_keys)
+
+    def clear(self):
+        """Remove all cached vectors."""
+        with self._lock:
+            self._vectors = None
+            self._vectors_path.unlink(missing_ok=True)
+            self._keys_path.unlink(missing_ok=True)
+            self._meta_path.unlink(missing_ok=True)
+            self._index.clear()
+            self._count = 0
+            self._open(1024)
+        logger.info(f"Cleared embedding cache: {self.cache_dir}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        size = sum(p.stat().st_size for p in (self._vectors_path, self._keys_path) if p.exists())
+        return {
+            "cache_dir": str(self.cache_dir),
+            "model_name": self.model_name,
+            "revision": self.revision,
+            "entries": self._count,
+            "size_mb": round(size / (1024 * 1024), 2)
+        }
+
+    def _open(self, initial_capacity: int):
+        """Open or create the cache files and load the key index."""
+        meta = {"model_name": self.model_name, "revision": self.revision, "embedding_dim": self.embedding_dim}
+        if self._meta_path.exists():
+            with open(self._meta_path, 'r') as f:
+                stored = json.load(f)
+            if stored.get("embedding_dim") != self.embedding_dim:
+                logger.warning(
+                    f"Embedding cache {self.cache_dir} has dim {stored.get('embedding_dim')}, "
+                    f"expected {self.embedding_dim}; discarding it"
+                )
+                self._vectors_path.unlink(missing_ok=True)
+                self._keys_path.unlink(missing_ok=True)
+        with open(self._meta_path, 'w') as f:
+            json.dump(meta, f)
+
+        row_bytes = self.embedding_dim * 4
+        vector_rows = self._vectors_path.stat().st_size // row_bytes if self._vectors_path.exists() else 0
+
+        keys = self._keys_path.read_bytes() if self._keys_path.exists() else b""
+        # Drop a torn trailing key (and any key beyond the vector file)
+        count = min(len(keys) // _DIGEST_SIZE, vector_rows)
+        if count * _DIGEST_SIZE != len(keys):
+            with open(self._keys_path, 'r+b') as f:
+                f.truncate(count * _DIGEST_SIZE)
+        self._index = {
+            keys[i * _DIGEST_SIZE:(i + 1) * _DIGEST_SIZE]: i
+            for i in range(count)
+        }
+        self._count = count
+
+        self._map(max(vector_rows, initial_capacity, 1))
+        logger.debug(f"Opened embedding cache {self.cache_dir} ({count} entries)")
+
+    def _map(self, capacity: int):
+        """(Re)map the vector file with the given row capacity."""
+        size = capacity * self.embedding_dim * 4
+        if not self._vectors_path.exists() or self._vectors_path.stat().st_size < size:
+            with open(self._vectors_path, 'ab') as f:
+                f.truncate(size)
+        self._vectors = np.memmap(
+            self._vectors_path, dtype=np.float32, mode='r+', shape=(capacity, self.embedding_dim)
+        )
+
+    def _ensure_capacity(self, rows: int):
+        """Grow the vector file (doubling) to hold at least rows."""
+        capacity = self._vectors.shape[0]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        self._vectors.flush()
+        self._vectors = None
+        self._map(capacity)
@@ -0,0 +1,227 @@
+"""
+In-memory embedding matrix for brute-force cosine search.
+
+Rows are L2-normalized once when added, so cosine similarity is a plain dot
+product. Storage can be float32, float16 (half the memory) or int8 with a
+per-row scale (a quarter). Search scores all queries with one matrix
+multiply per block of rows and selects top-k with ``argpartition``
+instead of a full sort.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple, Union
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DTYPES = ("float32", "float16", "int8")
+
+# Rows scored per block; bounds the float32 copy made of compact storage
+_BLOCK_ROWS = 16384
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows as float32 (zero rows stay zero)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def top_k_rows(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row-wise top-k of a score matrix, best first.
+
+    Args:
+        scores: Array of shape (n_queries, n)
+        k: Number of results per row
+
+    Returns:
+        Tuple of (indices, scores), each of shape (n_queries, min(k, n))
+    """
+    n = scores.shape[1]
+    k = min(k, n)
+    if k <= 0:
+        empty = np.zeros((scores.shape[0], 0))
+        return empty.astype(np.int64), empty.astype(np.float32)
+    if k < n:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(n), scores.shape)
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(candidate_scores, order, axis=1)
+
+
+class EmbeddingMatrix:
+    """
+    Pre-normalized embeddings with top-k cosine search.
+
+    Example:
+        ```python
+        matrix = EmbeddingMatrix(embedder.embed_papers(papers), ids=paper_ids, dtype="int8")
+        indices, scores = matrix.search(embedder.embed_query("CRISPR"), top_k=10)
+        ```
+    """
+
+    def __init__(
+        self,
+        embeddings: Optional[np.ndarray] = None,
+        ids: Optional[Sequence[Any]] = None,
+        dtype: str = "float32",
+        dim: Optional[int] = None
+    ):
+        """
+        Initialize the matrix.
+
+        Args:
+            embeddings: Initial vectors, shape (n, dim)
+            ids: Optional identifier per row (e.g. paper IDs)
+            dtype: Storage type: "float32", "float16" or "int8"
+            dim: Embedding dimension (needed only when starting empty)
+        """
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported dtype: {dtype!r} (expected one of {DTYPES})")
+        self.dtype = dtype
+
+        if embeddings is not None and len(embeddings):
+            dim = np.asarray(embeddings).shape[1]
+        self.dim = dim or 0
+
+        # Buffers grow by doubling; rows [0, _size) are in use
+        self._buffer = np.zeros((0, self.dim), dtype=np.int8 if dtype == "int8" else dtype)
+        self._scale_buffer = np.zeros(0, dtype=np.float32)
+        self._size = 0
+        self.ids: Optional[List[Any]] = [] if ids is not None else None
+
+        if embeddings is not None and len(embeddings):
+            self.add(embeddings, ids)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def _data(self) -> np.ndarray:
+        return self._buffer[:self._size]
+
+    @property
+    def _scales(self) -> np.ndarray:
+        return self._scale_buffer[:self._size]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the stored vectors (including spare capacity)."""
+        return self._buffer.nbytes + self._scale_buffer.nbytes
+
+    def add(self, embeddings: np.ndarray, ids: Optional[Sequence[Any]] = None):
+        """
+        Append vectors.
+
+        Args:
+            embeddings: Vectors, shape (n, dim)
+            ids: Identifier per row (required if the matrix has ids)
+        """
+        embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if not self.dim:
+            self.dim = embeddings.shape[1]
+            self._buffer = self._buffer.reshape(0, self.dim)
+        if embeddings.shape[1] != self.dim:
+            raise ValueError(f"Expected vectors of dim {self.dim}, got {embeddings.shape[1]}")
+        if self.ids is not None:
+            if ids is None or len(ids) != len(embeddings):
+                raise ValueError("ids must be given for every added row")
+            self.ids.extend(ids)
+
+        data, scales = self._encode(normalize_rows(embeddings))
+        end = self._size + len(data)
+        if end > len(self._buffer):
+            capacity = max(end, 2 * len(self._buffer))
+            buffer = np.zeros((capacity, self.dim), dtype=self._buffer.dtype)
+            buffer[:self._size] = self._data
+            scale_buffer = np.zeros(capacity, dtype=np.float32)
+            scale_buffer[:self._size] = self._scales
+            self._buffer, self._scale_buffer = buffer, scale_buffer
+        self._buffer[self._size:end] = data
+        self._scale_buffer[self._size:end] = scales
+        self._size = end
+
+    def vectors(self, rows: Optional[Union[slice, Sequence[int], np.ndarray]] = None) -> np.ndarray:
+        """
+        Normalized vectors as float32.
+
+        Args:
+            rows: Rows to return (default: all)
+
+        Returns:
+            Array of shape (n_rows, dim)
+        """
+        rows = slice(None) if rows is None else rows
+        data = self._data[rows].astype(np.float32)
+        if self.dtype == "int8":
+            data *= self._scales[rows, None]
+        return data
+
+    def scores(self, queries: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of queries to every row.
+
+        Args:
+            queries: Query vector (dim,) or matrix (n_queries, dim)
+
+        Returns:
+            Array of shape (n_queries, len(self)) (a 1-D query gives one row)
+        """
+        queries = normalize_rows(np.atleast_2d(queries))
+        result = np.empty((queries.shape[0], len(self)), dtype=np.float32)
+        if self.dtype == "float32":
+            np.matmul(queries, self._data.T, out=result)
+            return result
+
+        for start in range(0, len(self), _BLOCK_ROWS):
+            block = self._data[start:start + _BLOCK_ROWS].astype(np.float32)
+            block_scores = queries @ block.T
+            if self.dtype == "int8":
+                block_scores *= self._scales[start:start + _BLOCK_ROWS]
+            result[:, start:start + _BLOCK_ROWS] = block_scores
+        return result
+
+    def search(self, queries: np.ndarray, top_k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k most similar rows for each query.
+
+        Args:
+            queries: Query vector (dim,) or matrix (n_queries, dim); several
+                queries are scored with one matrix multiply
+            top_k: Results per query
+
+        Returns:
+            Tuple of (row indices, cosine scores). 1-D arrays for a 1-D
+            query, else shape (n_queries, k); best first.
+        """
+        single = np.ndim(queries) == 1
+        if len(self) == 0:
+            shape = (0,) if single else (np.atleast_2d(queries).shape[0], 0)
+            return np.zeros(shape, dtype=np.int64), np.zeros(shape, dtype=np.float32)
+
+        indices, scores = top_k_rows(self.scores(queries), top_k)
+        if single:
+            return indices[0], scores[0]
+        return indices, scores
+
+    def similarity(self, i: int, j: int) -> float:
+        """Cosine similarity between two stored rows."""
+        pair = self.vectors([i, j])
+        return float(pair[0] @ pair[1])
+
+    def _encode(self, normalized: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert normalized float32 rows to storage form (data, per-row scales)."""
+        if self.dtype == "float32":
+            return normalized, np.ones(len(normalized), dtype=np.float32)
+        if self.dtype == "float16":
+            return normalized.astype(np.float16), np.ones(len(normalized), dtype=np.float32)
+
+        # Symmetric per-row int8: v ~= q * scale
+        scales = np.abs(normalized).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.round(normalized / scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
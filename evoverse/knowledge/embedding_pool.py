@@ -0,0 +1,143 @@
+"""
+Multi-process embedding pool for bulk indexing.
+
+Texts are sharded across worker processes, each holding its own model
+copy. Each worker is pinned to a disjoint set of cores, and its thread
+count matches that set. Chunks are submitted with a bounded number in
+flight and results come back in submission order. Callers can therefore
+write chunk i to the vector database while later chunks are still being
+encoded.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List
+import logging
+import multiprocessing
+import os
+import queue
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Worker-process state, set by _init_embedding_worker
+_worker_embedder = None
+
+
+def _available_cores() -> List[int]:
+    """Cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _init_embedding_worker(embedder_kwargs: Dict[str, Any], core_sets: Any):
+    """Pin the worker to its cores, cap its threads and load the model."""
+    global _worker_embedder
+
+    try:
+        cores = core_sets.get(timeout=10)
+    except queue.Empty:
+        cores = _available_cores()
+    threads = max(len(cores), 1)
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, cores)
+        except OSError as e:
+            logger.warning(f"Could not pin embedding worker to cores {cores}: {e}")
+
+    # Before torch / onnxruntime are imported, so their pools start at this size
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+
+    from evoverse.knowledge.embeddings import PaperEmbedder
+
+    _worker_embedder = PaperEmbedder(**embedder_kwargs, embedding_cache_dir="", num_threads=threads)
+    if _worker_embedder.backend_name == "torch":
+        try:
+            import torch
+            torch.set_num_threads(threads)
+        except ImportError:
+            pass
+    _ = _worker_embedder.backend
+
+
+def _embed_in_worker(texts: List[str], batch_size: int) -> np.ndarray:
+    return _worker_embedder._encode(texts, batch_size, False)
+
+
+class EmbeddingPool:
+    """
+    Pool of embedding worker processes.
+
+    Use as a context manager, or call close() when done; workers hold a
+    full model copy each.
+    """
+
+    def __init__(
+        self,
+        embedder_kwargs: Dict[str, Any],
+        num_workers: int = 0,
+        threads_per_worker: int = 4
+    ):
+        """
+        Start the workers.
+
+        Args:
+            embedder_kwargs: PaperEmbedder arguments for the workers (model
+                name, revision, backend, quantize, device)
+            num_workers: Worker processes (0 = available cores / threads_per_worker)
+            threads_per_worker: Cores (and intra-op threads) per worker
+        """
+        cores = _available_cores()
+        threads_per_worker = max(1, min(threads_per_worker, len(cores)))
+        if num_workers <= 0:
+            num_workers = max(1, len(cores) // threads_per_worker)
+        self.num_workers = num_workers
+
+        # Contiguous, disjoint core sets; wrap around if oversubscribed
+        core_sets = [
+            [cores[(w * threads_per_worker + t) % len(cores)] for t in range(threads_per_worker)]
+            for w in range(num_workers)
+        ]
+
+        # spawn: forking a parent that has initialized torch can deadlock
+        context = multiprocessing.get_context("spawn")
+        core_queue = context.Queue()
+        for core_set in core_sets:
+            core_queue.put(core_set)
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=context,
+            initializer=_init_embedding_worker,
+            initargs=(embedder_kwargs, core_queue)
+        )
+        logger.info(
+            f"Started embedding pool: {num_workers} workers x {threads_per_worker} threads"
+        )
+
+    @property
+    def max_inflight(self) -> int:
+        """Chunks to keep submitted so no worker idles between chunks."""
+        return 2 * self.num_workers
+
+    def submit(self, texts: List[str], batch_size: int = 32) -> Future:
+        """
+        Encode texts in a worker.
+
+        Returns:
+            Future resolving to an array of shape (len(texts), embedding_dim)
+        """
+        return self._executor.submit(_embed_in_worker, texts, batch_size)
+
+    def close(self):
+        """Shut the workers down."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "EmbeddingPool":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,419 @@
+"""
+Shared embedding service.
+
+One process loads the model and serves every other process over a local
+socket (``multiprocessing.connection``, a Unix socket on Linux):
+
+- Requests from all connections are gathered into micro-batches: a batch
+  is encoded as soon as it reaches ``max_batch_size`` texts or the oldest
+  request has waited ``max_wait_ms``.
+- Vectors are written straight into a shared-memory buffer owned by the
+  requesting connection; only a short (rows, dim) reply goes over the
+  socket.
+- The server's PaperEmbedder keeps its embedding cache, so repeated texts
+  are served from disk.
+
+Run the server:
+    python -m evoverse.knowledge.embedding_service --address /tmp/evoverse-embed.sock
+
+and point clients at it with ``KNOWLEDGE_EMBEDDING_BACKEND=service`` and
+``KNOWLEDGE_EMBEDDING_SERVICE_ADDRESS=/tmp/evoverse-embed.sock``.
+"""
+
+from multiprocessing.connection import Client, Connection, Listener
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+import weakref
+
+import numpy as np
+
+from evoverse.knowledge.embedding_backends import EmbeddingBackend
+
+logger = logging.getLogger(__name__)
+
+# Texts per client request; bounds each connection's shared buffer
+_MAX_REQUEST_ROWS = 1024
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a client's segment without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: attaching registers the segment with this process's
+        # resource tracker, which would unlink it when the server exits
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _remove_stale_socket(address: Any):
+    """Remove a Unix socket file left behind by a server that died."""
+    if not isinstance(address, str) or not os.path.exists(address):
+        return
+    try:
+        with socket.socket(socket.AF_UNIX) as probe:
+            probe.connect(address)
+    except ConnectionRefusedError:
+        os.unlink(address)
+        logger.info(f"Removed stale embedding service socket: {address}")
+        return
+    raise RuntimeError(f"An embedding service is already listening on {address}")
+
+
+class _PendingRequest:
+    """Texts from one client request waiting for a micro-batch."""
+
+    __slots__ = ("texts", "result", "error", "done", "enqueued")
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[str] = None
+        self.done = threading.Event()
+        self.enqueued = time.monotonic()
+
+
+class EmbeddingServer:
+    """
+    Serve a PaperEmbedder to other processes with micro-batching.
+
+    Each connection is handled by its own thread; a single batcher thread
+    owns the model.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        authkey: bytes,
+        embedder: Any,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        Initialize the server (call serve_forever to start).
+
+        Args:
+            address: Socket path (or host/port tuple) to listen on
+            authkey: Shared secret clients must present
+            embedder: PaperEmbedder doing the encoding
+            max_batch_size: Texts per micro-batch
+            max_wait_ms: Longest time a request waits for its batch to fill
+        """
+        self.address = address
+        self.authkey = authkey
+        self.embedder = embedder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: "queue.Queue[_PendingRequest]" = queue.Queue()
+        self._listener: Optional[Listener] = None
+        self._closed = threading.Event()
+        self._stats = {"requests": 0, "texts": 0, "batches": 0}
+        self._stats_lock = threading.Lock()
+
+    def serve_forever(self):
+        """Accept connections until close() is called."""
+        # Load the model before accepting clients
+        dim = self.embedder.embedding_dim
+        _ = self.embedder.backend
+
+        _remove_stale_socket(self.address)
+        self._listener = Listener(self.address, authkey=self.authkey)
+        logger.info(
+            f"Embedding service listening on {self.address} "
+            f"(dim={dim}, max_batch={self.max_batch_size}, max_wait={self.max_wait * 1000:.1f}ms)"
+        )
+        threading.Thread(target=self._batch_loop, name="embedding-batcher", daemon=True).start()
+
+        while not self._closed.is_set():
+            try:
+                conn = self._listener.accept()
+            except OSError:
+                if self._closed.is_set():
+                    break
+                raise
+            except Exception as e:
+                # Failed handshake (e.g. wrong authkey)
+                logger.warning(f"Rejected embedding client: {e}")
+                continue
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def close(self):
+        """Stop accepting connections."""
+        self._closed.set()
+        if self._listener is not None:
+            self._listener.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get service statistics.
+
+        Returns:
+            Dictionary with request, text and batch counts
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["mean_batch_size"] = round(stats["texts"] / stats["batches"], 2) if stats["batches"] else 0.0
+        return stats
+
+    def _info(self) -> Dict[str, Any]:
+        return {
+            "model_name": self.embedder.model_name,
+            "revision": self.embedder.cache_revision,
+            "backend": self.embedder.backend_name,
+            "embedding_dim": self.embedder.embedding_dim,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            **self.get_stats()
+        }
+
+    def _handle(self, conn: Connection):
+        """Serve one client connection."""
+        shm: Optional[shared_memory.SharedMemory] = None
+        try:
+            while True:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    break
+
+                op = message[0]
+                if op == "info":
+                    conn.send(("ok", self._info()))
+                    continue
+                if op != "encode":
+                    conn.send(("error", f"Unknown operation: {op!r}"))
+                    continue
+
+                _, texts, shm_name = message
+                if shm is None or shm.name != shm_name:
+                    if shm is not None:
+                        shm.close()
+                    shm = _attach_shared_memory(shm_name)
+
+                dim = self.embedder.embedding_dim
+                if len(texts) * dim * 4 > shm.size:
+                    conn.send(("error", f"Shared buffer too small for {len(texts)} vectors"))
+                    continue
+
+                request = _PendingRequest(texts)
+                self._queue.put(request)
+                request.done.wait()
+                if request.error is not None:
+                    conn.send(("error", request.error))
+                    continue
+
+                out = np.ndarray((len(texts), dim), dtype=np.float32, buffer=shm.buf)
+                out[:] = request.result
+                del out  # release the buffer export before shm.close()
+                conn.send(("ok", len(texts)))
+        finally:
+            if shm is not None:
+                shm.close()
+            conn.close()
+
+    def _batch_loop(self):
+        """Gather queued requests into micro-batches and encode them."""
+        while not self._closed.is_set():
+            batch = [self._queue.get()]
+            size = len(batch[0].texts)
+            deadline = batch[0].enqueued + self.max_wait
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request.texts)
+
+            texts = [text for request in batch for text in request.texts]
+            try:
+                embeddings = self.embedder._embed_texts(texts, self.max_batch_size, False)
+            except Exception as e:
+                logger.error(f"Embedding service batch failed: {e}")
+                for request in batch:
+                    request.error = str(e)
+                    request.done.set()
+                continue
+
+            offset = 0
+            for request in batch:
+                request.result = embeddings[offset:offset + len(request.texts)]
+                offset += len(request.texts)
+                request.done.set()
+
+            with self._stats_lock:
+                self._stats["requests"] += len(batch)
+                self._stats["texts"] += len(texts)
+                self._stats["batches"] += 1
+
+
+class _Channel:
+    """One connection to the service plus its shared result buffer."""
+
+    def __init__(self, address: str, authkey: bytes):
+        self.conn = Client(address, authkey=authkey)
+        self.shm: Optional[shared_memory.SharedMemory] = None
+        self._owned: List[shared_memory.SharedMemory] = []
+        # Thread-local channels vanish with their thread; release then
+        weakref.finalize(self, _Channel._release, self.conn, self._owned)
+
+    def buffer(self, nbytes: int) -> shared_memory.SharedMemory:
+        """Shared buffer of at least nbytes (replaced when too small)."""
+        if self.shm is None or self.shm.size < nbytes:
+            _Channel._release(None, self._owned)
+            self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            self._owned.append(self.shm)
+        return self.shm
+
+    def request(self, message: tuple) -> Any:
+        self.conn.send(message)
+        status, payload = self.conn.recv()
+        if status != "ok":
+            raise RuntimeError(f"Embedding service error: {payload}")
+        return payload
+
+    @staticmethod
+    def _release(conn: Optional[Connection], owned: List[shared_memory.SharedMemory]):
+        if conn is not None:
+            conn.close()
+        while owned:
+            shm = owned.pop()
+            shm.close()
+            shm.unlink()
+
+
+class ServiceEmbeddingBackend(EmbeddingBackend):
+    """
+    Thin client for a running EmbeddingServer.
+
+    Each thread gets its own connection and buffer, so concurrent callers in
+    one process are batched together on the server instead of queuing here.
+    """
+
+    name = "service"
+
+    def __init__(
+        self,
+        address: str,
+        authkey: bytes,
+        model_name: Optional[str] = None,
+        revision: Optional[str] = None
+    ):
+        """
+        Connect to the service.
+
+        Args:
+            address: Service socket path (or host/port tuple)
+            authkey: Shared secret configured on the server
+            model_name: Model the caller expects the server to run (None: any)
+            revision: Expected model revision; a server backend suffix
+                ("+onnx-int8") is accepted. Only checked with model_name.
+
+        Raises:
+            ValueError: If the server runs a different model or revision
+        """
+        self.address = address
+        self.authkey = authkey
+        self._local = threading.local()
+        self.server_info = self._channel().request(("info",))
+        self._embedding_dim = self.server_info["embedding_dim"]
+
+        if model_name is not None:
+            served_model = self.server_info["model_name"]
+            served_revision = (self.server_info["revision"] or "default").split("+", 1)[0]
+            if served_model != model_name or served_revision != (revision or "default"):
+                raise ValueError(
+                    f"Embedding service at {address} serves {served_model}@{self.server_info['revision'] or 'default'}, "
+                    f"expected {model_name}@{revision or 'default'}"
+                )
+
+    @property
+    def embedding_dim(self) -> int:
+        return self._embedding_dim
+
+    def encode(self, texts: List[str], batch_size: int = 32, show_progress: bool = False) -> np.ndarray:
+        embeddings = np.empty((len(texts), self._embedding_dim), dtype=np.float32)
+        channel = self._channel()
+        for start in range(0, len(texts), _MAX_REQUEST_ROWS):
+            chunk = texts[start:start + _MAX_REQUEST_ROWS]
+            shm = channel.buffer(_MAX_REQUEST_ROWS * self._embedding_dim * 4)
+            rows = channel.request(("encode", chunk, shm.name))
+            result = np.ndarray((rows, self._embedding_dim), dtype=np.float32, buffer=shm.buf)
+            embeddings[start:start + rows] = result
+            del result
+        return embeddings
+
+    def prepare(self, texts: List[str]) -> Tuple[List[str], np.ndarray]:
+        # The server truncates and buckets; keep the client's order
+        return list(texts), np.zeros(len(texts), dtype=np.int64)
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "address": self.address, "server": self.server_info}
+
+    def _channel(self) -> _Channel:
+        channel = getattr(self._local, "channel", None)
+        if channel is None:
+            channel = _Channel(self.address, self.authkey)
+            self._local.channel = channel
+        return channel
+
+
+def main():
+    """Run the embedding service."""
+    from evoverse.config import get_config
+    from evoverse.knowledge.embeddings import PaperEmbedder
+
+    config = get_config().knowledge
+    parser = argparse.ArgumentParser(description="EvoVerse embedding service")
+    parser.add_argument("--address", default=config.embedding_service_address or "/tmp/evoverse-embed.sock")
+    parser.add_argument("--model", default="allenai/specter")
+    parser.add_argument("--revision", default=None)
+    parser.add_argument("--device", default=None)
+    parser.add_argument(
+        "--backend",
+        choices=("torch", "onnx"),
+        default=config.embedding_backend if config.embedding_backend != "service" else "torch"
+    )
+    parser.add_argument("--max-batch-size", type=int, default=config.embedding_service_max_batch)
+    parser.add_argument("--max-wait-ms", type=float, default=config.embedding_service_max_wait_ms)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    embedder = PaperEmbedder(
+        model_name=args.model,
+        device=args.device,
+        revision=args.revision,
+        backend=args.backend
+    )
+    server = EmbeddingServer(
+        args.address,
+        authkey=config.embedding_service_authkey.encode(),
+        embedder=embedder,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        logger.info(f"Embedding service stopped: {server.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
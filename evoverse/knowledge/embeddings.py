@@ -3,25 +3,40 @@ SPECTER-based embeddings for scientific papers.
 
 Uses the allenai/specter model optimized for scientific document similarity.
 SPECTER is trained on citation graphs and produces 768-dimensional embeddings.
+Paper embeddings are cached on disk per model revision (see EmbeddingCache).
 """
 
-from typing import List, Optional, Union
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import threading
 import numpy as np
 from pathlib import Path
 import logging
 
 from evoverse.literature.base_client import PaperMetadata
+from evoverse.knowledge.embedding_cache import EmbeddingCache
+from evoverse.knowledge.embedding_matrix import EmbeddingMatrix
+from evoverse.knowledge.embedding_backends import (
+    EmbeddingBackend,
+    HAS_ONNXRUNTIME,
+    HAS_SENTENCE_TRANSFORMERS,
+    cache_tag,
+    create_backend
+)
+from evoverse.config import get_config
+
+if TYPE_CHECKING:
+    from evoverse.knowledge.embedding_pool import EmbeddingPool
 
 logger = logging.getLogger(__name__)
 
-# Optional dependency - sentence_transformers
-try:
-    from sentence_transformers import SentenceTransformer
-    HAS_SENTENCE_TRANSFORMERS = True
-except ImportError:
+# Optional dependency - sentence_transformers. Only its presence is checked
+# (in embedding_backends); torch is imported when the model is first needed.
+if not HAS_SENTENCE_TRANSFORMERS:
     logger.warning("sentence_transformers not installed. Install with: pip install sentence-transformers")
-    HAS_SENTENCE_TRANSFORMERS = False
-    SentenceTransformer = None
+
+_DEFAULT_EMBEDDING_DIM = 768  # SPECTER dimension
 
 
 class PaperEmbedder:
@@ -40,7 +55,12 @@ class PaperEmbedder:
         self,
         model_name: str = "allenai/specter",
         cache_dir: Optional[str] = None,
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        revision: Optional[str] = None,
+        embedding_cache_dir: Optional[str] = None,
+        backend: Optional[str] = None,
+        quantize: Optional[bool] = None,
+        num_threads: Optional[int] = None
     ):
         """
         Initialize the paper embedder.
@@ -49,44 +69,171 @@ class PaperEmbedder:
             model_name: Model name or path (default: "allenai/specter")
             cache_dir: Directory to cache model files (default: ~/.cache/huggingface)
             device: Device to use ("cuda", "cpu", or None for auto)
+            revision: Model revision (branch, tag or commit) to load; also
+                part of the embedding cache key
+            embedding_cache_dir: Directory for cached paper embeddings
+                (default: from config; "" disables the cache)
+            backend: Inference backend, "torch", "onnx" or "service" (thin
+                client of a running embedding service) (default: from config)
+            quantize: Use int8-quantized weights with the onnx backend
+                (default: from config)
+            num_threads: Intra-op threads for the onnx backend, 0 for the
+                runtime default (default: from config)
 
         Note:
-            First run will download ~440MB model. Subsequent runs use cached version.
+            The model is loaded on first use, not here. First load will
+            download ~440MB model; subsequent runs use the cached version.
         """
-        if not HAS_SENTENCE_TRANSFORMERS:
-            logger.warning("SentenceTransformers not available. PaperEmbedder will not function.")
-            self.model = None
-            self.model_name = model_name
-            self.embedding_dim = 768  # Default SPECTER dimension
-            return
-
+        config = get_config().knowledge
         self.model_name = model_name
+        self.revision = revision
+        self.cache_dir = cache_dir
+        self.device = device
+        if embedding_cache_dir is None:
+            embedding_cache_dir = config.embedding_cache_dir
+        self.embedding_cache_dir = embedding_cache_dir
+        self.backend_name = backend or config.embedding_backend
+        self.quantize = config.onnx_quantize if quantize is None else quantize
+        self.num_threads = config.onnx_num_threads if num_threads is None else num_threads
+        self.onnx_dir = config.onnx_model_dir
+        self.service_address = config.embedding_service_address
+        self.service_authkey = config.embedding_service_authkey.encode()
+        if self.backend_name == "service":
+            # Thin client: the service owns the model and the embedding cache
+            self.embedding_cache_dir = ""
+
+        self._backend: Optional[EmbeddingBackend] = None
+        self._embedding_dim: Optional[int] = None
+        self._embedding_cache: Optional[EmbeddingCache] = None
+        self._load_lock = threading.Lock()
+
+        if self.backend_name == "onnx":
+            self._available = HAS_ONNXRUNTIME
+        elif self.backend_name == "service":
+            self._available = bool(self.service_address)
+        else:
+            self._available = HAS_SENTENCE_TRANSFORMERS
+        if not self._available:
+            logger.warning(
+                f"Embedding backend '{self.backend_name}' not available. PaperEmbedder will not function."
+            )
+            self._embedding_dim = _DEFAULT_EMBEDDING_DIM
+
+    @property
+    def backend(self) -> Optional[EmbeddingBackend]:
+        """The inference backend, loaded on first access (None if unavailable)."""
+        if self._backend is None and self._available:
+            with self._load_lock:
+                if self._backend is None:
+                    self._backend = self._load_backend()
+        return self._backend
+
+    @property
+    def version_tag(self) -> str:
+        """Model-version tag recorded on vector collections built with this embedder."""
+        return embedder_version_tag(self.model_name, self.revision)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model has been loaded."""
+        return self._backend is not None
+
+    @property
+    def cache_revision(self) -> Optional[str]:
+        """
+        Revision under which embeddings are cached.
+
+        Vectors from the ONNX (and int8) backends are not bit-identical to
+        the PyTorch ones, so they are cached separately.
+        """
+        tag = cache_tag(self.backend_name, self.quantize)
+        if not tag:
+            return self.revision
+        return f"{self.revision or 'default'}+{tag}"
 
+    @property
+    def embedding_dim(self) -> int:
+        """
+        Embedding dimension.
+
+        Taken from the loaded model, else from an existing embedding cache
+        for this model, else by loading the model. The embedding cache is
+        sized with it, so it never comes from the registry.
+        """
+        if self._embedding_dim is None and self.embedding_cache_dir:
+            self._embedding_dim = EmbeddingCache.stored_dim(
+                self.embedding_cache_dir, self.model_name, self.cache_revision
+            )
+        if self._embedding_dim is None:
+            _ = self.backend  # loading the model sets the dimension
+        return self._embedding_dim
+
+    @property
+    def known_embedding_dim(self) -> Optional[int]:
+        """
+        Embedding dimension if it is known without loading the model.
+
+        Like ``embedding_dim``, but falls back to the registered spec of
+        the model instead of loading it; stats-only callers use this.
+        """
+        if self._embedding_dim is None and self.embedding_cache_dir:
+            self._embedding_dim = EmbeddingCache.stored_dim(
+                self.embedding_cache_dir, self.model_name, self.cache_revision
+            )
+        if self._embedding_dim is not None:
+            return self._embedding_dim
+        return next(
+            (spec.embedding_dim for spec in _EMBEDDER_REGISTRY.values() if spec.model_name == self.model_name),
+            None
+        )
+
+    @property
+    def embedding_cache(self) -> Optional[EmbeddingCache]:
+        """Persistent embedding cache (None if disabled), opened on first use."""
+        if self._embedding_cache is None and self.embedding_cache_dir:
+            self._embedding_cache = EmbeddingCache(
+                self.embedding_cache_dir,
+                model_name=self.model_name,
+                revision=self.cache_revision,
+                embedding_dim=self.embedding_dim
+            )
+        return self._embedding_cache
+
+    def _load_backend(self) -> EmbeddingBackend:
+        """Load the model into the configured backend."""
         # Set cache directory if provided
-        if cache_dir:
-            cache_path = Path(cache_dir)
-            cache_path.mkdir(parents=True, exist_ok=True)
+        if self.cache_dir:
+            Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Loading SPECTER model: {model_name}")
+        logger.info(f"Loading SPECTER model: {self.model_name} (backend={self.backend_name})")
         logger.info("First run may take a few minutes to download model (~440MB)")
 
         try:
-            self.model = SentenceTransformer(
-                model_name,
-                cache_folder=cache_dir,
-                device=device
-            ) # pyright: ignore[reportOptionalCall]
-            self.embedding_dim = self.model.get_sentence_embedding_dimension()
-
-            logger.info(
-                f"Loaded SPECTER model (embedding_dim={self.embedding_dim}, "
-                f"device={self.model.device})"
+            backend = create_backend(
+                self.backend_name,
+                self.model_name,
+                cache_dir=self.cache_dir,
+                device=self.device,
+                revision=self.revision,
+                onnx_dir=self.onnx_dir,
+                quantize=self.quantize,
+                num_threads=self.num_threads,
+                service_address=self.service_address,
+                service_authkey=self.service_authkey
             )
-
         except Exception as e:
             logger.error(f"Error loading SPECTER model: {e}")
             raise
 
+        embedding_dim = backend.embedding_dim
+        if self._embedding_dim is not None and self._embedding_dim != embedding_dim:
+            # A stale cache reported a different size; let it be rebuilt
+            self._embedding_cache = None
+        self._embedding_dim = embedding_dim
+
+        logger.info(f"Loaded SPECTER model (embedding_dim={embedding_dim}, {backend.describe()})")
+        return backend
+
     def embed_paper(self, paper: PaperMetadata) -> np.ndarray:
         """
         Generate embedding for a single paper.
@@ -109,12 +256,7 @@ class PaperEmbedder:
         text = self._paper_to_text(paper)
 
         try:
-            embedding = self.model.encode(
-                text,
-                convert_to_numpy=True,
-                show_progress_bar=False
-            )
-            return embedding
+            return self._embed_texts([text], batch_size=1, show_progress=False)[0]
 
         except Exception as e:
             logger.error(f"Error embedding paper {paper.id}: {e}")
@@ -153,12 +295,7 @@ class PaperEmbedder:
         texts = [self._paper_to_text(paper) for paper in papers]
 
         try:
-            embeddings = self.model.encode(
-                texts,
-                batch_size=batch_size,
-                convert_to_numpy=True,
-                show_progress_bar=show_progress
-            )
+            embeddings = self._embed_texts(texts, batch_size, show_progress)
 
             logger.info(f"Generated embeddings for {len(papers)} papers")
             return embeddings
@@ -168,6 +305,92 @@ class PaperEmbedder:
             # Return zero vectors on error
             return np.zeros((len(papers), self.embedding_dim), dtype=np.float32)
 
+    def iter_embed_papers(
+        self,
+        papers: List[PaperMetadata],
+        chunk_size: int = 256,
+        batch_size: int = 32,
+        workers: Optional[int] = None,
+        pool: Optional["EmbeddingPool"] = None,
+        show_progress: bool = False
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Embed papers chunk by chunk, for bulk indexing.
+
+        With more than one worker (or an explicit pool), cache misses are
+        encoded in an EmbeddingPool while earlier chunks are being consumed,
+        so the caller's writes overlap with encoding. Chunks are yielded in
+        order either way.
+
+        Args:
+            papers: List of PaperMetadata objects
+            chunk_size: Papers per yielded chunk
+            batch_size: Batch size for encoding
+            workers: Worker processes (default: from config; 1 encodes in
+                this process, 0 uses all cores)
+            pool: Existing pool to use instead of starting one
+            show_progress: Whether to show progress bar (in-process encoding)
+
+        Yields:
+            Tuples of (index of the chunk's first paper, embeddings of shape
+            (chunk length, embedding_dim))
+
+        Example:
+            ```python
+            for start, embeddings in embedder.iter_embed_papers(papers, workers=0):
+                db.add_papers(papers[start:start + len(embeddings)], embeddings=embeddings)
+            ```
+        """
+        config = get_config().knowledge
+        if workers is None:
+            workers = config.embedding_workers
+
+        if pool is None and (workers == 1 or self.backend_name == "service"):
+            # The service batches on its own side; nothing to shard here
+            for start in range(0, len(papers), chunk_size):
+                texts = [self._paper_to_text(paper) for paper in papers[start:start + chunk_size]]
+                yield start, self._embed_texts(texts, batch_size, show_progress)
+            return
+
+        from evoverse.knowledge.embedding_pool import EmbeddingPool
+
+        owns_pool = pool is None
+        if owns_pool:
+            pool = EmbeddingPool(
+                self.worker_kwargs(),
+                num_workers=workers,
+                threads_per_worker=config.embedding_threads_per_worker
+            )
+
+        def submit(missed: List[str]) -> Callable[[], np.ndarray]:
+            return pool.submit(missed, batch_size).result
+
+        try:
+            pending = deque()
+            for start in range(0, len(papers), chunk_size):
+                texts = [self._paper_to_text(paper) for paper in papers[start:start + chunk_size]]
+                pending.append((start, self._cached_encode(texts, submit)))
+                while len(pending) > pool.max_inflight:
+                    done_start, finish = pending.popleft()
+                    yield done_start, finish()
+            while pending:
+                done_start, finish = pending.popleft()
+                yield done_start, finish()
+        finally:
+            if owns_pool:
+                pool.close()
+
+    def worker_kwargs(self) -> Dict[str, object]:
+        """PaperEmbedder arguments that reproduce this embedder in a worker process."""
+        return {
+            "model_name": self.model_name,
+            "cache_dir": self.cache_dir,
+            "device": self.device,
+            "revision": self.revision,
+            "backend": self.backend_name,
+            "quantize": self.quantize
+        }
+
     def embed_query(self, query: str) -> np.ndarray:
         """
         Generate embedding for a search query.
@@ -188,17 +411,33 @@ class PaperEmbedder:
             ```
         """
         try:
-            embedding = self.model.encode(
-                query,
-                convert_to_numpy=True,
-                show_progress_bar=False
-            )
-            return embedding
+            return self._encode([query], batch_size=1, show_progress=False)[0]
 
         except Exception as e:
             logger.error(f"Error embedding query: {e}")
             return np.zeros(self.embedding_dim, dtype=np.float32)
 
+    def embed_queries(self, queries: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Generate embeddings for several search queries in one batch.
+
+        Args:
+            queries: Search query strings
+            batch_size: Batch size for encoding
+
+        Returns:
+            Array of shape (len(queries), embedding_dim)
+        """
+        if not queries:
+            return np.zeros((0, self.embedding_dim), dtype=np.float32)
+
+        try:
+            return self._encode(list(queries), batch_size=batch_size, show_progress=False)
+
+        except Exception as e:
+            logger.error(f"Error embedding queries: {e}")
+            return np.zeros((len(queries), self.embedding_dim), dtype=np.float32)
+
     def compute_similarity(
         self,
         embedding1: np.ndarray,
@@ -220,34 +459,57 @@ class PaperEmbedder:
             print(f"Similarity: {similarity:.3f}")
             ```
         """
-        # Normalize vectors
-        norm1 = np.linalg.norm(embedding1)
-        norm2 = np.linalg.norm(embedding2)
+        # Two squared norms and the dot product, no normalized copies
+        norms = float(np.dot(embedding1, embedding1)) * float(np.dot(embedding2, embedding2))
 
-        if norm1 == 0 or norm2 == 0:
+        if norms == 0:
             return 0.0
 
-        # Cosine similarity
-        similarity = np.dot(embedding1, embedding2) / (norm1 * norm2)
+        return float(np.dot(embedding1, embedding2) / np.sqrt(norms))
+
+    def compute_similarities(
+        self,
+        query_embedding: np.ndarray,
+        embeddings: Union[np.ndarray, EmbeddingMatrix]
+    ) -> np.ndarray:
+        """
+        Cosine similarity of a query to many embeddings, as one matrix product.
+
+        Args:
+            query_embedding: Query vector (768,), or several queries (n_queries, 768)
+            embeddings: Embeddings array (n, 768) or an EmbeddingMatrix
 
-        return float(similarity)
+        Returns:
+            Array of shape (n,), or (n_queries, n) for several queries
+        """
+        if not isinstance(embeddings, EmbeddingMatrix):
+            if len(embeddings) == 0:
+                return np.zeros((0,) if np.ndim(query_embedding) == 1 else (len(query_embedding), 0))
+            embeddings = EmbeddingMatrix(embeddings)
+        scores = embeddings.scores(query_embedding)
+        return scores[0] if np.ndim(query_embedding) == 1 else scores
 
     def find_most_similar(
         self,
         query_embedding: np.ndarray,
-        paper_embeddings: np.ndarray,
+        paper_embeddings: Union[np.ndarray, EmbeddingMatrix],
         top_k: int = 5
     ) -> List[tuple]:
         """
         Find most similar papers to a query.
 
+        For repeated searches over the same papers, pass an EmbeddingMatrix
+        (normalized once, optionally float16/int8) instead of the raw array.
+
         Args:
-            query_embedding: Query embedding vector (768,)
-            paper_embeddings: Paper embeddings array (n_papers, 768)
+            query_embedding: Query embedding vector (768,), or several
+                queries (n_queries, 768) scored in one matrix product
+            paper_embeddings: Paper embeddings array (n_papers, 768) or EmbeddingMatrix
             top_k: Number of top results to return
 
         Returns:
             List of (index, similarity_score) tuples, sorted by similarity
+            (one such list per query for several queries)
 
         Example:
             ```python
@@ -261,32 +523,120 @@ class PaperEmbedder:
             ```
         """
         if len(paper_embeddings) == 0:
-            return []
+            return [] if np.ndim(query_embedding) == 1 else [[] for _ in query_embedding]
 
-        # Normalize query
-        query_norm = query_embedding / (np.linalg.norm(query_embedding) + 1e-8)
+        if not isinstance(paper_embeddings, EmbeddingMatrix):
+            paper_embeddings = EmbeddingMatrix(paper_embeddings)
 
-        # Normalize papers
-        paper_norms = paper_embeddings / (
-            np.linalg.norm(paper_embeddings, axis=1, keepdims=True) + 1e-8
-        )
+        # Top k via argpartition, not a full sort
+        indices, scores = paper_embeddings.search(np.atleast_2d(query_embedding), top_k=top_k)
 
-        # Compute similarities
-        similarities = np.dot(paper_norms, query_norm)
+        # Return (index, score) tuples
+        results = [
+            [(int(idx), float(score)) for idx, score in zip(row_indices, row_scores)]
+            for row_indices, row_scores in zip(indices, scores)
+        ]
+        return results[0] if np.ndim(query_embedding) == 1 else results
 
-        # Get top k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+    def _embed_texts(self, texts: List[str], batch_size: int, show_progress: bool) -> np.ndarray:
+        """
+        Encode paper texts, serving repeats from the embedding cache.
 
-        # Return (index, score) tuples
-        results = [(int(idx), float(similarities[idx])) for idx in top_indices]
+        Only distinct cache misses are sent to the model, as one batched
+        encode call.
 
-        return results
+        Args:
+            texts: Texts from ``_paper_to_text``
+            batch_size: Batch size for encoding
+            show_progress: Whether to show progress bar
+
+        Returns:
+            Array of shape (len(texts), embedding_dim)
+        """
+        def encode_now(missed: List[str]) -> Callable[[], np.ndarray]:
+            encoded = self._encode(missed, batch_size, show_progress and len(missed) > batch_size)
+            return lambda: encoded
+
+        return self._cached_encode(texts, encode_now)()
+
+    def _cached_encode(
+        self,
+        texts: List[str],
+        submit: Callable[[List[str]], Callable[[], np.ndarray]]
+    ) -> Callable[[], np.ndarray]:
+        """
+        Look texts up in the embedding cache and submit the distinct misses.
+
+        The cache is only read and written in this process (it allows a
+        single writer per directory), also when misses go to a worker pool.
+
+        Args:
+            texts: Texts from ``_paper_to_text``
+            submit: Starts encoding a list of texts; returns a callable that
+                waits for and returns their embeddings
+
+        Returns:
+            Callable returning the embeddings of all texts, in order
+        """
+        if self.embedding_cache is None:
+            return submit(texts)
+
+        keys = [EmbeddingCache.text_key(text) for text in texts]
+        embeddings, missing = self.embedding_cache.lookup(keys)
+        logger.debug(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        if not missing:
+            return lambda: embeddings
+
+        # Identical texts within the batch are encoded once
+        unique: Dict[bytes, int] = {}
+        for i in missing:
+            unique.setdefault(keys[i], i)
+        result = submit([texts[i] for i in unique.values()])
+
+        def finish() -> np.ndarray:
+            encoded = result()
+            self.embedding_cache.put(list(unique), encoded)
+            row_of = {key: row for row, key in enumerate(unique)}
+            embeddings[missing] = encoded[[row_of[keys[i]] for i in missing]]
+            return embeddings
+
+        return finish
+
+    def _encode(self, texts: List[str], batch_size: int, show_progress: bool) -> np.ndarray:
+        """
+        Encode texts in length buckets.
+
+        Texts are cut at the model's token limit by its tokenizer, then
+        sorted by token count so each batch holds texts of similar length
+        and pads little; rows are returned in input order.
+
+        Args:
+            texts: Texts to encode
+            batch_size: Batch size for encoding
+            show_progress: Whether to show progress bar
+
+        Returns:
+            Array of shape (len(texts), embedding_dim)
+        """
+        backend = self.backend
+        prepared, lengths = backend.prepare(texts)
+        order = np.argsort(-lengths, kind="stable")
+        encoded = backend.encode(
+            [prepared[i] for i in order],
+            batch_size=batch_size,
+            show_progress=show_progress
+        )
+        embeddings = np.empty_like(encoded)
+        embeddings[order] = encoded
+        return embeddings
 
     def _paper_to_text(self, paper: PaperMetadata) -> str:
         """
         Convert paper to text for embedding.
 
-        SPECTER is trained on title + abstract, so we use that format.
+        SPECTER is trained on title + abstract, so we use that format. The
+        full text is returned (it is also the embedding cache key); cutting
+        it at SPECTER's 512-token limit is left to the tokenizer in _encode.
 
         Args:
             paper: PaperMetadata object
@@ -299,11 +649,6 @@ class PaperEmbedder:
         abstract = paper.abstract.strip() if paper.abstract else ""
 
         if title and abstract:
-            # Truncate abstract if too long (SPECTER has 512 token limit)
-            if len(abstract.split()) > 400:
-                abstract_words = abstract.split()[:400]
-                abstract = " ".join(abstract_words) + "..."
-
             return f"{title} [SEP] {abstract}"
 
         elif title:
@@ -317,37 +662,130 @@ class PaperEmbedder:
             return ""
 
 
-# Singleton embedder instance
-_embedder: Optional[PaperEmbedder] = None
+@dataclass(frozen=True)
+class EmbedderSpec:
+    """A registered embedding model."""
+    name: str
+    model_name: str
+    revision: Optional[str] = None
+    embedding_dim: int = 768
+    description: str = ""
+
+    @property
+    def version_tag(self) -> str:
+        """Tag recorded on vector collections built with this model."""
+        return embedder_version_tag(self.model_name, self.revision)
+
+
+def embedder_version_tag(model_name: str, revision: Optional[str]) -> str:
+    """Model-version tag, ``{model_name}@{revision}``."""
+    return f"{model_name}@{revision or 'default'}"
+
+
+def parse_version_tag(tag: str) -> Tuple[str, Optional[str]]:
+    """Split a version tag into (model_name, revision)."""
+    model_name, _, revision = tag.rpartition("@")
+    if not model_name:
+        return tag, None
+    return model_name, (None if revision == "default" else revision)
+
+
+_EMBEDDER_REGISTRY: Dict[str, EmbedderSpec] = {}
+
+
+def register_embedder(spec: EmbedderSpec):
+    """
+    Register an embedding model under a short name.
+
+    Args:
+        spec: Model description; replaces any spec with the same name
+    """
+    _EMBEDDER_REGISTRY[spec.name] = spec
+
+
+def get_embedder_spec(name: str) -> EmbedderSpec:
+    """
+    Look up a registered embedding model.
+
+    Args:
+        name: Registry name (e.g. "specter")
+
+    Returns:
+        EmbedderSpec
+
+    Raises:
+        ValueError: If no model is registered under name
+    """
+    try:
+        return _EMBEDDER_REGISTRY[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown embedder: {name!r} (registered: {', '.join(sorted(_EMBEDDER_REGISTRY))})"
+        ) from None
+
+
+def list_embedders() -> List[EmbedderSpec]:
+    """All registered embedding models."""
+    return list(_EMBEDDER_REGISTRY.values())
+
+
+register_embedder(EmbedderSpec(
+    "specter", "allenai/specter", embedding_dim=768,
+    description="SPECTER, citation-informed scientific paper embeddings"
+))
+register_embedder(EmbedderSpec(
+    "specter2", "allenai/specter2_base", embedding_dim=768,
+    description="SPECTER2 base model"
+))
+register_embedder(EmbedderSpec(
+    "minilm", "sentence-transformers/all-MiniLM-L6-v2", embedding_dim=384,
+    description="Small general-purpose model; several times faster on CPU"
+))
+
+
+# Embedder instances, one per (model name, revision)
+_embedders: Dict[Tuple[str, Optional[str]], PaperEmbedder] = {}
+_embedders_lock = threading.Lock()
 
 
 def get_embedder(
-    model_name: str = "allenai/specter",
+    model_name: Optional[str] = None,
     cache_dir: Optional[str] = None,
-    device: Optional[str] = None
+    device: Optional[str] = None,
+    revision: Optional[str] = None
 ) -> PaperEmbedder:
     """
-    Get or create the singleton embedder instance.
+    Get or create the shared embedder instance for a model.
 
     Args:
-        model_name: Model name or path
+        model_name: Registry name (e.g. "minilm") or model name/path
+            (default: KnowledgeConfig.embedder)
         cache_dir: Cache directory for model files
         device: Device to use
+        revision: Model revision (a registry entry supplies its own)
 
     Returns:
         PaperEmbedder instance
     """
-    global _embedder
-    if _embedder is None:
-        _embedder = PaperEmbedder(
-            model_name=model_name,
-            cache_dir=cache_dir,
-            device=device
-        )
-    return _embedder
+    if model_name is None:
+        model_name = get_config().knowledge.embedder
+    if model_name in _EMBEDDER_REGISTRY:
+        spec = _EMBEDDER_REGISTRY[model_name]
+        model_name, revision = spec.model_name, revision or spec.revision
+
+    key = (model_name, revision)
+    with _embedders_lock:
+        if key not in _embedders:
+            _embedders[key] = PaperEmbedder(
+                model_name=model_name,
+                cache_dir=cache_dir,
+                device=device,
+                revision=revision
+            )
+        return _embedders[key]
 
 
 def reset_embedder():
-    """Reset the singleton embedder (useful for testing)."""
-    global _embedder
-    _embedder = None
+    """Reset the shared embedders (useful for testing)."""
+    with _embedders_lock:
+        _embedders.clear()
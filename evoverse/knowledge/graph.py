@@ -591,6 +591,46 @@ class KnowledgeGraph:
 
         return rel
 
+    def create_citations(
+        self,
+        edges: List[Tuple[str, str]],
+        batch_size: int = 5000
+    ) -> int:
+        """
+        Bulk-create CITES relationships (merged, so re-loading is safe).
+
+        Edges whose papers are not in the graph are skipped.
+
+        Args:
+            edges: (citing_id, cited_id) tuples
+            batch_size: Edges per query
+
+        Returns:
+            Number of edges linked
+        """
+        query = """
+        UNWIND $edges AS edge
+        MATCH (citing:Paper {id: edge[0]})
+        MATCH (cited:Paper {id: edge[1]})
+        MERGE (citing)-[r:CITES]->(cited)
+        ON CREATE SET r.created_at = $created_at
+        RETURN count(r) AS linked
+        """
+
+        edges = [list(edge) for edge in edges]
+        created_at = datetime.now().isoformat()
+        linked = 0
+        for start in range(0, len(edges), batch_size):
+            result = self.graph.run(
+                query,
+                edges=edges[start:start + batch_size],
+                created_at=created_at
+            ).data()
+            linked += result[0]["linked"] if result else 0
+
+        logger.info(f"Linked {linked}/{len(edges)} citation edges")
+        return linked
+
     def create_authored(
         self,
         author_name: str,
@@ -822,25 +862,106 @@ class KnowledgeGraph:
 
     # ==================== Graph Queries ====================
 
-    def get_citations(self, paper_id: str, depth: int = 1) -> List[Dict[str, Any]]:
+    def get_citations(
+        self,
+        paper_id: str,
+        depth: int = 1,
+        max_fanout: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get papers cited by a given paper.
 
+        Expands one level per query (breadth-first), so each cited paper is
+        visited once at its shortest depth instead of enumerating every
+        citation path up to ``depth``.
+
         Args:
             paper_id: Paper ID
             depth: Citation depth (1 = direct citations, 2 = citations of citations, etc.)
+            max_fanout: Follow at most this many citations per paper, most cited first
+            limit: Maximum number of results
 
         Returns:
             List of cited papers with metadata
         """
-        query = f"""
-        MATCH (p:Paper {{id: $paper_id}})-[:CITES*1..{depth}]->(cited:Paper)
-        RETURN cited, length((p)-[:CITES*]->(cited)) as depth
-        ORDER BY depth, cited.citation_count DESC
+        query = """
+        UNWIND $ids AS pid
+        MATCH (p:Paper {id: pid})-[:CITES]->(cited:Paper)
+        WITH p, cited
+        ORDER BY cited.citation_count DESC
+        WITH p, collect(cited)[..$fanout] AS cited_papers
+        UNWIND cited_papers AS cited
+        RETURN DISTINCT cited
+        """
+
+        fanout = max_fanout if max_fanout is not None else 2 ** 31 - 1
+        seen = {paper_id}
+        frontier = [paper_id]
+        citations = []
+        for level in range(1, depth + 1):
+            results = self.graph.run(query, ids=frontier, fanout=fanout).data()
+
+            level_papers = []
+            for r in results:
+                cited = dict(r["cited"])
+                if cited.get("id") in seen:
+                    continue
+                seen.add(cited.get("id"))
+                level_papers.append(cited)
+
+            level_papers.sort(key=lambda paper: paper.get("citation_count") or 0, reverse=True)
+            citations.extend({"paper": paper, "depth": level} for paper in level_papers)
+            if limit is not None and len(citations) >= limit:
+                return citations[:limit]
+
+            frontier = [paper["id"] for paper in level_papers if paper.get("id")]
+            if not frontier:
+                break
+
+        return citations
+
+    def get_citation_edges(
+        self,
+        paper_ids: List[str],
+        internal_only: bool = False,
+        batch_size: int = 5000
+    ) -> List[Tuple[str, str]]:
         """
+        Get direct CITES edges of many papers in one round trip per batch.
+
+        Args:
+            paper_ids: IDs of citing papers
+            internal_only: Only return edges whose cited paper is also in paper_ids
+            batch_size: Maximum IDs per query
 
-        results = self.graph.run(query, paper_id=paper_id).data()
-        return [{"paper": dict(r["cited"]), "depth": r["depth"]} for r in results]
+        Returns:
+            List of (citing_id, cited_id) tuples
+        """
+        if internal_only:
+            query = """
+            UNWIND $ids AS pid
+            MATCH (p:Paper {id: pid})-[:CITES]->(cited:Paper)
+            WHERE cited.id IN $all_ids
+            RETURN p.id AS citing_id, cited.id AS cited_id
+            """
+        else:
+            query = """
+            UNWIND $ids AS pid
+            MATCH (p:Paper {id: pid})-[:CITES]->(cited:Paper)
+            RETURN p.id AS citing_id, cited.id AS cited_id
+            """
+
+        ids = list(dict.fromkeys(paper_ids))
+        edges = []
+        for start in range(0, len(ids), batch_size):
+            params = {"ids": ids[start:start + batch_size]}
+            if internal_only:
+                params["all_ids"] = ids
+            results = self.graph.run(query, **params).data()
+            edges.extend((r["citing_id"], r["cited_id"]) for r in results)
+
+        return edges
 
     def get_citing_papers(self, paper_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -17,6 +17,11 @@ from evoverse.knowledge.embeddings import get_embedder
 
 logger = logging.getLogger(__name__)
 
+# Papers per vector DB query when adding semantic edges, and the most
+# result rows (papers x top_k) one query may return
+_SEMANTIC_QUERY_BATCH = 32
+_SEMANTIC_QUERY_ROWS = 20000
+
 
 class GraphBuilder:
     """
@@ -375,53 +380,62 @@ class GraphBuilder:
 
         logger.info("Computing semantic similarity edges...")
 
-        # Ensure papers are in vector DB
+        # Ensure papers are in vector DB (only new or changed papers are embedded)
         try:
             self.vector_db.add_papers(papers)
         except Exception as e:
             logger.error(f"Error adding papers to vector DB: {e}")
             return
 
-        # For each paper, find similar papers
-        added_edges = 0
+        # Determine how many neighbors to retrieve.
+        # 默认使用向量库中的“所有历史论文”作为候选，
+        # 如设置了 max_semantic_neighbors，则进行上限截断。
+        try:
+            total_in_db = self.vector_db.count()
+        except Exception:
+            total_in_db = 0
 
-        for i, paper in enumerate(papers):
-            if i % 10 == 0:
-                logger.info(f"Processing semantic edges for paper {i + 1}/{len(papers)}")
+        if total_in_db <= 0:
+            return
 
-            try:
-                # Determine how many neighbors to retrieve.
-                # 默认使用向量库中的“所有历史论文”作为候选，
-                # 如设置了 max_semantic_neighbors，则进行上限截断。
-                try:
-                    total_in_db = self.vector_db.count()
-                except Exception:
-                    total_in_db = 0
+        if self.max_semantic_neighbors is not None:
+            top_k = min(total_in_db, self.max_semantic_neighbors)
+        else:
+            top_k = total_in_db
 
-                if total_in_db <= 0:
-                    continue
+        # For each batch of papers, find similar papers with one query; with
+        # many neighbors per paper the batch shrinks (down to one paper)
+        added_edges = 0
+        batch_size = max(1, min(_SEMANTIC_QUERY_BATCH, _SEMANTIC_QUERY_ROWS // top_k))
 
-                if self.max_semantic_neighbors is not None:
-                    top_k = min(total_in_db, self.max_semantic_neighbors)
-                else:
-                    top_k = total_in_db
+        for start in range(0, len(papers), batch_size):
+            batch = papers[start:start + batch_size]
+            logger.info(f"Processing semantic edges for papers {start + 1}-{start + len(batch)}/{len(papers)}")
 
-                # Find similar papers
-                similar = self.vector_db.search_by_paper(
-                    paper,
+            try:
+                # Only ids and scores are used here
+                batch_similar = self.vector_db.search_by_papers(
+                    batch,
                     top_k=top_k,
-                    filters=None
+                    filters=None,
+                    include=()
                 )
+            except Exception as e:
+                logger.error(f"Error finding similar papers for batch at {start}: {e}")
+                continue
 
-                # Add edges for highly similar papers
-                for result in similar:
-                    similarity = result["score"]
+            for paper, similar in zip(batch, batch_similar):
+                try:
+                    # Add edges for highly similar papers
+                    for result in similar:
+                        similarity = result["score"]
+
+                        if similarity < self.similarity_threshold:
+                            continue
 
-                    if similarity >= self.similarity_threshold:
                         # Get paper ID from result
                         similar_paper_id = result["id"]
 
-
                         # Check if the similar paper exists in the graph database
                         # Vector DB may contain papers from previous runs that aren't in current graph
                         similar_paper_node = self.graph.get_paper(similar_paper_id)
@@ -441,9 +455,9 @@ class GraphBuilder:
                         if relationship:
                             added_edges += 1
                             self.stats["relationships_added"] += 1
-                                
-            except Exception as e:
-                logger.error(f"Error adding semantic edges for {paper.primary_identifier}: {e}")
+
+                except Exception as e:
+                    logger.error(f"Error adding semantic edges for {paper.primary_identifier}: {e}")
 
         logger.info(f"Added {added_edges} semantic similarity edges")
 
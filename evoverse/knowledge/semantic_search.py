@@ -8,10 +8,12 @@ for intelligent paper discovery and recommendation.
 from typing import List, Optional, Dict, Any, Tuple
 import logging
 
+import numpy as np
+
 from evoverse.literature.base_client import PaperMetadata, PaperSource
 from evoverse.literature.unified_search import UnifiedLiteratureSearch
 from evoverse.knowledge.vector_db import get_vector_db
-from evoverse.knowledge.embeddings import get_embedder
+from evoverse.knowledge.embeddings import PaperEmbedder
 
 logger = logging.getLogger(__name__)
 
@@ -55,11 +57,13 @@ class SemanticLiteratureSearch:
         # Initialize vector database
         self.vector_db = get_vector_db(collection_name=vector_db_collection)
 
-        # Initialize embedder
-        self.embedder = get_embedder()
-
         logger.info("Initialized semantic literature search")
 
+    @property
+    def embedder(self) -> PaperEmbedder:
+        """The collection's embedder, so indexed vectors match its model after a re-index."""
+        return self.vector_db.embedder
+
     def search(
         self,
         query: str,
@@ -269,7 +273,8 @@ class SemanticLiteratureSearch:
         self,
         papers: List[PaperMetadata],
         batch_size: int = 100,
-        show_progress: bool = True
+        show_progress: bool = True,
+        workers: Optional[int] = None
     ):
         """
         Build vector index from a corpus of papers.
@@ -278,28 +283,40 @@ class SemanticLiteratureSearch:
             papers: List of papers to index
             batch_size: Batch size for processing
             show_progress: Whether to show progress
+            workers: Embedding worker processes (default: from config;
+                1 = this process, 0 = all cores). With several workers,
+                each batch is written while later ones are being encoded.
 
         Example:
             ```python
             # Index a large corpus
             search.build_corpus_index(all_papers, batch_size=100)
+
+            # Bulk mode on a many-core machine
+            search.build_corpus_index(all_papers, batch_size=500, workers=0)
             ```
         """
         logger.info(f"Building index for {len(papers)} papers")
 
-        # Compute embeddings in batches
-        for i in range(0, len(papers), batch_size):
-            batch = papers[i:i + batch_size]
-
-            embeddings = self.embedder.embed_papers(
-                batch,
-                batch_size=batch_size,
-                show_progress=show_progress
-            )
-
+        # Only papers that are new or changed need embedding
+        indexed = len(papers)
+        papers = self.vector_db.papers_to_embed(papers)
+        if len(papers) < indexed:
+            logger.info(f"{indexed - len(papers)} papers already indexed")
+
+        # Compute embeddings in batches, in order
+        chunks = self.embedder.iter_embed_papers(
+            papers,
+            chunk_size=batch_size,
+            batch_size=batch_size,
+            workers=workers,
+            show_progress=show_progress
+        )
+        for start, embeddings in chunks:
+            batch = papers[start:start + len(embeddings)]
             self.vector_db.add_papers(batch, embeddings=embeddings)
 
-            logger.info(f"Indexed {min(i + batch_size, len(papers))}/{len(papers)} papers")
+            logger.info(f"Indexed {start + len(batch)}/{len(papers)} papers")
 
         logger.info("Index building complete")
 
@@ -373,18 +390,8 @@ class SemanticLiteratureSearch:
             papers: Papers to index
         """
         try:
-            # Only index papers not already in database
-            new_papers = []
-
-            for paper in papers:
-                paper_id = f"{paper.source.value}:{paper.primary_identifier}"
-                if not self.vector_db.get_paper(paper_id):
-                    new_papers.append(paper)
-
-            if new_papers:
-                self.vector_db.add_papers(new_papers)
-                logger.info(f"Indexed {len(new_papers)} new papers")
-
+            # Only papers not already in the database are embedded
+            self.vector_db.add_papers(papers)
         except Exception as e:
             logger.error(f"Error indexing papers: {e}")
 
@@ -437,14 +444,11 @@ class SemanticLiteratureSearch:
         # Compute paper embeddings
         paper_embeddings = self.embedder.embed_papers(papers, show_progress=False)
 
-        # Compute similarities
-        similarities = []
-        for i, paper_emb in enumerate(paper_embeddings):
-            sim = self.embedder.compute_similarity(query_embedding, paper_emb)
-            similarities.append((i, sim, papers[i]))
+        # Compute similarities (one matrix product)
+        similarities = self.embedder.compute_similarities(query_embedding, paper_embeddings)
 
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        # Sort by similarity (stable, so ties keep their input order)
+        order = np.argsort(-similarities, kind="stable")
 
         # Return reranked papers
-        return [paper for _, _, paper in similarities]
+        return [papers[i] for i in order]
@@ -0,0 +1,778 @@
+"""
+Storage backends for PaperVectorDB.
+
+- ``chroma``: ChromaDB persistent client (default)
+- ``faiss``: local FAISS HNSW index with a SQLite sidecar for ids,
+  metadata and documents
+
+A backend manages named collections. Collections follow the subset of
+Chroma's Collection API that PaperVectorDB uses (add / upsert / update /
+get / query / delete / count, Chroma-style result dicts), so Chroma
+collections are used as they are.
+
+FAISS collection layout, in ``{persist_directory}/{collection}/``:
+
+- ``vectors.{gen}.f32``: L2-normalized float32 rows, appended on write;
+  row number = FAISS label. This is the durable copy of the vectors.
+- ``index.{gen}.faiss``: HNSW snapshot written by flush(). Readers
+  memory-map it (the vector codes are shared through the page cache, so
+  several worker processes can serve one index). Rows appended after the
+  snapshot are added on open.
+- ``meta.sqlite``: id -> label, metadata (JSON), document; live rows only.
+
+Updates append a new row and tombstone the old label; deleted labels are
+excluded at search time and dropped when flush() compacts the files.
+Only one process should write to a collection at a time.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import weakref
+
+import numpy as np
+
+from evoverse.knowledge.embedding_matrix import normalize_rows
+
+logger = logging.getLogger(__name__)
+
+# Optional dependencies - only presence is checked at import time
+HAS_CHROMADB = importlib.util.find_spec("chromadb") is not None
+HAS_FAISS = importlib.util.find_spec("faiss") is not None
+
+BACKENDS = ("chroma", "faiss")
+
+# Compact a FAISS collection on flush once this many rows are tombstoned
+# and they make up at least this fraction of the vectors file
+_COMPACT_MIN_DEAD = 1024
+_COMPACT_DEAD_FRACTION = 0.2
+
+# Rows per FAISS add() when (re)building an index, and IDs per SQLite IN (...)
+_BUILD_CHUNK_ROWS = 65536
+_SQL_CHUNK = 900
+
+
+class VectorCollection(ABC):
+    """
+    A named set of (id, embedding, metadata, document) rows.
+
+    Methods take and return the same shapes as the matching Chroma
+    Collection methods.
+    """
+
+    name: str
+
+    @property
+    @abstractmethod
+    def metadata(self) -> Dict[str, Any]:
+        """Collection-level metadata (e.g. embedding_model)."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of rows."""
+
+    @abstractmethod
+    def add(
+        self,
+        ids: List[str],
+        embeddings: Any,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        documents: Optional[List[str]] = None
+    ):
+        """Insert rows; IDs that already exist are left unchanged."""
+
+    @abstractmethod
+    def upsert(
+        self,
+        ids: List[str],
+        embeddings: Any,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        documents: Optional[List[str]] = None
+    ):
+        """Insert rows, replacing rows with the same ID."""
+
+    @abstractmethod
+    def update(
+        self,
+        ids: List[str],
+        embeddings: Any = None,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        documents: Optional[List[str]] = None
+    ):
+        """Change the given fields of existing rows."""
+
+    @abstractmethod
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include: Sequence[str] = ("metadatas", "documents")
+    ) -> Dict[str, Any]:
+        """Rows by ID and/or metadata filter: {"ids": [...], "metadatas": [...], ...}."""
+
+    @abstractmethod
+    def query(
+        self,
+        query_embeddings: Any,
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Sequence[str] = ("metadatas", "documents", "distances")
+    ) -> Dict[str, Any]:
+        """Nearest rows per query: {"ids": [[...], ...], "distances": [[...], ...], ...}."""
+
+    @abstractmethod
+    def delete(self, ids: List[str]):
+        """Remove rows."""
+
+
+class VectorBackend(ABC):
+    """Creates, opens and deletes collections."""
+
+    #: Short backend name ("chroma", "faiss")
+    name: str = ""
+
+    #: Rows per write call accepted by the backend
+    max_batch_size: int = 100000
+
+    @abstractmethod
+    def get_collection(self, name: str) -> Optional[VectorCollection]:
+        """Open an existing collection (None if it does not exist)."""
+
+    @abstractmethod
+    def create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None) -> VectorCollection:
+        """Create a collection (ValueError if it exists)."""
+
+    @abstractmethod
+    def delete_collection(self, name: str):
+        """Delete a collection (ValueError if it does not exist)."""
+
+    def prepare_embeddings(self, embeddings: np.ndarray) -> Any:
+        """Embeddings in the form the backend's write and query calls take."""
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    def flush(self):
+        """Persist buffered state (no-op for backends that write through)."""
+
+    def describe(self) -> Dict[str, Any]:
+        """Backend name and parameters (for stats and logs)."""
+        return {"backend": self.name}
+
+
+class ChromaBackend(VectorBackend):
+    """ChromaDB persistent client."""
+
+    name = "chroma"
+
+    def __init__(self, persist_directory: str):
+        """
+        Open the Chroma database.
+
+        Args:
+            persist_directory: Chroma persistence directory
+        """
+        if not HAS_CHROMADB:
+            raise ImportError("chromadb not installed. Install with: pip install chromadb")
+
+        import chromadb
+        from chromadb.config import Settings
+
+        self.client = chromadb.PersistentClient(
+            path=str(persist_directory),
+            settings=Settings(
+                anonymized_telemetry=False,
+                allow_reset=True
+            )
+        )
+        try:
+            self.max_batch_size = self.client.get_max_batch_size()
+        except Exception:
+            pass
+
+        # Chroma accepts numpy embeddings directly from 0.5; older versions need lists
+        version = tuple(int(p) for p in chromadb.__version__.split(".")[:2] if p.isdigit())
+        self._accepts_ndarray = version >= (0, 5)
+
+    def get_collection(self, name: str):
+        try:
+            return self.client.get_collection(name=name)
+        except Exception:
+            return None
+
+    def create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None):
+        return self.client.create_collection(name=name, metadata=metadata)
+
+    def delete_collection(self, name: str):
+        self.client.delete_collection(name=name)
+
+    def prepare_embeddings(self, embeddings: np.ndarray) -> Any:
+        if self._accepts_ndarray:
+            return np.ascontiguousarray(embeddings, dtype=np.float32)
+        return np.asarray(embeddings).tolist()
+
+
+class FaissBackend(VectorBackend):
+    """Local FAISS HNSW collections (see module docstring for the layout)."""
+
+    name = "faiss"
+
+    def __init__(
+        self,
+        persist_directory: str,
+        m: int = 32,
+        ef_construction: int = 200,
+        ef_search: int = 64
+    ):
+        """
+        Open the collection directory.
+
+        Args:
+            persist_directory: Directory holding one subdirectory per collection
+            m: HNSW neighbours per node (new collections; more = better
+                recall, larger index)
+            ef_construction: HNSW candidate list size while building (new collections)
+            ef_search: HNSW candidate list size per query (raised to n_results
+                if smaller); trades latency for recall
+        """
+        if not HAS_FAISS:
+            raise ImportError("faiss not installed. Install with: pip install faiss-cpu")
+
+        self.root = Path(persist_directory)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+
+        self._collections: Dict[str, FaissCollection] = {}
+        self._lock = threading.Lock()
+        # Write index snapshots of open collections at interpreter exit
+        weakref.finalize(self, _flush_collections, self._collections)
+
+    def get_collection(self, name: str) -> Optional["FaissCollection"]:
+        with self._lock:
+            if name not in self._collections:
+                path = self.root / name
+                if not (path / "meta.sqlite").exists():
+                    return None
+                self._collections[name] = FaissCollection(path, name, ef_search=self.ef_search)
+            return self._collections[name]
+
+    def create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None) -> "FaissCollection":
+        with self._lock:
+            path = self.root / name
+            if (path / "meta.sqlite").exists():
+                raise ValueError(f"Collection {name} already exists")
+            collection = FaissCollection(
+                path,
+                name,
+                metadata=metadata or {},
+                m=self.m,
+                ef_construction=self.ef_construction,
+                ef_search=self.ef_search,
+                create=True
+            )
+            self._collections[name] = collection
+            return collection
+
+    def delete_collection(self, name: str):
+        with self._lock:
+            path = self.root / name
+            if not (path / "meta.sqlite").exists():
+                raise ValueError(f"Collection {name} does not exist")
+            collection = self._collections.pop(name, None)
+            if collection is not None:
+                collection.close()
+            shutil.rmtree(path)
+
+    def flush(self):
+        _flush_collections(self._collections)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "hnsw_m": self.m,
+            "hnsw_ef_construction": self.ef_construction,
+            "hnsw_ef_search": self.ef_search
+        }
+
+
+def _flush_collections(collections: Dict[str, "FaissCollection"]):
+    for collection in list(collections.values()):
+        try:
+            collection.flush()
+        except Exception as e:
+            logger.error(f"Error flushing vector collection {collection.name}: {e}")
+
+
+class FaissCollection(VectorCollection):
+    """One FAISS HNSW collection; see the module docstring for the file layout."""
+
+    def __init__(
+        self,
+        path: Path,
+        name: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        m: int = 32,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        create: bool = False
+    ):
+        import faiss
+
+        self._faiss = faiss
+        self.path = Path(path)
+        self.name = name
+        self.ef_search = ef_search
+        self._lock = threading.RLock()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path / "meta.sqlite"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS rows ("
+                "id TEXT PRIMARY KEY, label INTEGER NOT NULL UNIQUE, metadata TEXT, document TEXT)"
+            )
+            self._db.execute("CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            if create:
+                self._set_info({
+                    "metadata": metadata or {},
+                    "dim": 0,
+                    "generation": 0,
+                    "m": m,
+                    "ef_construction": ef_construction
+                })
+
+        info = {key: json.loads(value) for key, value in self._db.execute("SELECT key, value FROM info")}
+        self._metadata: Dict[str, Any] = info["metadata"]
+        self._dim: int = info["dim"]
+        self._generation: int = info["generation"]
+        self._m: int = info["m"]
+        self._ef_construction: int = info["ef_construction"]
+
+        # Rows in the vectors file; labels in [0, _n_vectors) without a row are dead
+        self._n_vectors = 0
+        if self._dim and self._vectors_path.exists():
+            self._n_vectors = self._vectors_path.stat().st_size // (4 * self._dim)
+        live = {label for (label,) in self._db.execute("SELECT label FROM rows")}
+        self._dead: Set[int] = set(range(self._n_vectors)) - live
+        if len(live) > self._n_vectors:
+            logger.warning(f"{self.name}: {len(live) - self._n_vectors} rows have no stored vector")
+
+        self._index = None  # opened on first query or write
+        self._index_mmapped = False
+        self._index_dirty = False
+        self._vectors_mm: Optional[np.ndarray] = None
+        self._metadata_cache: Optional[Dict[int, Dict[str, Any]]] = None  # label -> metadata, for where filters
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return dict(self._metadata)
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.path / f"vectors.{self._generation}.f32"
+
+    @property
+    def _index_path(self) -> Path:
+        return self.path / f"index.{self._generation}.faiss"
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def add(self, ids, embeddings, metadatas=None, documents=None):
+        with self._lock:
+            existing = set(self._labels(ids))
+            keep = [i for i, row_id in enumerate(ids) if row_id not in existing]
+            if len(keep) < len(ids):
+                logger.debug(f"{self.name}: skipping {len(ids) - len(keep)} existing IDs in add()")
+            if keep:
+                self.upsert(
+                    [ids[i] for i in keep],
+                    np.asarray(embeddings, dtype=np.float32)[keep],
+                    [metadatas[i] for i in keep] if metadatas is not None else None,
+                    [documents[i] for i in keep] if documents is not None else None
+                )
+
+    def upsert(self, ids, embeddings, metadatas=None, documents=None):
+        ids = list(ids)
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate IDs in upsert")
+        if not ids:
+            return
+        vectors = normalize_rows(np.atleast_2d(np.asarray(embeddings, dtype=np.float32)))
+        if len(vectors) != len(ids):
+            raise ValueError(f"Got {len(vectors)} embeddings for {len(ids)} IDs")
+
+        with self._lock:
+            if not self._dim:
+                self._dim = vectors.shape[1]
+                with self._db:
+                    self._set_info({"dim": self._dim})
+            if vectors.shape[1] != self._dim:
+                raise ValueError(f"Expected embeddings of dim {self._dim}, got {vectors.shape[1]}")
+
+            old_labels = self._labels(ids)
+            first = self._n_vectors
+            labels = list(range(first, first + len(ids)))
+
+            # Vectors first: a crash before the commit below leaves dead rows only
+            index = self._writable_index()
+            with open(self._vectors_path, 'ab') as f:
+                f.write(vectors.tobytes())
+            self._n_vectors += len(vectors)
+            self._vectors_mm = None
+            index.add(vectors)
+            self._index_dirty = True
+
+            metadata_json = [json.dumps(m) if m is not None else None for m in metadatas] if metadatas is not None else [None] * len(ids)
+            docs = list(documents) if documents is not None else [None] * len(ids)
+            with self._db:
+                self._db.executemany(
+                    "INSERT INTO rows (id, label, metadata, document) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET label = excluded.label, "
+                    "metadata = COALESCE(excluded.metadata, rows.metadata), "
+                    "document = COALESCE(excluded.document, rows.document)",
+                    zip(ids, labels, metadata_json, docs)
+                )
+            self._dead.update(old_labels.values())
+            self._metadata_cache = None
+
+    def update(self, ids, embeddings=None, metadatas=None, documents=None):
+        with self._lock:
+            existing = self._labels(ids)
+            keep = [i for i, row_id in enumerate(ids) if row_id in existing]
+            if len(keep) < len(ids):
+                logger.warning(f"{self.name}: update() of {len(ids) - len(keep)} missing IDs ignored")
+            if not keep:
+                return
+
+            if embeddings is not None:
+                self.upsert(
+                    [ids[i] for i in keep],
+                    np.asarray(embeddings, dtype=np.float32)[keep],
+                    [metadatas[i] for i in keep] if metadatas is not None else None,
+                    [documents[i] for i in keep] if documents is not None else None
+                )
+                return
+
+            with self._db:
+                if metadatas is not None:
+                    self._db.executemany(
+                        "UPDATE rows SET metadata = ? WHERE id = ?",
+                        [(json.dumps(metadatas[i]), ids[i]) for i in keep]
+                    )
+                if documents is not None:
+                    self._db.executemany(
+                        "UPDATE rows SET document = ? WHERE id = ?",
+                        [(documents[i], ids[i]) for i in keep]
+                    )
+            self._metadata_cache = None
+
+    def delete(self, ids):
+        with self._lock:
+            labels = self._labels(ids)
+            with self._db:
+                self._db.executemany("DELETE FROM rows WHERE id = ?", [(row_id,) for row_id in labels])
+            self._dead.update(labels.values())
+            self._metadata_cache = None
+
+    def get(self, ids=None, where=None, limit=None, offset=None, include=("metadatas", "documents")):
+        with self._lock:
+            if ids is not None:
+                rows = []
+                for chunk in _chunks(list(ids), _SQL_CHUNK):
+                    rows.extend(self._db.execute(
+                        f"SELECT id, label, metadata, document FROM rows WHERE id IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ))
+                order = {row_id: i for i, row_id in enumerate(ids)}
+                rows.sort(key=lambda row: order[row[0]])
+            elif where is None:
+                rows = list(self._db.execute(
+                    "SELECT id, label, metadata, document FROM rows ORDER BY label LIMIT ? OFFSET ?",
+                    (-1 if limit is None else limit, offset or 0)
+                ))
+                limit = offset = None
+            else:
+                rows = list(self._db.execute("SELECT id, label, metadata, document FROM rows ORDER BY label"))
+
+            if where is not None:
+                rows = [row for row in rows if _matches(json.loads(row[2]) if row[2] else {}, where)]
+            if offset:
+                rows = rows[offset:]
+            if limit is not None:
+                rows = rows[:limit]
+
+            result: Dict[str, Any] = {"ids": [row[0] for row in rows]}
+            if "metadatas" in include:
+                result["metadatas"] = [json.loads(row[2]) if row[2] else {} for row in rows]
+            if "documents" in include:
+                result["documents"] = [row[3] for row in rows]
+            if "embeddings" in include:
+                vectors = self._vectors()
+                result["embeddings"] = np.array([vectors[row[1]] for row in rows], dtype=np.float32)
+            return result
+
+    def query(self, query_embeddings, n_results=10, where=None, include=("metadatas", "documents", "distances")):
+        faiss = self._faiss
+        queries = normalize_rows(np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32)))
+        n_queries = len(queries)
+        fields = [name for name in ("distances", "metadatas", "documents") if name in include]
+        empty = {name: [[] for _ in range(n_queries)] for name in ["ids", *fields]}
+        # Only read the row columns the caller asked for
+        columns = ["label", "id"] + [column for column, name in (("metadata", "metadatas"), ("document", "documents"))
+                                     if name in include]
+
+        with self._lock:
+            live = self._n_vectors - len(self._dead)
+            if live <= 0 or n_results <= 0:
+                return empty
+
+            params = faiss.SearchParametersHNSW()
+            if where is not None:
+                allowed = self._labels_matching(where)
+                if not allowed:
+                    return empty
+                selector = faiss.IDSelectorBatch(np.asarray(allowed, dtype=np.int64))
+                params.sel = selector
+                k = min(n_results, len(allowed))
+            elif self._dead:
+                dead_selector = faiss.IDSelectorBatch(np.fromiter(self._dead, dtype=np.int64, count=len(self._dead)))
+                selector = faiss.IDSelectorNot(dead_selector)
+                params.sel = selector
+                k = min(n_results, live)
+            else:
+                k = min(n_results, live)
+            params.efSearch = max(self.ef_search, k)
+
+            similarities, labels = self._open_index().search(queries, k, params=params)
+
+            found = sorted({int(label) for label in labels.ravel() if label >= 0})
+            rows = {}
+            for chunk in _chunks(found, _SQL_CHUNK):
+                for row in self._db.execute(
+                    f"SELECT {', '.join(columns)} FROM rows WHERE label IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ):
+                    values = dict(zip(columns, row))
+                    if "metadata" in values:
+                        values["metadata"] = json.loads(values["metadata"]) if values["metadata"] else {}
+                    rows[values.pop("label")] = values
+
+        result = {name: [] for name in ["ids", *fields]}
+        for q in range(n_queries):
+            hits = [(rows[int(label)], float(sim)) for label, sim in zip(labels[q], similarities[q])
+                    if label >= 0 and int(label) in rows]
+            result["ids"].append([row["id"] for row, _ in hits])
+            if "distances" in result:
+                result["distances"].append([1.0 - sim for _, sim in hits])  # cosine distance, as in Chroma
+            if "metadatas" in result:
+                result["metadatas"].append([row["metadata"] for row, _ in hits])
+            if "documents" in result:
+                result["documents"].append([row["document"] for row, _ in hits])
+        return result
+
+    def flush(self):
+        """Compact if many rows are dead, else write the index snapshot if it changed."""
+        with self._lock:
+            dead = len(self._dead)
+            if dead >= _COMPACT_MIN_DEAD and dead >= _COMPACT_DEAD_FRACTION * self._n_vectors:
+                self._compact()
+            elif self._index_dirty and self._index is not None and not self._index_mmapped:
+                tmp_path = self._index_path.with_suffix(".tmp")
+                self._faiss.write_index(self._index, str(tmp_path))
+                os.replace(tmp_path, self._index_path)  # readers keep their old mapping
+                self._index_dirty = False
+
+    def close(self):
+        with self._lock:
+            self._index = None
+            self._vectors_mm = None
+            self._db.close()
+
+    def _set_info(self, values: Dict[str, Any]):
+        self._db.executemany(
+            "INSERT OR REPLACE INTO info (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in values.items()]
+        )
+
+    def _labels(self, ids: Iterable[str]) -> Dict[str, int]:
+        """Labels of the given IDs that exist."""
+        labels = {}
+        for chunk in _chunks(list(ids), _SQL_CHUNK):
+            labels.update(self._db.execute(
+                f"SELECT id, label FROM rows WHERE id IN ({','.join('?' * len(chunk))})", chunk
+            ))
+        return labels
+
+    def _labels_matching(self, where: Dict[str, Any]) -> List[int]:
+        if self._metadata_cache is None:
+            self._metadata_cache = {
+                label: json.loads(metadata) if metadata else {}
+                for label, metadata in self._db.execute("SELECT label, metadata FROM rows")
+            }
+        return [label for label, metadata in self._metadata_cache.items() if _matches(metadata, where)]
+
+    def _vectors(self) -> np.ndarray:
+        """The vectors file, memory-mapped read-only."""
+        if self._vectors_mm is None:
+            if not self._n_vectors:
+                return np.zeros((0, self._dim), dtype=np.float32)
+            self._vectors_mm = np.memmap(self._vectors_path, dtype=np.float32, mode='r', shape=(self._n_vectors, self._dim))
+        return self._vectors_mm
+
+    def _new_index(self):
+        index = self._faiss.IndexHNSWFlat(self._dim, self._m, self._faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = self._ef_construction
+        return index
+
+    def _open_index(self):
+        """The index: the snapshot memory-mapped, plus any rows appended after it."""
+        if self._index is not None:
+            return self._index
+
+        faiss = self._faiss
+        index = None
+        if self._index_path.exists():
+            mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+            index = faiss.read_index(str(self._index_path), mmap_flag | faiss.IO_FLAG_READ_ONLY)
+            self._index_mmapped = True
+
+        if index is None or index.ntotal < self._n_vectors:
+            # Catch up with rows written after the snapshot (needs a writable copy)
+            index = faiss.read_index(str(self._index_path)) if index is not None else self._new_index()
+            self._index_mmapped = False
+            vectors = self._vectors()
+            for start in range(index.ntotal, self._n_vectors, _BUILD_CHUNK_ROWS):
+                index.add(np.ascontiguousarray(vectors[start:start + _BUILD_CHUNK_ROWS]))
+            self._index_dirty = True
+
+        self._index = index
+        return index
+
+    def _writable_index(self):
+        """The index loaded into memory (a memory-mapped snapshot is read-only)."""
+        index = self._open_index()
+        if self._index_mmapped:
+            index = self._faiss.read_index(str(self._index_path))
+            self._index = index
+            self._index_mmapped = False
+        return index
+
+    def _compact(self):
+        """Rewrite vectors and index without dead rows, relabelling 0..n-1."""
+        live = list(self._db.execute("SELECT id, label FROM rows ORDER BY label"))
+        generation = self._generation + 1
+        vectors_path = self.path / f"vectors.{generation}.f32"
+        index_path = self.path / f"index.{generation}.faiss"
+
+        old_vectors = self._vectors()
+        index = self._new_index()
+        with open(vectors_path, 'wb') as f:
+            for chunk in _chunks(live, _BUILD_CHUNK_ROWS):
+                block = np.ascontiguousarray(old_vectors[[label for _, label in chunk]])
+                f.write(block.tobytes())
+                index.add(block)
+        self._faiss.write_index(index, str(index_path))
+
+        # New files are only referenced once the relabelling commits
+        with self._db:
+            self._db.execute("UPDATE rows SET label = -label - 1")
+            self._db.executemany(
+                "UPDATE rows SET label = ? WHERE id = ?",
+                [(new_label, row_id) for new_label, (row_id, _) in enumerate(live)]
+            )
+            self._set_info({"generation": generation})
+
+        old_paths = (self._vectors_path, self._index_path)
+        self._generation = generation
+        self._n_vectors = len(live)
+        self._dead = set()
+        self._index = index
+        self._index_mmapped = False
+        self._index_dirty = False
+        self._vectors_mm = None
+        self._metadata_cache = None
+        for path in old_paths:
+            path.unlink(missing_ok=True)
+        logger.info(f"Compacted vector collection {self.name}: {len(live)} rows")
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+_OPERATORS = {
+    "$eq": lambda value, arg: value == arg,
+    "$ne": lambda value, arg: value != arg,
+    "$gt": lambda value, arg: value is not None and value > arg,
+    "$gte": lambda value, arg: value is not None and value >= arg,
+    "$lt": lambda value, arg: value is not None and value < arg,
+    "$lte": lambda value, arg: value is not None and value <= arg,
+    "$in": lambda value, arg: value in arg,
+    "$nin": lambda value, arg: value not in arg,
+}
+
+
+def _matches(metadata: Dict[str, Any], where: Dict[str, Any]) -> bool:
+    """Evaluate a Chroma-style metadata filter ($and/$or, $eq/$ne/$gt/$gte/$lt/$lte/$in/$nin)."""
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(_matches(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            for op, arg in condition.items():
+                if op not in _OPERATORS:
+                    raise ValueError(f"Unsupported filter operator: {op}")
+                if not _OPERATORS[op](metadata.get(key), arg):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+def create_vector_backend(
+    backend: str,
+    persist_directory: str,
+    hnsw_m: int = 32,
+    hnsw_ef_construction: int = 200,
+    hnsw_ef_search: int = 64
+) -> VectorBackend:
+    """
+    Create a vector storage backend by name.
+
+    Args:
+        backend: One of BACKENDS
+        persist_directory: Storage directory
+        hnsw_m: HNSW neighbours per node (faiss)
+        hnsw_ef_construction: HNSW build candidate list size (faiss)
+        hnsw_ef_search: HNSW query candidate list size (faiss)
+
+    Returns:
+        VectorBackend instance
+    """
+    if backend == "chroma":
+        return ChromaBackend(persist_directory)
+    if backend == "faiss":
+        return FaissBackend(
+            persist_directory,
+            m=hnsw_m,
+            ef_construction=hnsw_ef_construction,
+            ef_search=hnsw_ef_search
+        )
+    raise ValueError(f"Unknown vector backend: {backend!r} (expected one of {BACKENDS})")
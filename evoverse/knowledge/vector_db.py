@@ -1,52 +1,80 @@
 """
-Vector database interface using ChromaDB.
+Vector database interface (ChromaDB or a local FAISS index).
 
-Stores and retrieves paper embeddings for semantic search.
+Stores and retrieves paper embeddings for semantic search. The storage
+backend is chosen by KnowledgeConfig.vector_backend (see vector_backends).
+
+Every collection records the model that produced its vectors in its
+``embedding_model`` metadata (see EmbedderSpec.version_tag). Opening a
+collection with a different model is refused; use PaperVectorDB.reindex()
+to rebuild it. Reads are served from the current collection while a shadow
+collection is built, then the logical name is switched over to it.
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple, Union
 import numpy as np
 from pathlib import Path
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
 
 from evoverse.literature.base_client import PaperMetadata
-from evoverse.knowledge.embeddings import get_embedder
+from evoverse.knowledge.embeddings import PaperEmbedder, get_embedder, parse_version_tag
+from evoverse.knowledge.vector_backends import HAS_CHROMADB, VectorBackend, create_vector_backend  # noqa: F401
 from evoverse.config import get_config
 
 logger = logging.getLogger(__name__)
 
-# Optional dependency - chromadb
-try:
-    import chromadb
-    from chromadb.config import Settings
-    HAS_CHROMADB = True
-except ImportError:
-    logger.warning("chromadb not installed. Install with: pip install chromadb")
-    HAS_CHROMADB = False
-    chromadb = None
-    Settings = None
+# Papers per embedding chunk in bulk (multi-process) indexing
+_BULK_CHUNK_SIZE = 512
+
+# Rows per collection write when no batch size is given (capped by the
+# backend's own limit), and IDs per existence lookup (SQLite variable limit)
+_WRITE_BATCH_SIZE = 2000
+_GET_BATCH_SIZE = 5000
+
+# Collections created before model tagging were built with the default SPECTER model
+LEGACY_EMBEDDING_MODEL = "allenai/specter@default"
+
+# Logical collection name -> physical collection name, in the persist directory
+_ALIASES_FILE = "collection_aliases.json"
+
 
 
 class PaperVectorDB:
     """
     Vector database for storing and searching paper embeddings.
 
-    Uses ChromaDB for persistent vector storage with semantic search capabilities.
+    Uses ChromaDB or a local FAISS HNSW index for persistent vector storage
+    with semantic search capabilities.
     """
 
     def __init__(
         self,
         collection_name: str = "papers",
         persist_directory: Optional[str] = None,
-        reset: bool = False
+        reset: bool = False,
+        embedder: Optional[Union[str, PaperEmbedder]] = None,
+        backend: Optional[str] = None
     ):
         """
         Initialize the vector database.
 
         Args:
             collection_name: Name of the collection (default: "papers")
-            persist_directory: Directory to persist database (default: from config)
+            persist_directory: Directory to persist database (default: from
+                config; chroma_persist_directory or vector_db_path for faiss)
             reset: Whether to reset/clear the collection on init
+            embedder: Embedder or registry/model name. Default: the model
+                recorded on an existing collection, else KnowledgeConfig.embedder.
+            backend: Storage backend, "chroma" or "faiss" (default: from config)
+
+        Raises:
+            ValueError: If embedder differs from the model of a non-empty
+                existing collection (re-index it with reindex() instead)
 
         Example:
             ```python
@@ -59,55 +87,124 @@ class PaperVectorDB:
             results = db.search("machine learning", top_k=10)
             ```
         """
-        if not HAS_CHROMADB:
-            logger.warning("ChromaDB not available. PaperVectorDB will not function.")
-            self.client = None
-            self.collection = None
-            self.collection_name = collection_name
-            return
+        self._lock = threading.RLock()
+        self._reindex_job: Optional["ReindexJob"] = None
 
         config = get_config()
+        knowledge = config.knowledge
+        backend = backend or knowledge.vector_backend
 
         # Set persist directory
         if persist_directory is None:
             # Use knowledge config for vector DB persistence
-            persist_directory = config.knowledge.chroma_persist_directory
+            if backend == "faiss":
+                persist_directory = knowledge.vector_db_path
+            else:
+                persist_directory = knowledge.chroma_persist_directory
 
         persist_path = Path(persist_directory)
         persist_path.mkdir(parents=True, exist_ok=True)
+        self._aliases_path = persist_path / _ALIASES_FILE
 
-        # Initialize ChromaDB client
-        self.client = chromadb.PersistentClient(
-            path=str(persist_path),
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True
+        # Open the storage backend
+        try:
+            self.backend: Optional[VectorBackend] = create_vector_backend(
+                backend,
+                str(persist_path),
+                hnsw_m=knowledge.faiss_hnsw_m,
+                hnsw_ef_construction=knowledge.faiss_hnsw_ef_construction,
+                hnsw_ef_search=knowledge.faiss_hnsw_ef_search
             )
-        )
+        except ImportError as e:
+            logger.warning(f"{e}. PaperVectorDB will not function.")
+            self.backend = None
+            self.collection = None
+            self.collection_name = collection_name
+            self.embedder = _resolve_embedder(embedder)
+            return
 
-        # Get or create collection
+        # Get or create collection (under its current physical name)
         self.collection_name = collection_name
+        physical_name = self._load_aliases().get(collection_name, collection_name)
 
         if reset:
             try:
-                self.client.delete_collection(name=collection_name)
-                logger.info(f"Reset collection: {collection_name}")
+                self.backend.delete_collection(physical_name)
+                logger.info(f"Reset collection: {physical_name}")
             except Exception:
                 pass
 
-        self.collection = self.client.get_or_create_collection(
-            name=collection_name,
-            metadata={"hnsw:space": "cosine"}  # Use cosine similarity
-        )
-
-        # Initialize embedder
-        self.embedder = get_embedder()
+        collection = self.backend.get_collection(physical_name)
+
+        if collection is None:
+            self.embedder = _resolve_embedder(embedder)
+            collection = self._create_collection(physical_name, self.embedder)
+        else:
+            model_tag = (collection.metadata or {}).get("embedding_model", LEGACY_EMBEDDING_MODEL)
+            if embedder is None:
+                model_name, revision = parse_version_tag(model_tag)
+                self.embedder = get_embedder(model_name, revision=revision)
+            else:
+                self.embedder = _resolve_embedder(embedder)
+                if self.embedder.version_tag != model_tag:
+                    if collection.count() > 0:
+                        raise ValueError(
+                            f"Collection {collection_name!r} holds {model_tag} embeddings, not "
+                            f"{self.embedder.version_tag}; open it without an embedder and call "
+                            f"reindex() to switch models"
+                        )
+                    self.backend.delete_collection(physical_name)
+                    collection = self._create_collection(physical_name, self.embedder)
+        self.collection = collection
 
         logger.info(
-            f"Initialized PaperVectorDB (collection={collection_name}, "
-            f"persist_dir={persist_directory}, count={self.collection.count()})"
+            f"Initialized PaperVectorDB (collection={collection_name}, backend={backend}, "
+            f"model={self.embedding_model}, persist_dir={persist_directory}, "
+            f"count={self.collection.count()})"
+        )
+
+    @property
+    def embedding_model(self) -> str:
+        """Model-version tag of the vectors in the collection."""
+        return self.embedder.version_tag
+
+    @property
+    def reindex_job(self) -> Optional["ReindexJob"]:
+        """The running (or most recent) re-index job, if any."""
+        return self._reindex_job
+
+    def _active(self) -> Tuple[Any, PaperEmbedder]:
+        """Current (collection, embedder) pair; they change together on a swap."""
+        with self._lock:
+            return self.collection, self.embedder
+
+    def _create_collection(self, name: str, embedder: PaperEmbedder):
+        """Create a collection tagged with the embedder's model version."""
+        return self.backend.create_collection(
+            name,
+            metadata={
+                "hnsw:space": "cosine",  # Use cosine similarity
+                "embedding_model": embedder.version_tag
+            }
         )
 
+    def _load_aliases(self) -> Dict[str, str]:
+        """Logical -> physical collection names."""
+        try:
+            with open(self._aliases_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_alias(self, physical_name: str):
+        """Point the logical collection name at a physical collection (atomic)."""
+        aliases = self._load_aliases()
+        aliases[self.collection_name] = physical_name
+        tmp_path = self._aliases_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(aliases, f, indent=2)
+        os.replace(tmp_path, self._aliases_path)
+
     def add_paper(
         self,
         paper: PaperMetadata,
@@ -131,15 +228,27 @@ class PaperVectorDB:
         self,
         papers: List[PaperMetadata],
         embeddings: Optional[np.ndarray] = None,
-        batch_size: int = 100
+        batch_size: Optional[int] = None,
+        workers: Optional[int] = None
     ):
         """
-        Add multiple papers to the vector database.
+        Add or update multiple papers in the vector database.
+
+        Existing IDs are looked up in one batched get. Papers stored with
+        the same title and abstract (content hash) are not re-embedded:
+        unchanged ones are skipped, and ones whose other metadata changed
+        only get their metadata updated. New and changed papers are
+        embedded and upserted.
 
         Args:
-            papers: List of PaperMetadata objects
+            papers: List of PaperMetadata objects (for a repeated ID, the
+                last one wins)
             embeddings: Optional pre-computed embeddings (if None, will compute)
-            batch_size: Batch size for insertion
+            batch_size: Rows per write (default: 2000, capped by the backend limit)
+            workers: Embedding worker processes when computing embeddings
+                (default: from config; 1 = this process, 0 = all cores).
+                With several workers, chunks are written while later ones
+                are still being encoded.
 
         Example:
             ```python
@@ -154,28 +263,166 @@ class PaperVectorDB:
         if not papers:
             return
 
+        if workers is None:
+            workers = get_config().knowledge.embedding_workers
+        if batch_size is None:
+            batch_size = self._write_batch_size()
+
+        received = len(papers)
+        rows, updates = self._plan_upsert(papers)
+        if updates:
+            self._update_metadata(updates, batch_size)
+        papers = [papers[i] for i in rows]
+        if embeddings is not None:
+            embeddings = np.asarray(embeddings, dtype=np.float32)[rows]
+        if not papers:
+            logger.info(f"All {received} papers already indexed ({len(updates)} metadata updates)")
+            return
+        if len(papers) < received:
+            logger.info(
+                f"Skipping {received - len(papers)} already indexed papers "
+                f"({len(updates)} metadata updates)"
+            )
+
+        if embeddings is None and workers != 1:
+            # Bulk mode: write each chunk as soon as the pool returns it
+            logger.info(f"Computing embeddings for {len(papers)} papers (workers={workers or 'auto'})")
+            embedder = self._active()[1]
+            chunks = embedder.iter_embed_papers(
+                papers, chunk_size=max(batch_size, _BULK_CHUNK_SIZE), workers=workers
+            )
+            for start, chunk_embeddings in chunks:
+                self._insert(
+                    papers[start:start + len(chunk_embeddings)], chunk_embeddings, batch_size, embedder
+                )
+                logger.info(f"Added {start + len(chunk_embeddings)}/{len(papers)} papers")
+            return
+
         # Compute embeddings if not provided
+        embedder = None
         if embeddings is None:
             logger.info(f"Computing embeddings for {len(papers)} papers")
-            embeddings = self.embedder.embed_papers(papers, show_progress=True)
+            embedder = self._active()[1]
+            embeddings = embedder.embed_papers(papers, show_progress=True)
+
+        self._insert(papers, embeddings, batch_size, embedder)
+        logger.info(f"Added {len(papers)} papers to vector database")
+
+    def papers_to_embed(self, papers: List[PaperMetadata]) -> List[PaperMetadata]:
+        """
+        Papers that are not stored yet or whose title/abstract changed.
+
+        Lets callers that embed papers themselves skip the others before
+        encoding. Uses one batched lookup.
+
+        Args:
+            papers: Candidate papers
+
+        Returns:
+            The subset add_papers() would embed, in input order
+        """
+        rows, _ = self._plan_upsert(papers)
+        return [papers[i] for i in rows]
+
+    def _plan_upsert(self, papers: List[PaperMetadata]) -> Tuple[List[int], List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Compare papers with what is stored.
+
+        Returns:
+            Tuple of (indices of papers to embed and write, (id, metadata)
+            pairs whose content is unchanged but metadata differs)
+        """
+        # Last occurrence of a repeated ID wins
+        latest: Dict[str, int] = {}
+        for i, paper in enumerate(papers):
+            latest[self._paper_id(paper)] = i
+
+        existing = self._stored_metadata(list(latest))
+
+        rows = []
+        updates = []
+        for paper_id, i in latest.items():
+            metadata = self._paper_metadata(papers[i])
+            stored = existing.get(paper_id)
+            if stored is None or stored.get("content_hash") != metadata["content_hash"]:
+                rows.append(i)
+            elif stored != metadata:
+                updates.append((paper_id, metadata))
+        rows.sort()
+        return rows, updates
+
+    def _stored_metadata(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Metadata of the given IDs that exist in the collection."""
+        collection = self._active()[0]
+        stored = {}
+        for i in range(0, len(ids), _GET_BATCH_SIZE):
+            result = collection.get(ids=ids[i:i + _GET_BATCH_SIZE], include=["metadatas"])
+            stored.update(zip(result["ids"], result["metadatas"]))
+        return stored
+
+    def _update_metadata(self, updates: List[Tuple[str, Dict[str, Any]]], batch_size: int):
+        """Rewrite metadata of stored papers, keeping their embeddings."""
+        ids = [paper_id for paper_id, _ in updates]
+        metadatas = [metadata for _, metadata in updates]
+        with self._lock:
+            for i in range(0, len(ids), batch_size):
+                self.collection.update(ids=ids[i:i + batch_size], metadatas=metadatas[i:i + batch_size])
+            if self._reindex_job is not None and self._reindex_job.is_running:
+                self._reindex_job._note_added(ids)
+
+    def _write_batch_size(self) -> int:
+        """Rows per collection write: the default, capped by the backend's limit."""
+        return min(_WRITE_BATCH_SIZE, self.backend.max_batch_size)
+
+    def _insert(
+        self,
+        papers: List[PaperMetadata],
+        embeddings: np.ndarray,
+        batch_size: int,
+        embedder: Optional[PaperEmbedder] = None
+    ):
+        """
+        Write papers and their embeddings to the collection in batches.
 
+        embedder is the model the embeddings came from, if computed here; if
+        a re-index swapped the collection since, they are recomputed.
+        """
         # Prepare data
         ids = [self._paper_id(paper) for paper in papers]
         metadatas = [self._paper_metadata(paper) for paper in papers]
         documents = [self._paper_document(paper) for paper in papers]
 
-        # Add in batches
-        for i in range(0, len(papers), batch_size):
-            batch_end = min(i + batch_size, len(papers))
+        # Held under the lock so a re-index swap cannot land between the
+        # write and recording it for the shadow collection
+        while True:
+            with self._lock:
+                if embedder is None or embedder is self.embedder:
+                    self._write(ids, embeddings, metadatas, documents, batch_size)
+                    return
+                embedder = self.embedder
+            embeddings = embedder.embed_papers(papers)
+
+    def _write(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict[str, Any]],
+        documents: List[str],
+        batch_size: int
+    ):
+        """Upsert rows into the live collection in batches (caller holds the lock)."""
+        for i in range(0, len(ids), batch_size):
+            batch_end = min(i + batch_size, len(ids))
 
-            self.collection.add(
+            self.collection.upsert(
                 ids=ids[i:batch_end],
-                embeddings=embeddings[i:batch_end].tolist(),
+                embeddings=self.backend.prepare_embeddings(embeddings[i:batch_end]),
                 metadatas=metadatas[i:batch_end],
                 documents=documents[i:batch_end]
             )
 
-        logger.info(f"Added {len(papers)} papers to vector database")
+        if self._reindex_job is not None and self._reindex_job.is_running:
+            self._reindex_job._note_added(ids)
 
     def search(
         self,
@@ -210,30 +457,48 @@ class PaperVectorDB:
                 print(f"{result['title']}: {result['score']:.3f}")
             ```
         """
-        # Compute query embedding
-        query_embedding = self.embedder.embed_query(query)
+        return self.search_many([query], top_k=top_k, filters=filters)[0]
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query strings at once.
+
+        The queries are embedded in one batch and sent in one query call.
+
+        Args:
+            queries: Search queries
+            top_k: Number of top results per query
+            filters: Optional metadata filters, applied to every query
+
+        Returns:
+            One result list per query, in input order (same format as search())
+
+        Example:
+            ```python
+            per_keyword = db.search_many(["CRISPR", "base editing", "prime editing"], top_k=5)
+            ```
+        """
+        if not queries:
+            return []
+
+        collection, embedder = self._active()
+
+        # Compute query embeddings
+        query_embeddings = embedder.embed_queries(queries)
 
         # Search
-        results = self.collection.query(
-            query_embeddings=[query_embedding.tolist()],
+        results = collection.query(
+            query_embeddings=self.backend.prepare_embeddings(query_embeddings),
             n_results=top_k,
             where=filters
         )
 
-        # Format results
-        formatted_results = []
-
-        if results and results["ids"] and len(results["ids"]) > 0:
-            for i in range(len(results["ids"][0])):
-                result = {
-                    "id": results["ids"][0][i],
-                    "score": float(1 - results["distances"][0][i]) if "distances" in results else 1.0,  # Convert distance to similarity
-                    "metadata": results["metadatas"][0][i] if "metadatas" in results else {},
-                    "document": results["documents"][0][i] if "documents" in results else ""
-                }
-                formatted_results.append(result)
-
-        return formatted_results
+        return [self._format_results(results, q, top_k) for q in range(len(queries))]
 
     def search_by_paper(
         self,
@@ -257,38 +522,99 @@ class PaperVectorDB:
             similar_papers = db.search_by_paper(paper, top_k=5)
             ```
         """
-        # Get paper embedding
-        paper_embedding = self.embedder.embed_paper(paper)
+        return self.search_by_papers([paper], top_k=top_k, filters=filters)[0]
+
+    def search_by_papers(
+        self,
+        papers: List[PaperMetadata],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        include: Sequence[str] = ("metadatas", "documents")
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Find similar papers for several papers at once.
+
+        The papers are embedded in one batch (cached embeddings are reused)
+        and sent in one query call. Each paper's own entry is removed from
+        its results.
+
+        Args:
+            papers: Papers to find similar papers for
+            top_k: Number of top results per paper
+            filters: Optional metadata filters, applied to every paper
+            include: Stored fields to return besides id and score
+                (() skips reading metadata and documents; results then carry
+                empty "metadata" and "document")
+
+        Returns:
+            One result list per paper, in input order (same format as search_by_paper())
+
+        Example:
+            ```python
+            for paper, similar in zip(papers, db.search_by_papers(papers, top_k=5)):
+                ...
+            ```
+        """
+        if not papers:
+            return []
+
+        collection, embedder = self._active()
+
+        # Get paper embeddings
+        paper_embeddings = embedder.embed_papers(papers)
 
         # Search
-        results = self.collection.query(
-            query_embeddings=[paper_embedding.tolist()],
+        results = collection.query(
+            query_embeddings=self.backend.prepare_embeddings(paper_embeddings),
             n_results=top_k + 1,  # +1 to account for self-match
-            where=filters
+            where=filters,
+            include=["distances", *include]
         )
 
-        # Format results (exclude self)
+        return [
+            self._format_results(results, q, top_k, exclude_id=self._paper_id(paper))
+            for q, paper in enumerate(papers)
+        ]
+
+    def _format_results(
+        self,
+        results: Dict[str, Any],
+        q: int,
+        top_k: int,
+        exclude_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Format the results of one query from a collection.query() response.
+
+        Args:
+            results: Query response
+            q: Index of the query in the response
+            top_k: Maximum results to return
+            exclude_id: Paper ID to leave out (the query paper itself)
+
+        Returns:
+            List of results with id, score, metadata and document
+        """
         formatted_results = []
-        paper_id = self._paper_id(paper)
 
-        if results and results["ids"] and len(results["ids"]) > 0:
-            for i in range(len(results["ids"][0])):
-                result_id = results["ids"][0][i]
+        if not results or not results["ids"] or len(results["ids"]) <= q:
+            return formatted_results
 
-                # Skip self
-                if result_id == paper_id:
-                    continue
+        for i, result_id in enumerate(results["ids"][q]):
+            # Skip self
+            if result_id == exclude_id:
+                continue
 
-                result = {
-                    "id": result_id,
-                    "score": float(1 - results["distances"][0][i]) if "distances" in results else 1.0,
-                    "metadata": results["metadatas"][0][i] if "metadatas" in results else {},
-                    "document": results["documents"][0][i] if "documents" in results else ""
-                }
-                formatted_results.append(result)
+            result = {
+                "id": result_id,
+                "score": float(1 - results["distances"][q][i]) if results.get("distances") else 1.0,  # Convert distance to similarity
+                "metadata": results["metadatas"][q][i] if results.get("metadatas") else {},
+                "document": results["documents"][q][i] if results.get("documents") else ""
+            }
+            formatted_results.append(result)
 
-                if len(formatted_results) >= top_k:
-                    break
+            if len(formatted_results) >= top_k:
+                break
 
         return formatted_results
 
@@ -326,7 +652,10 @@ class PaperVectorDB:
             paper_id: Paper identifier
         """
         try:
-            self.collection.delete(ids=[paper_id])
+            with self._lock:
+                self.collection.delete(ids=[paper_id])
+                if self._reindex_job is not None and self._reindex_job.is_running:
+                    self._reindex_job._note_deleted(paper_id)
             logger.info(f"Deleted paper {paper_id}")
         except Exception as e:
             logger.error(f"Error deleting paper {paper_id}: {e}")
@@ -347,21 +676,89 @@ class PaperVectorDB:
         Returns:
             Dictionary with stats
         """
-        return {
+        # Stats must not load the model: fall back to a stored vector's size
+        embedding_dim = self.embedder.known_embedding_dim
+        if embedding_dim is None:
+            stored = self.collection.get(limit=1, include=["embeddings"])
+            if stored["ids"]:
+                embedding_dim = len(stored["embeddings"][0])
+
+        stats = {
             "collection_name": self.collection_name,
             "paper_count": self.count(),
-            "embedding_dim": self.embedder.embedding_dim
+            "embedding_dim": embedding_dim,
+            "embedding_model": self.embedding_model,
+            **self.backend.describe()
         }
+        if self._reindex_job is not None:
+            stats["reindex"] = self._reindex_job.progress
+        return stats
+
+    def flush(self):
+        """Persist buffered index state (FAISS snapshot; no-op for Chroma)."""
+        with self._lock:
+            self.backend.flush()
 
     def clear(self):
         """Clear all papers from the database."""
-        self.client.delete_collection(name=self.collection_name)
-        self.collection = self.client.create_collection(
-            name=self.collection_name,
-            metadata={"hnsw:space": "cosine"}
-        )
+        if self._reindex_job is not None and self._reindex_job.is_running:
+            self._reindex_job.cancel()
+            self._reindex_job.wait()
+
+        with self._lock:
+            physical_name = self.collection.name
+            self.backend.delete_collection(physical_name)
+            self.collection = self._create_collection(physical_name, self.embedder)
         logger.info(f"Cleared collection: {self.collection_name}")
 
+    def reindex(
+        self,
+        embedder: Union[str, PaperEmbedder],
+        background: bool = True,
+        batch_size: int = 256,
+        keep_old: bool = False
+    ) -> "ReindexJob":
+        """
+        Rebuild the collection with a different embedding model.
+
+        A shadow collection is filled with the new model's embeddings of the
+        stored documents while searches keep using the current collection.
+        Papers added or deleted meanwhile are applied to both. When the
+        shadow is complete, the logical collection name is switched to it
+        in one step and later reads and writes use the new model.
+
+        Args:
+            embedder: Target embedder or registry/model name (e.g. "specter2")
+            background: Run in a background thread (else block until done)
+            batch_size: Papers per read/embed/write step
+            keep_old: Keep the old collection after the swap
+
+        Returns:
+            The ReindexJob (wait() on it, or poll progress)
+
+        Raises:
+            ValueError: If a re-index is already running
+
+        Example:
+            ```python
+            job = db.reindex("minilm")
+            ...  # db.search() keeps serving SPECTER results
+            job.wait()
+            print(db.embedding_model)  # sentence-transformers/all-MiniLM-L6-v2@default
+            ```
+        """
+        with self._lock:
+            if self._reindex_job is not None and self._reindex_job.is_running:
+                raise ValueError(f"A re-index of {self.collection_name!r} is already running")
+            job = ReindexJob(self, _resolve_embedder(embedder), batch_size=batch_size, keep_old=keep_old)
+            self._reindex_job = job
+
+        if background:
+            job.start()
+        else:
+            job.run()
+        return job
+
     def _paper_id(self, paper: PaperMetadata) -> str:
         """
         Generate unique ID for a paper.
@@ -378,7 +775,7 @@ class PaperVectorDB:
 
     def _paper_metadata(self, paper: PaperMetadata) -> Dict[str, Any]:
         """
-        Extract metadata for ChromaDB storage.
+        Extract metadata for vector DB storage.
 
         Args:
             paper: PaperMetadata object
@@ -391,7 +788,8 @@ class PaperVectorDB:
             "title": paper.title[:500] if paper.title else "",  # ChromaDB has size limits
             "year": paper.year or 0,
             "citation_count": paper.citation_count,
-            "domain": paper.fields[0] if paper.fields else "unknown"
+            "domain": paper.fields[0] if paper.fields else "unknown",
+            "content_hash": self._content_hash(paper)
         }
 
         # Add identifiers
@@ -404,28 +802,210 @@ class PaperVectorDB:
 
         return metadata
 
+    def _content_hash(self, paper: PaperMetadata) -> str:
+        """Hash of the embedded text (the stored document)."""
+        return self._text_hash(self._paper_document(paper))
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
     def _paper_document(self, paper: PaperMetadata) -> str:
         """
         Create document text for storage.
 
+        The document is exactly the text the embedder encodes (title [SEP]
+        full abstract), so a re-index can re-embed it and get the vector
+        add_papers would have written.
+
         Args:
             paper: PaperMetadata object
 
         Returns:
             Document string
         """
-        # Store title + abstract
-        parts = []
+        return self.embedder._paper_to_text(paper)
+
+
+class ReindexJob:
+    """
+    Background rebuild of a PaperVectorDB collection with a new model.
+
+    Created by PaperVectorDB.reindex(). States: "pending", "running",
+    "completed", "failed", "cancelled".
+
+    The swap is atomic within this process and for the alias file;
+    other processes that already opened the collection keep using the
+    old one until they reopen it (or forever, if it is kept).
+    """
+
+    def __init__(self, db: PaperVectorDB, embedder: PaperEmbedder, batch_size: int = 256, keep_old: bool = False):
+        self.db = db
+        self.embedder = embedder
+        self.batch_size = batch_size
+        self.keep_old = keep_old
+
+        self.source_model = db.embedding_model
+        self.target_model = embedder.version_tag
+        tag_hash = hashlib.sha1(self.target_model.encode("utf-8")).hexdigest()[:8]
+        self.shadow_name = f"{db.collection_name}-{tag_hash}-{int(time.time())}"
+
+        self.state = "pending"
+        self.error: Optional[str] = None
+        self.total = 0
+        self.done = 0
+
+        # Writes to the live collection during the rebuild (guarded by db._lock)
+        self._pending: Set[str] = set()
+        self._deleted: Set[str] = set()
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._shadow = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.state in ("pending", "running")
+
+    @property
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "source_model": self.source_model,
+            "target_model": self.target_model,
+            "done": self.done,
+            "total": self.total,
+            "error": self.error
+        }
+
+    def start(self):
+        """Run the job in a daemon thread."""
+        self._thread = threading.Thread(target=self.run, name=f"reindex-{self.db.collection_name}", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job ends; returns False on timeout."""
+        return self._finished.wait(timeout)
+
+    def cancel(self):
+        """Stop the job; the shadow collection is dropped and nothing is swapped."""
+        self._cancel.set()
+
+    def run(self):
+        """Build the shadow collection and swap it in."""
+        self.state = "running"
+        logger.info(
+            f"Re-indexing {self.db.collection_name!r}: {self.source_model} -> {self.target_model}"
+        )
+        try:
+            self._shadow = self.db._create_collection(self.shadow_name, self.embedder)
+
+            source = self.db.collection
+            ids = source.get(include=[])["ids"]
+            self.total = len(ids)
+            for i in range(0, len(ids), self.batch_size):
+                if self._cancel.is_set():
+                    break
+                self._copy(source, ids[i:i + self.batch_size])
+                self.done = min(i + self.batch_size, len(ids))
+
+            # Catch up with papers added meanwhile; the last round runs under
+            # the lock together with the swap so no write is missed
+            while not self._cancel.is_set():
+                with self.db._lock:
+                    pending = list(self._pending)
+                    self._pending.clear()
+                    if len(pending) <= self.batch_size:
+                        self._copy(source, pending)
+                        self._swap(source)
+                        return
+                self._copy(source, pending)
+
+            self.state = "cancelled"
+            self._drop_shadow()
+            logger.info(f"Cancelled re-index of {self.db.collection_name!r}")
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            self._drop_shadow()
+            logger.error(f"Re-index of {self.db.collection_name!r} failed: {e}")
+        finally:
+            self._finished.set()
+
+    def _copy(self, source, ids: List[str]):
+        """Re-embed stored documents of ids into the shadow collection."""
+        if not ids:
+            return
+        result = source.get(ids=ids, include=["metadatas", "documents"])
+        if not result["ids"]:
+            return
+        documents = result["documents"]
+        embeddings = self.embedder._embed_texts(documents, 32, False)
+
+        # Rows written before documents held the full embedded text (the
+        # abstract was cut at 1000 chars) lose their content hash, so the
+        # next add_papers of the paper re-embeds it from the full abstract
+        metadatas = [
+            metadata if metadata.get("content_hash") == self.db._text_hash(document)
+            else {key: value for key, value in metadata.items() if key != "content_hash"}
+            for metadata, document in zip(result["metadatas"], documents)
+        ]
+
+        with self.db._lock:
+            keep = [i for i, paper_id in enumerate(result["ids"]) if paper_id not in self._deleted]
+            if keep:
+                self._shadow.upsert(
+                    ids=[result["ids"][i] for i in keep],
+                    embeddings=self.db.backend.prepare_embeddings(embeddings[keep]),
+                    metadatas=[metadatas[i] for i in keep],
+                    documents=[result["documents"][i] for i in keep]
+                )
+
+    def _swap(self, source):
+        """Point the logical name at the shadow collection (caller holds db._lock)."""
+        db = self.db
+        db._save_alias(self.shadow_name)
+        db.collection = self._shadow
+        db.embedder = self.embedder
+        db.backend.flush()
+        self.state = "completed"
+        self.done = self.total
+        logger.info(
+            f"Swapped {db.collection_name!r} to {self.shadow_name} ({self.target_model}, "
+            f"{self._shadow.count()} papers)"
+        )
+
+        if not self.keep_old:
+            try:
+                db.backend.delete_collection(source.name)
+            except Exception as e:
+                logger.warning(f"Could not delete old collection {source.name}: {e}")
+
+    def _drop_shadow(self):
+        if self._shadow is not None:
+            try:
+                self.db.backend.delete_collection(self.shadow_name)
+            except Exception:
+                pass
+
+    def _note_added(self, ids: List[str]):
+        """Record papers written to the live collection (caller holds db._lock)."""
+        self._pending.update(ids)
+        self._deleted.difference_update(ids)
 
-        if paper.title:
-            parts.append(paper.title)
+    def _note_deleted(self, paper_id: str):
+        """Mirror a delete to the shadow collection (caller holds db._lock)."""
+        self._pending.discard(paper_id)
+        self._deleted.add(paper_id)
+        if self._shadow is not None:
+            self._shadow.delete(ids=[paper_id])
 
-        if paper.abstract:
-            # Truncate abstract if too long
-            abstract = paper.abstract[:1000] + "..." if len(paper.abstract) > 1000 else paper.abstract
-            parts.append(abstract)
 
-        return " [SEP] ".join(parts)
+def _resolve_embedder(embedder: Optional[Union[str, PaperEmbedder]]) -> PaperEmbedder:
+    """An embedder instance from an instance, registry/model name, or the config default."""
+    if isinstance(embedder, PaperEmbedder):
+        return embedder
+    return get_embedder(embedder)
 
 
 # Singleton vector database instance
@@ -435,7 +1015,9 @@ _vector_db: Optional[PaperVectorDB] = None
 def get_vector_db(
     collection_name: str = "papers",
     persist_directory: Optional[str] = None,
-    reset: bool = False
+    reset: bool = False,
+    embedder: Optional[Union[str, PaperEmbedder]] = None,
+    backend: Optional[str] = None
 ) -> PaperVectorDB:
     """
     Get or create the singleton vector database instance.
@@ -444,6 +1026,8 @@ def get_vector_db(
         collection_name: Collection name
         persist_directory: Persistence directory
         reset: Whether to reset the collection
+        embedder: Embedder or registry/model name (used when creating the instance)
+        backend: Storage backend, "chroma" or "faiss" (default: from config)
 
     Returns:
         PaperVectorDB instance
@@ -453,7 +1037,9 @@ def get_vector_db(
         _vector_db = PaperVectorDB(
             collection_name=collection_name,
             persist_directory=persist_directory,
-            reset=reset
+            reset=reset,
+            embedder=embedder,
+            backend=backend
         )
     return _vector_db
 
@@ -8,35 +8,86 @@ Provides:
 - PDF download and extraction
 - Unified literature search
 - Citation/reference helpers
+- Sparse citation analytics and distance queries
+- Reference mining from extracted full texts
 - Disk-based caching
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from evoverse.literature.base_client import (
     BaseLiteratureClient,
     PaperMetadata,
     PaperSource,
     Author
 )
-from evoverse.literature.cache import (
-    LiteratureCache,
-    get_cache,
-    reset_cache
-)
-from evoverse.literature.arxiv_client import ArxivClient
-from evoverse.literature.semantic_scholar import SemanticScholarClient
-from evoverse.literature.pubmed_client import PubMedClient
-from evoverse.literature.pdf_extractor import (
-    PDFExtractor,
-    get_pdf_extractor,
-    reset_pdf_extractor
-)
-from evoverse.literature.unified_search import UnifiedLiteratureSearch
-from evoverse.literature.citations import (
-    CitationFormatter,
-    papers_to_bibtex,
-    papers_to_ris
-)
-from evoverse.literature.reference_manager import ReferenceManager
+
+if TYPE_CHECKING:
+    from evoverse.literature.cache import (
+        LiteratureCache,
+        get_cache,
+        reset_cache
+    )
+    from evoverse.literature.arxiv_client import ArxivClient
+    from evoverse.literature.semantic_scholar import SemanticScholarClient
+    from evoverse.literature.pubmed_client import PubMedClient
+    from evoverse.literature.pdf_store import PDFStore
+    from evoverse.literature.text_cache import ExtractedTextCache
+    from evoverse.literature.sections import (
+        StructuredDocument,
+        DocumentSection,
+        select_sections
+    )
+    from evoverse.literature.pdf_extractor import (
+        PDFExtractor,
+        get_pdf_extractor,
+        reset_pdf_extractor
+    )
+    from evoverse.literature.unified_search import UnifiedLiteratureSearch
+    from evoverse.literature.citations import (
+        CitationFormatter,
+        papers_to_bibtex,
+        papers_to_ris
+    )
+    from evoverse.literature.citation_matrix import CitationMatrix
+    from evoverse.literature.citation_distance import CitationDistanceIndex
+    from evoverse.literature.reference_manager import ReferenceManager
+    from evoverse.literature.reference_mining import (
+        IdentifierIndex,
+        ReferenceMiner,
+        parse_references
+    )
+
+# Everything except the core data types is imported on first attribute
+# access (PEP 562): PaperMetadata users should not pay for PDF parsing,
+# scipy and networkx at import time.
+_LAZY_IMPORTS = {
+    "LiteratureCache": "evoverse.literature.cache",
+    "get_cache": "evoverse.literature.cache",
+    "reset_cache": "evoverse.literature.cache",
+    "ArxivClient": "evoverse.literature.arxiv_client",
+    "SemanticScholarClient": "evoverse.literature.semantic_scholar",
+    "PubMedClient": "evoverse.literature.pubmed_client",
+    "PDFStore": "evoverse.literature.pdf_store",
+    "ExtractedTextCache": "evoverse.literature.text_cache",
+    "StructuredDocument": "evoverse.literature.sections",
+    "DocumentSection": "evoverse.literature.sections",
+    "select_sections": "evoverse.literature.sections",
+    "PDFExtractor": "evoverse.literature.pdf_extractor",
+    "get_pdf_extractor": "evoverse.literature.pdf_extractor",
+    "reset_pdf_extractor": "evoverse.literature.pdf_extractor",
+    "UnifiedLiteratureSearch": "evoverse.literature.unified_search",
+    "CitationFormatter": "evoverse.literature.citations",
+    "papers_to_bibtex": "evoverse.literature.citations",
+    "papers_to_ris": "evoverse.literature.citations",
+    "CitationMatrix": "evoverse.literature.citation_matrix",
+    "CitationDistanceIndex": "evoverse.literature.citation_distance",
+    "ReferenceManager": "evoverse.literature.reference_manager",
+    "IdentifierIndex": "evoverse.literature.reference_mining",
+    "ReferenceMiner": "evoverse.literature.reference_mining",
+    "parse_references": "evoverse.literature.reference_mining",
+}
 
 __all__ = [
     "BaseLiteratureClient",
@@ -49,12 +100,35 @@ __all__ = [
     "ArxivClient",
     "SemanticScholarClient",
     "PubMedClient",
+    "PDFStore",
+    "ExtractedTextCache",
     "PDFExtractor",
+    "StructuredDocument",
+    "DocumentSection",
+    "select_sections",
     "get_pdf_extractor",
     "reset_pdf_extractor",
     "UnifiedLiteratureSearch",
     "CitationFormatter",
     "papers_to_bibtex",
     "papers_to_ris",
+    "CitationMatrix",
+    "CitationDistanceIndex",
     "ReferenceManager",
+    "IdentifierIndex",
+    "ReferenceMiner",
+    "parse_references",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -73,6 +73,7 @@ class PaperMetadata:
 
     # Full text (if downloaded)
     full_text: Optional[str] = None
+    sections: Optional[List[Dict[str, Any]]] = None  # Section spans within full_text (name/start/end/pages)
 
     # Raw response from API (for debugging)
     raw_data: Optional[Dict[str, Any]] = None
@@ -87,6 +88,8 @@ class PaperMetadata:
             self.keywords = []
         if self.references is None:
             self.references = []
+        if self.sections is None:
+            self.sections = []
 
     @property
     def primary_identifier(self) -> str:
@@ -122,6 +125,7 @@ class PaperMetadata:
             "fields": self.fields,
             "keywords": self.keywords,
             "full_text": self.full_text,
+            "sections": self.sections,
             "references": self.references,
         }
 
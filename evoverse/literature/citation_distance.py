@@ -0,0 +1,403 @@
+"""
+Citation distance queries.
+
+Answers "how is paper A connected to paper B" over a CitationMatrix:
+- Bidirectional BFS shortest paths on compact adjacency lists
+- Optional landmark distance oracle (precomputed, saved to disk) giving
+  distance bounds in O(landmarks) and capping the BFS depth
+- Depth- and fan-out-bounded neighbourhood traversal
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csgraph
+
+from evoverse.literature.citation_matrix import CitationMatrix
+
+logger = logging.getLogger(__name__)
+
+_UNREACHABLE = -1
+
+
+class CitationDistanceIndex:
+    """
+    Shortest-path and bounded traversal queries over a citation matrix.
+
+    Adjacency is held as plain Python lists of the CSR arrays (fastest to
+    index from Python); per-query state is dictionaries touched only for
+    visited papers, so a query costs what it explores, not O(papers).
+    The index reflects the matrix at construction time.
+    """
+
+    def __init__(self, matrix: CitationMatrix):
+        """
+        Initialize the distance index.
+
+        Args:
+            matrix: Citation matrix
+
+        Example:
+            ```python
+            index = CitationDistanceIndex(matrix)
+            path = index.shortest_path("arxiv:1706.03762", "doi:10.1000/xyz")
+            ```
+        """
+        self.matrix = matrix
+        adjacency = matrix.adjacency
+        transpose = matrix.transpose
+        self._out_ptr = adjacency.indptr.tolist()
+        self._out_idx = adjacency.indices.tolist()
+        self._in_ptr = transpose.indptr.tolist()
+        self._in_idx = transpose.indices.tolist()
+        self._in_degree: Optional[np.ndarray] = None
+
+        # Landmark oracle: (landmark node indices, dist from landmark, dist to landmark)
+        self._landmarks: Optional[np.ndarray] = None
+        self._from_landmark: Optional[np.ndarray] = None
+        self._to_landmark: Optional[np.ndarray] = None
+
+    # ==================== Shortest paths ====================
+
+    def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        directed: bool = True,
+        max_depth: Optional[int] = None
+    ) -> Optional[List[str]]:
+        """
+        Find a shortest citation path by bidirectional BFS.
+
+        Args:
+            source_id: Start paper ID
+            target_id: End paper ID
+            directed: Follow citations only in the citing -> cited direction
+            max_depth: Give up beyond this many hops (default: landmark
+                upper bound if available, otherwise unbounded)
+
+        Returns:
+            List of paper IDs from source to target, or None if no path exists
+        """
+        index = self.matrix.index
+        source = index.get(source_id)
+        target = index.get(target_id)
+        if source is None or target is None:
+            return None
+        if source == target:
+            return [source_id]
+
+        if self._landmarks is not None:
+            lower, upper = self._bounds(source, target, directed)
+            if lower is None:
+                return None
+            if upper is not None:
+                max_depth = upper if max_depth is None else min(max_depth, upper)
+
+        path = self._bidirectional_bfs(source, target, directed, max_depth)
+        if path is None:
+            return None
+        ids = self.matrix.ids
+        return [ids[i] for i in path]
+
+    def distance(
+        self,
+        source_id: str,
+        target_id: str,
+        directed: bool = True,
+        max_depth: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Number of citation hops between two papers.
+
+        Args:
+            source_id: Start paper ID
+            target_id: End paper ID
+            directed: Follow citations only in the citing -> cited direction
+            max_depth: Give up beyond this many hops
+
+        Returns:
+            Hop count, or None if no path exists (within max_depth)
+        """
+        path = self.shortest_path(source_id, target_id, directed, max_depth)
+        return None if path is None else len(path) - 1
+
+    def _neighbors(self, node: int, forward: bool, directed: bool) -> List[int]:
+        """Neighbors in the search direction (both directions when undirected)."""
+        if directed:
+            if forward:
+                return self._out_idx[self._out_ptr[node]:self._out_ptr[node + 1]]
+            return self._in_idx[self._in_ptr[node]:self._in_ptr[node + 1]]
+        return (
+            self._out_idx[self._out_ptr[node]:self._out_ptr[node + 1]]
+            + self._in_idx[self._in_ptr[node]:self._in_ptr[node + 1]]
+        )
+
+    def _bidirectional_bfs(
+        self,
+        source: int,
+        target: int,
+        directed: bool,
+        max_depth: Optional[int]
+    ) -> Optional[List[int]]:
+        """Alternate BFS levels from both ends, always expanding the smaller frontier."""
+        forward_parent: Dict[int, int] = {source: source}
+        backward_parent: Dict[int, int] = {target: target}
+        forward_frontier = [source]
+        backward_frontier = [target]
+        depth = 0
+
+        while forward_frontier and backward_frontier:
+            if max_depth is not None and depth >= max_depth:
+                return None
+            depth += 1
+
+            expand_forward = len(forward_frontier) <= len(backward_frontier)
+            if expand_forward:
+                frontier, parent, other = forward_frontier, forward_parent, backward_parent
+            else:
+                frontier, parent, other = backward_frontier, backward_parent, forward_parent
+
+            next_frontier = []
+            meeting = None
+            for node in frontier:
+                for neighbor in self._neighbors(node, expand_forward, directed):
+                    if neighbor in parent:
+                        continue
+                    parent[neighbor] = node
+                    if neighbor in other:
+                        meeting = neighbor
+                        break
+                    next_frontier.append(neighbor)
+                if meeting is not None:
+                    break
+
+            if meeting is not None:
+                return self._join_path(meeting, forward_parent, backward_parent)
+
+            if expand_forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        return None
+
+    @staticmethod
+    def _join_path(meeting: int, forward_parent: Dict[int, int], backward_parent: Dict[int, int]) -> List[int]:
+        """Concatenate the two half paths at the meeting node."""
+        path = [meeting]
+        node = meeting
+        while forward_parent[node] != node:
+            node = forward_parent[node]
+            path.append(node)
+        path.reverse()
+
+        node = meeting
+        while backward_parent[node] != node:
+            node = backward_parent[node]
+            path.append(node)
+        return path
+
+    # ==================== Bounded traversal ====================
+
+    def neighborhood(
+        self,
+        paper_id: str,
+        max_depth: int = 2,
+        direction: str = "out",
+        max_fanout: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        Papers within a number of citation hops.
+
+        Args:
+            paper_id: Start paper ID
+            max_depth: Maximum hops
+            direction: "out" (cited papers), "in" (citing papers) or "both"
+            max_fanout: Expand at most this many neighbors per paper, most
+                cited first (default: all)
+            limit: Maximum papers returned (default: all)
+
+        Returns:
+            List of (paper_id, depth) in BFS order, start paper excluded
+        """
+        if direction not in ("out", "in", "both"):
+            raise ValueError(f"Unsupported direction: {direction}")
+
+        start = self.matrix.index.get(paper_id)
+        if start is None:
+            return []
+
+        if max_fanout is not None and self._in_degree is None:
+            self._in_degree = np.diff(np.asarray(self._in_ptr))
+
+        seen = {start}
+        frontier = [start]
+        results: List[Tuple[int, int]] = []
+        for depth in range(1, max_depth + 1):
+            next_frontier = []
+            for node in frontier:
+                neighbors = self._neighbors(node, direction != "in", direction != "both")
+                if max_fanout is not None and len(neighbors) > max_fanout:
+                    neighbors = sorted(neighbors, key=lambda n: -self._in_degree[n])[:max_fanout]
+                for neighbor in neighbors:
+                    if neighbor in seen:
+                        continue
+                    seen.add(neighbor)
+                    next_frontier.append(neighbor)
+                    results.append((neighbor, depth))
+                    if limit is not None and len(results) >= limit:
+                        return self._with_ids(results)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return self._with_ids(results)
+
+    def _with_ids(self, results: List[Tuple[int, int]]) -> List[Tuple[str, int]]:
+        """Map node indices to paper IDs."""
+        ids = self.matrix.ids
+        return [(ids[node], depth) for node, depth in results]
+
+    # ==================== Landmark oracle ====================
+
+    def build_landmarks(self, num_landmarks: int = 16):
+        """
+        Precompute BFS distances from and to landmark papers.
+
+        Landmarks are the highest total-degree papers, which lie on many
+        shortest paths in citation graphs. Cost is 2 BFS sweeps per landmark;
+        memory is 2 * num_landmarks * papers int32 values. Save the result
+        with ``save_landmarks`` to reuse it across processes.
+
+        Args:
+            num_landmarks: Number of landmarks
+        """
+        n = self.matrix.num_nodes
+        num_landmarks = min(num_landmarks, n)
+        degree = np.diff(np.asarray(self._out_ptr)) + np.diff(np.asarray(self._in_ptr))
+        landmarks = np.argsort(-degree, kind="stable")[:num_landmarks]
+
+        from_landmark = self._landmark_distances(self.matrix.adjacency, landmarks)
+        to_landmark = self._landmark_distances(self.matrix.transpose, landmarks)
+
+        self._landmarks = landmarks
+        self._from_landmark = from_landmark
+        self._to_landmark = to_landmark
+        logger.info(f"Built {num_landmarks} citation distance landmarks over {n} papers")
+
+    @staticmethod
+    def _landmark_distances(adjacency, landmarks: np.ndarray) -> np.ndarray:
+        """Hop counts from each landmark (int32, -1 when unreachable)."""
+        distances = csgraph.shortest_path(adjacency, method="D", unweighted=True, indices=landmarks)
+        unreachable = np.isinf(distances)
+        distances[unreachable] = _UNREACHABLE
+        return distances.astype(np.int32)
+
+    def estimate_distance(
+        self,
+        source_id: str,
+        target_id: str,
+        directed: bool = True
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Bound the distance between two papers from the landmark oracle.
+
+        Args:
+            source_id: Start paper ID
+            target_id: End paper ID
+            directed: Directed (citing -> cited) distance; undirected
+                queries only get an upper bound
+
+        Returns:
+            Tuple of (lower bound, upper bound); upper is None when no
+            landmark connects the papers, lower is None when the target is
+            provably unreachable
+        """
+        if self._landmarks is None:
+            raise RuntimeError("Landmarks not built; call build_landmarks or load_landmarks first")
+
+        index = self.matrix.index
+        source = index.get(source_id)
+        target = index.get(target_id)
+        if source is None or target is None:
+            return None, None
+        return self._bounds(source, target, directed)
+
+    def _bounds(self, source: int, target: int, directed: bool) -> Tuple[Optional[int], Optional[int]]:
+        """Landmark lower/upper distance bounds for node indices."""
+        to_source = self._to_landmark[:, source]  # d(source, L)
+        from_source = self._from_landmark[:, source]  # d(L, source)
+        to_target = self._to_landmark[:, target]  # d(target, L)
+        from_target = self._from_landmark[:, target]  # d(L, target)
+
+        if directed:
+            # source -> L -> target
+            via = (to_source >= 0) & (from_target >= 0)
+            upper = int((to_source[via] + from_target[via]).min()) if via.any() else None
+
+            # Triangle inequality: d(s,t) >= d(L,t) - d(L,s) and >= d(s,L) - d(t,L)
+            lower = 0
+            both_from = (from_source >= 0) & (from_target >= 0)
+            if both_from.any():
+                lower = max(lower, int((from_target[both_from] - from_source[both_from]).max()))
+            both_to = (to_source >= 0) & (to_target >= 0)
+            if both_to.any():
+                lower = max(lower, int((to_source[both_to] - to_target[both_to]).max()))
+
+            # L reaches source but not target: source cannot reach target either
+            if ((from_source >= 0) & (from_target < 0)).any():
+                return None, None
+            # Target reaches L but source does not: same argument
+            if ((to_target >= 0) & (to_source < 0)).any():
+                return None, None
+            return max(lower, 1 if source != target else 0), upper
+
+        # Undirected: path via a landmark in either orientation bounds from above
+        candidates = []
+        for a, b in ((to_source, from_target), (from_source, to_target),
+                     (to_source, to_target), (from_source, from_target)):
+            via = (a >= 0) & (b >= 0)
+            if via.any():
+                candidates.append(int((a[via] + b[via]).min()))
+        return 1 if source != target else 0, min(candidates) if candidates else None
+
+    def save_landmarks(self, path: str):
+        """
+        Save the landmark oracle to a directory.
+
+        Args:
+            path: Target directory
+        """
+        if self._landmarks is None:
+            raise RuntimeError("Landmarks not built; call build_landmarks first")
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "landmarks.npy", self._landmarks)
+        np.save(directory / "from_landmark.npy", self._from_landmark)
+        np.save(directory / "to_landmark.npy", self._to_landmark)
+
+    def load_landmarks(self, path: str, mmap: bool = True):
+        """
+        Load a landmark oracle saved with ``save_landmarks``.
+
+        The oracle must have been built over the same matrix (same paper order).
+
+        Args:
+            path: Directory passed to ``save_landmarks``
+            mmap: Memory-map the distance tables instead of reading them
+        """
+        directory = Path(path)
+        mmap_mode = "r" if mmap else None
+        from_landmark = np.load(directory / "from_landmark.npy", mmap_mode=mmap_mode)
+        if from_landmark.shape[1] != self.matrix.num_nodes:
+            raise ValueError(
+                f"Landmark tables cover {from_landmark.shape[1]} papers, "
+                f"matrix has {self.matrix.num_nodes}"
+            )
+        self._landmarks = np.load(directory / "landmarks.npy")
+        self._from_landmark = from_landmark
+        self._to_landmark = np.load(directory / "to_landmark.npy", mmap_mode=mmap_mode)
@@ -0,0 +1,648 @@
+"""
+Sparse citation analytics.
+
+Stores the citation graph as a scipy.sparse CSR adjacency matrix
+(``A[i, j] = 1`` when paper i cites paper j) and provides:
+- Power-iteration PageRank, warm-started after incremental edge additions
+- HITS hub/authority scores
+- Betweenness centrality, exact or by k-pivot sampling, across processes
+- In/out degree
+- Co-citation and bibliographic-coupling counts as sparse products
+- On-disk persistence (memory-mapped reload)
+"""
+
+import json
+import logging
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+logger = logging.getLogger(__name__)
+
+_EXACT_BETWEENNESS_MAX_NODES = 5000  # Without a time budget, exact up to this size
+_DEFAULT_PIVOTS = 1000  # Without a time budget, pivots sampled above it
+_CALIBRATION_PIVOTS = 16  # Sources timed to estimate per-source cost
+_PARALLEL_MIN_SOURCES = 64  # Below this, one process beats pool startup
+
+# CSR arrays (as lists) of the graph being processed by a pool worker
+_worker_graph: Optional[Tuple[List[int], List[int]]] = None
+
+
+def _init_betweenness_worker(indptr: List[int], indices: List[int]):
+    """Pool initializer: receive the graph once per worker process."""
+    global _worker_graph
+    _worker_graph = (indptr, indices)
+
+
+def _betweenness_worker(sources: List[int]) -> np.ndarray:
+    """Accumulate dependencies from sources on the worker's graph."""
+    indptr, indices = _worker_graph
+    return _accumulate_dependencies(indptr, indices, sources)
+
+
+def _accumulate_dependencies(indptr: List[int], indices: List[int], sources: Iterable[int]) -> np.ndarray:
+    """
+    Sum Brandes dependencies ``delta_s(v)`` over the given sources.
+
+    Unweighted BFS per source; predecessors are recovered from the distance
+    labels during back-propagation, so no per-source predecessor lists are built.
+    State arrays are reset only for visited nodes.
+
+    Args:
+        indptr: CSR row pointer as a list
+        indices: CSR column indices as a list
+        sources: Source node indices
+
+    Returns:
+        float64 array of summed dependencies (endpoints excluded)
+    """
+    n = len(indptr) - 1
+    betweenness = [0.0] * n
+    dist = [-1] * n
+    sigma = [0] * n
+    delta = [0.0] * n
+
+    for s in sources:
+        dist[s] = 0
+        sigma[s] = 1
+        order = [s]
+        # order grows while iterated: BFS queue and visit order in one list
+        for v in order:
+            next_dist = dist[v] + 1
+            sigma_v = sigma[v]
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if dist[w] < 0:
+                    dist[w] = next_dist
+                    order.append(w)
+                if dist[w] == next_dist:
+                    sigma[w] += sigma_v
+
+        for v in reversed(order):
+            next_dist = dist[v] + 1
+            coeff = 0.0
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if dist[w] == next_dist:
+                    coeff += (1.0 + delta[w]) / sigma[w]
+            delta[v] = sigma[v] * coeff
+            if v != s:
+                betweenness[v] += delta[v]
+
+        for v in order:
+            dist[v] = -1
+            sigma[v] = 0
+            delta[v] = 0.0
+
+    return np.asarray(betweenness)
+
+
+class CitationMatrix:
+    """
+    Citation graph as a CSR adjacency matrix.
+
+    Nodes are paper IDs mapped to dense row indices in insertion order.
+    Added edges are buffered and merged into the matrix on the next query,
+    so bulk loading through repeated ``add_edges`` calls stays cheap.
+    """
+
+    _META_FILE = "meta.json"
+
+    def __init__(self, node_ids: Optional[Iterable[str]] = None):
+        """
+        Initialize an empty citation matrix.
+
+        Args:
+            node_ids: Initial paper IDs
+
+        Example:
+            ```python
+            matrix = CitationMatrix.from_edges(edges)
+            for paper_id, score in matrix.top_k(matrix.pagerank(), 10):
+                print(paper_id, score)
+            ```
+        """
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._adjacency = sp.csr_matrix((0, 0), dtype=np.int32)
+        self._transpose: Optional[sp.csr_matrix] = None
+        self._pending_rows: List[int] = []
+        self._pending_cols: List[int] = []
+
+        # Bumped on every structural change; derived data is keyed on it
+        self.version = 0
+        self._pagerank: Optional[np.ndarray] = None
+        self._pagerank_version = -1
+
+        if node_ids is not None:
+            self.add_nodes(node_ids)
+
+    # ==================== Construction ====================
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[str, str]],
+        node_ids: Optional[Iterable[str]] = None
+    ) -> "CitationMatrix":
+        """
+        Build a matrix from (citing_id, cited_id) edges.
+
+        Args:
+            edges: Citation edges
+            node_ids: Additional paper IDs (e.g. papers without citations)
+
+        Returns:
+            CitationMatrix
+        """
+        matrix = cls(node_ids)
+        matrix.add_edges(edges)
+        return matrix
+
+    @classmethod
+    def from_graph(cls, graph) -> "CitationMatrix":
+        """
+        Build a matrix from a NetworkX directed citation graph.
+
+        Args:
+            graph: NetworkX DiGraph (as built by CitationNetwork)
+
+        Returns:
+            CitationMatrix
+        """
+        return cls.from_edges(graph.edges(), node_ids=graph.nodes())
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of papers."""
+        return len(self.ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of citation edges."""
+        return int(self.adjacency.nnz)
+
+    @property
+    def adjacency(self) -> sp.csr_matrix:
+        """CSR adjacency matrix (citing rows, cited columns)."""
+        self._flush()
+        return self._adjacency
+
+    @property
+    def transpose(self) -> sp.csr_matrix:
+        """CSR adjacency of the reversed graph (cited rows, citing columns)."""
+        adjacency = self.adjacency
+        if self._transpose is None:
+            self._transpose = adjacency.T.tocsr()
+        return self._transpose
+
+    def add_nodes(self, node_ids: Iterable[str]) -> int:
+        """
+        Add papers to the matrix.
+
+        Args:
+            node_ids: Paper IDs (existing IDs are ignored)
+
+        Returns:
+            Number of new papers
+        """
+        added = 0
+        for node_id in node_ids:
+            if node_id not in self.index:
+                self.index[node_id] = len(self.ids)
+                self.ids.append(node_id)
+                added += 1
+        if added:
+            self.version += 1
+        return added
+
+    def add_edges(self, edges: Iterable[Tuple[str, str]]) -> int:
+        """
+        Add citation edges, creating missing nodes.
+
+        Args:
+            edges: (citing_id, cited_id) tuples; duplicates and self-citations are ignored
+
+        Returns:
+            Number of edges buffered
+        """
+        index = self.index
+        ids = self.ids
+        rows = self._pending_rows
+        cols = self._pending_cols
+        before = len(rows)
+
+        for citing, cited in edges:
+            if not citing or not cited or citing == cited:
+                continue
+            i = index.get(citing)
+            if i is None:
+                i = index[citing] = len(ids)
+                ids.append(citing)
+            j = index.get(cited)
+            if j is None:
+                j = index[cited] = len(ids)
+                ids.append(cited)
+            rows.append(i)
+            cols.append(j)
+
+        added = len(rows) - before
+        if added or self._adjacency.shape[0] != len(ids):
+            self.version += 1
+        return added
+
+    def _flush(self):
+        """Merge buffered edges and new nodes into the CSR matrix."""
+        n = len(self.ids)
+        if not self._pending_rows and self._adjacency.shape[0] == n:
+            return
+
+        old = self._adjacency
+        if old.shape[0] != n:
+            old = sp.csr_matrix((old.data, old.indices, np.concatenate([
+                old.indptr, np.full(n - old.shape[0], old.indptr[-1], dtype=old.indptr.dtype)
+            ])), shape=(n, n))
+
+        if self._pending_rows:
+            new = sp.csr_matrix(
+                (
+                    np.ones(len(self._pending_rows), dtype=np.int32),
+                    (np.asarray(self._pending_rows), np.asarray(self._pending_cols))
+                ),
+                shape=(n, n)
+            )
+            merged = (old + new).tocsr()
+            merged.data[:] = 1
+            merged.sort_indices()
+            old = merged
+            self._pending_rows = []
+            self._pending_cols = []
+
+        self._adjacency = old
+        self._transpose = None
+
+    # ==================== Metrics ====================
+
+    def in_degree(self) -> np.ndarray:
+        """Citations received per paper."""
+        return np.diff(self.transpose.indptr)
+
+    def out_degree(self) -> np.ndarray:
+        """References made per paper."""
+        return np.diff(self.adjacency.indptr)
+
+    def pagerank(
+        self,
+        alpha: float = 0.85,
+        max_iter: int = 100,
+        tol: float = 1.0e-6,
+        warm_start: bool = True
+    ) -> np.ndarray:
+        """
+        PageRank by power iteration.
+
+        Dangling papers (no references) spread their rank uniformly, as in
+        ``networkx.pagerank``. The last result is cached; after edges are
+        added, iteration restarts from it rather than from the uniform vector,
+        which typically converges in a few iterations.
+
+        Args:
+            alpha: Damping factor
+            max_iter: Maximum iterations
+            tol: Convergence tolerance (L1 change < n * tol)
+            warm_start: Start from the previous result if available
+
+        Returns:
+            Scores indexed like ``ids`` (sum to 1)
+        """
+        adjacency = self.adjacency
+        n = self.num_nodes
+        if n == 0:
+            return np.zeros(0)
+        if self._pagerank is not None and self._pagerank_version == self.version:
+            return self._pagerank
+
+        out_degree = self.out_degree().astype(np.float64)
+        dangling = out_degree == 0
+        inv_out = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+        # Column-stochastic transition matrix, stored as CSR for fast matvec
+        transition = self.transpose.multiply(inv_out[np.newaxis, :]).tocsr()
+
+        if warm_start and self._pagerank is not None:
+            x = np.full(n, 1.0 / n)
+            x[:len(self._pagerank)] = self._pagerank[:n]
+            x /= x.sum()
+        else:
+            x = np.full(n, 1.0 / n)
+
+        for iteration in range(1, max_iter + 1):
+            previous = x
+            x = alpha * (transition @ previous + previous[dangling].sum() / n) + (1.0 - alpha) / n
+            if np.abs(x - previous).sum() < n * tol:
+                break
+        else:
+            logger.warning(f"PageRank did not converge in {max_iter} iterations")
+
+        logger.debug(f"PageRank converged in {iteration} iterations ({n} nodes)")
+
+        self._pagerank = x
+        self._pagerank_version = self.version
+        return x
+
+    def hits(self, max_iter: int = 100, tol: float = 1.0e-8) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        HITS hub and authority scores by power iteration.
+
+        Args:
+            max_iter: Maximum iterations
+            tol: Convergence tolerance (L1 change of max-normalized hub scores)
+
+        Returns:
+            Tuple of (hubs, authorities), each indexed like ``ids`` and summing to 1
+        """
+        adjacency = self.adjacency
+        transpose = self.transpose
+        n = self.num_nodes
+        if n == 0 or adjacency.nnz == 0:
+            uniform = np.full(n, 1.0 / n) if n else np.zeros(0)
+            return uniform, uniform.copy()
+
+        hubs = np.full(n, 1.0 / n)
+        authorities = hubs
+        for _ in range(max_iter):
+            previous = hubs
+            authorities = transpose @ hubs
+            authorities /= authorities.max()
+            hubs = adjacency @ authorities
+            hubs /= hubs.max()
+            if np.abs(hubs - previous).sum() < tol:
+                break
+        else:
+            logger.warning(f"HITS did not converge in {max_iter} iterations")
+
+        return hubs / hubs.sum(), authorities / authorities.sum()
+
+    def betweenness(
+        self,
+        k: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        workers: int = 1,
+        confidence: float = 0.95,
+        seed: Optional[int] = None
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Betweenness centrality (normalized as in ``networkx.betweenness_centrality``).
+
+        Exact Brandes takes one BFS per paper. Above the exact threshold only
+        ``k`` pivot sources are sampled and their dependencies scaled by n/k;
+        with probability ``confidence`` every score is then within the returned
+        error bound (Hoeffding plus a union bound over papers).
+
+        Mode selection:
+        - ``k`` given: sample k pivots (exact if k >= n)
+        - ``time_budget`` given: time a few sources, then run exact if all
+          papers fit in the budget, otherwise as many pivots as fit
+        - neither: exact up to 5000 papers, otherwise 1000 pivots
+
+        Args:
+            k: Number of pivot sources
+            time_budget: Seconds the caller is willing to spend
+            workers: Processes for the BFS sweeps (<=1 runs in-process)
+            confidence: Probability that the error bound holds
+            seed: Random seed for pivot sampling
+
+        Returns:
+            Tuple of (scores indexed like ``ids``, error bound; 0.0 when exact)
+        """
+        adjacency = self.adjacency
+        n = self.num_nodes
+        if n <= 2:
+            return np.zeros(n), 0.0
+
+        started = time.perf_counter()
+        indptr = adjacency.indptr.tolist()
+        indices = adjacency.indices.tolist()
+        rng = np.random.default_rng(seed)
+        sources = rng.permutation(n)
+        workers = max(1, workers)
+
+        done = 0
+        totals = np.zeros(n)
+        if k is not None:
+            k = max(1, min(k, n))
+        elif time_budget is not None:
+            # Calibrate: the timed sources count towards the sample
+            done = min(_CALIBRATION_PIVOTS, n)
+            totals += _accumulate_dependencies(indptr, indices, sources[:done].tolist())
+            per_source = (time.perf_counter() - started) / done
+            remaining = max(0.0, time_budget - (time.perf_counter() - started))
+            speedup = workers if n - done >= _PARALLEL_MIN_SOURCES else 1
+            k = min(n, done + int(remaining * speedup / per_source))
+        elif n <= _EXACT_BETWEENNESS_MAX_NODES:
+            k = n
+        else:
+            k = _DEFAULT_PIVOTS
+
+        totals += self._run_sources(indptr, indices, sources[done:k].tolist(), workers)
+
+        scale = 1.0 / ((n - 1) * (n - 2))
+        if k >= n:
+            error = 0.0
+        else:
+            scale *= n / k
+            error = n / (n - 1) * math.sqrt(math.log(2 * n / (1.0 - confidence)) / (2 * k))
+
+        logger.debug(
+            f"Betweenness from {k}/{n} sources in {time.perf_counter() - started:.2f}s "
+            f"(error bound {error:.4g})"
+        )
+        return totals * scale, error
+
+    def _run_sources(self, indptr: List[int], indices: List[int], sources: List[int], workers: int) -> np.ndarray:
+        """Accumulate dependencies over sources, in a process pool if worthwhile."""
+        if workers <= 1 or len(sources) < _PARALLEL_MIN_SOURCES:
+            return _accumulate_dependencies(indptr, indices, sources)
+
+        # A few chunks per worker balances uneven BFS sizes
+        chunk_size = max(1, math.ceil(len(sources) / (workers * 4)))
+        chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+        totals = np.zeros(len(indptr) - 1)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_betweenness_worker,
+            initargs=(indptr, indices)
+        ) as pool:
+            for partial in pool.map(_betweenness_worker, chunks):
+                totals += partial
+        return totals
+
+    def co_citation_matrix(self) -> sp.csr_matrix:
+        """
+        Co-citation counts for all pairs: ``C[i, j]`` is the number of papers citing both i and j.
+
+        Note: ``AᵀA`` can be much denser than A; prefer ``co_citations`` for single papers.
+        """
+        matrix = (self.transpose @ self.adjacency).tocsr()
+        matrix.setdiag(0)
+        matrix.eliminate_zeros()
+        return matrix
+
+    def coupling_matrix(self) -> sp.csr_matrix:
+        """
+        Bibliographic-coupling counts for all pairs: ``B[i, j]`` is the number of references i and j share.
+
+        Note: ``AAᵀ`` can be much denser than A; prefer ``couplings`` for single papers.
+        """
+        matrix = (self.adjacency @ self.transpose).tocsr()
+        matrix.setdiag(0)
+        matrix.eliminate_zeros()
+        return matrix
+
+    def co_citations(self, paper_id: str, top_n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Papers most often cited together with a paper.
+
+        Args:
+            paper_id: Paper ID
+            top_n: Maximum results (default: all)
+
+        Returns:
+            List of (paper_id, co-citation count), highest first
+        """
+        i = self.index.get(paper_id)
+        if i is None:
+            return []
+        transpose = self.transpose
+        citing = transpose.indices[transpose.indptr[i]:transpose.indptr[i + 1]]
+        return self._row_counts(self.adjacency, citing, i, top_n)
+
+    def couplings(self, paper_id: str, top_n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Papers sharing the most references with a paper.
+
+        Args:
+            paper_id: Paper ID
+            top_n: Maximum results (default: all)
+
+        Returns:
+            List of (paper_id, shared reference count), highest first
+        """
+        i = self.index.get(paper_id)
+        if i is None:
+            return []
+        adjacency = self.adjacency
+        cited = adjacency.indices[adjacency.indptr[i]:adjacency.indptr[i + 1]]
+        return self._row_counts(self.transpose, cited, i, top_n)
+
+    def _row_counts(
+        self,
+        matrix: sp.csr_matrix,
+        rows: np.ndarray,
+        exclude: int,
+        top_n: Optional[int]
+    ) -> List[Tuple[str, int]]:
+        """Count column occurrences over the given rows (one sparse row sum)."""
+        if len(rows) == 0:
+            return []
+        counts = np.asarray(matrix[rows].sum(axis=0)).ravel()
+        counts[exclude] = 0
+        return [(paper_id, int(count)) for paper_id, count in self.top_k(counts, top_n) if count > 0]
+
+    def top_k(self, scores: np.ndarray, k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Highest-scoring papers.
+
+        Args:
+            scores: Scores indexed like ``ids``
+            k: Number of results (default: all)
+
+        Returns:
+            List of (paper_id, score), highest first
+        """
+        if k is None or k >= len(scores):
+            order = np.argsort(-scores, kind="stable")
+        elif k <= 0:
+            return []
+        else:
+            top = np.argpartition(-scores, k - 1)[:k]
+            order = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.ids[i], scores[i].item()) for i in order]
+
+    def scores_to_dict(self, scores: np.ndarray) -> Dict[str, float]:
+        """Map a score vector to {paper_id: score}."""
+        return dict(zip(self.ids, scores.tolist()))
+
+    # ==================== Persistence ====================
+
+    def save(self, path: str):
+        """
+        Save the matrix (and cached PageRank) to a directory.
+
+        Arrays are stored as ``.npy`` files so ``load`` can memory-map them.
+
+        Args:
+            path: Target directory
+        """
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        adjacency = self.adjacency
+
+        np.save(directory / "indptr.npy", adjacency.indptr)
+        np.save(directory / "indices.npy", adjacency.indices)
+        has_pagerank = self._pagerank is not None
+        if has_pagerank:
+            np.save(directory / "pagerank.npy", self._pagerank)
+
+        # Metadata is written last; it marks the save as complete
+        meta = {
+            "ids": self.ids,
+            "pagerank_current": has_pagerank and self._pagerank_version == self.version,
+            "has_pagerank": has_pagerank,
+        }
+        tmp_path = directory / (self._META_FILE + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+        tmp_path.replace(directory / self._META_FILE)
+
+        logger.info(f"Saved citation matrix to {directory} ({self.num_nodes} nodes, {adjacency.nnz} edges)")
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "CitationMatrix":
+        """
+        Load a matrix saved with ``save``.
+
+        Args:
+            path: Directory passed to ``save``
+            mmap: Memory-map the index arrays instead of reading them
+
+        Returns:
+            CitationMatrix
+        """
+        directory = Path(path)
+        with open(directory / cls._META_FILE, 'r') as f:
+            meta = json.load(f)
+
+        mmap_mode = "r" if mmap else None
+        indptr = np.load(directory / "indptr.npy", mmap_mode=mmap_mode)
+        indices = np.load(directory / "indices.npy", mmap_mode=mmap_mode)
+
+        matrix = cls()
+        matrix.ids = meta["ids"]
+        matrix.index = {paper_id: i for i, paper_id in enumerate(matrix.ids)}
+        n = len(matrix.ids)
+        data = np.ones(len(indices), dtype=np.int32)
+        # Built directly from the arrays so they are not copied or re-validated
+        adjacency = sp.csr_matrix((n, n), dtype=np.int32)
+        adjacency.data, adjacency.indices, adjacency.indptr = data, indices, indptr
+        adjacency.has_sorted_indices = True
+        matrix._adjacency = adjacency
+
+        if meta.get("has_pagerank"):
+            matrix._pagerank = np.load(directory / "pagerank.npy")
+            matrix._pagerank_version = matrix.version if meta.get("pagerank_current") else -1
+
+        logger.info(f"Loaded citation matrix from {directory} ({n} nodes, {len(indices)} edges)")
+        return matrix
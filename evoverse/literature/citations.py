@@ -9,8 +9,12 @@ Supports:
 """
 
 import logging
+import os
 import re
-from typing import List, Dict, Any, Optional, Tuple
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
@@ -21,15 +25,169 @@ from bibtexparser.bibdatabase import BibDatabase
 import networkx as nx
 
 from evoverse.literature.base_client import PaperMetadata, Author, PaperSource
+from evoverse.literature.citation_matrix import CitationMatrix
+from evoverse.literature.citation_distance import CitationDistanceIndex
 
 logger = logging.getLogger(__name__)
 
+_BIBTEX_EXTENSIONS = {".bib", ".bibtex"}
+_RIS_END_RE = re.compile(r'ER\s*-')
+
+# Parser instance of a pool worker process
+_worker_parser: Optional["CitationParser"] = None
+
+
+def _split_bibtex(file_path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Split a BibTeX file into raw entries without parsing them.
+
+    Tracks brace depth line by line; an ``@`` in the first column always
+    starts a new entry, so one unbalanced entry cannot swallow the rest.
+
+    Yields:
+        (entry type in lowercase, entry text)
+    """
+    lines: List[str] = []
+    entry_type = ""
+    open_char, close_char = '{', '}'
+    depth = 0
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            stripped = line.lstrip()
+            if stripped.startswith('@') and (not lines or line[0] == '@'):
+                if lines:
+                    yield entry_type, "".join(lines)
+                head = re.match(r'@\s*(\w*)\s*([{(]?)', stripped)
+                entry_type = head.group(1).lower()
+                # Entries may be delimited by parentheses instead of braces
+                open_char, close_char = ('(', ')') if head.group(2) == '(' else ('{', '}')
+                lines = []
+                depth = 0
+            elif not lines:
+                # Text between entries is a comment in BibTeX
+                continue
+
+            lines.append(line)
+            depth += line.count(open_char) - line.count(close_char)
+            if depth <= 0 and close_char in line:
+                yield entry_type, "".join(lines)
+                lines = []
+
+    if lines:
+        yield entry_type, "".join(lines)
+
+
+def _bibtex_chunks(file_path: str, chunk_entries: int) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Group BibTeX entries into chunks for parsing.
+
+    Yields:
+        (``@string`` definitions seen so far, entry texts)
+    """
+    strings: List[str] = []
+    entries: List[str] = []
+    for entry_type, text in _split_bibtex(file_path):
+        if entry_type == "string":
+            strings.append(text)
+        elif entry_type not in ("comment", "preamble"):
+            entries.append(text)
+            if len(entries) >= chunk_entries:
+                yield "".join(strings), entries
+                entries = []
+    if entries:
+        yield "".join(strings), entries
+
+
+def _ris_chunks(file_path: str, chunk_entries: int) -> Iterator[List[str]]:
+    """
+    Group RIS records (terminated by ``ER  -``) into chunks for parsing.
+
+    Yields:
+        Lists of record texts
+    """
+    entries: List[str] = []
+    lines: List[str] = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if _RIS_END_RE.match(line):
+                if "".join(lines).strip():
+                    entries.append("".join(lines))
+                lines = []
+                if len(entries) >= chunk_entries:
+                    yield entries
+                    entries = []
+            else:
+                lines.append(line)
+
+    if "".join(lines).strip():
+        entries.append("".join(lines))
+    if entries:
+        yield entries
+
+
+def _get_worker_parser() -> "CitationParser":
+    """Get this process's CitationParser."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = CitationParser()
+    return _worker_parser
+
+
+def _parse_bibtex_chunk(chunk: Tuple[str, List[str]]) -> List[PaperMetadata]:
+    """
+    Parse a chunk from ``_bibtex_chunks``.
+
+    Module-level so it can be shipped to ProcessPoolExecutor workers. If the
+    chunk fails as a whole, entries are retried one by one and bad ones skipped.
+    """
+    strings, entries = chunk
+    parser = _get_worker_parser()
+
+    def load(text: str) -> List[Dict[str, Any]]:
+        return bibtexparser.loads(strings + text, BibTexParser(common_strings=True)).entries
+
+    try:
+        raw_entries = load("".join(entries))
+    except Exception as e:
+        logger.debug(f"BibTeX chunk parsing failed, retrying per entry: {e}")
+        raw_entries = []
+        for text in entries:
+            try:
+                raw_entries.extend(load(text))
+            except Exception as entry_error:
+                logger.warning(f"Skipping unparsable BibTeX entry: {entry_error}")
+
+    papers = []
+    for entry in raw_entries:
+        paper = parser._bibtex_entry_to_paper(entry)
+        if paper:
+            papers.append(paper)
+    return papers
+
+
+def _parse_ris_chunk(entries: List[str]) -> List[PaperMetadata]:
+    """
+    Parse a chunk from ``_ris_chunks``.
+
+    Module-level so it can be shipped to ProcessPoolExecutor workers.
+    """
+    parser = _get_worker_parser()
+    papers = []
+    for entry in entries:
+        paper = parser._ris_entry_to_paper(entry)
+        if paper:
+            papers.append(paper)
+    return papers
+
 
 class CitationParser:
     """
     Parse citations from various formats.
 
-    Supports BibTeX, RIS, and text extraction.
+    Supports BibTeX, RIS, and text extraction. The ``iter_*`` methods stream
+    large files: entries are split on record boundaries, parsed in chunks
+    (optionally in a process pool) and yielded in file order.
     """
 
     def __init__(self):
@@ -53,15 +211,7 @@ class CitationParser:
             ```
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as bibtex_file:
-                parser = BibTexParser(common_strings=True)
-                bib_database = bibtexparser.load(bibtex_file, parser)
-
-            papers = []
-            for entry in bib_database.entries:
-                paper = self._bibtex_entry_to_paper(entry)
-                if paper:
-                    papers.append(paper)
+            papers = list(self.iter_bibtex(file_path))
 
             logger.info(f"Parsed {len(papers)} papers from {file_path}")
             return papers
@@ -70,6 +220,37 @@ class CitationParser:
             logger.error(f"BibTeX parsing failed: {e}")
             return []
 
+    def iter_bibtex(
+        self,
+        file_path: str,
+        workers: int = 1,
+        chunk_entries: int = 500
+    ) -> Iterator[PaperMetadata]:
+        """
+        Stream papers from a BibTeX file.
+
+        Memory use is bounded by the chunks in flight, not the file size.
+
+        Args:
+            file_path: Path to .bib file
+            workers: Parsing processes (<=1 parses in-process)
+            chunk_entries: Entries per parsing chunk
+
+        Yields:
+            PaperMetadata objects in file order
+
+        Example:
+            ```python
+            for paper in parser.iter_bibtex("dump.bib", workers=4):
+                print(paper.title)
+            ```
+        """
+        yield from self._stream_chunks(
+            _bibtex_chunks(file_path, chunk_entries),
+            _parse_bibtex_chunk,
+            workers
+        )
+
     def parse_bibtex_string(self, bibtex_str: str) -> Optional[PaperMetadata]:
         """
         Parse single BibTeX entry from string.
@@ -119,18 +300,7 @@ class CitationParser:
             ```
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as ris_file:
-                ris_content = ris_file.read()
-
-            papers = []
-            # Split by ER  - (end of record)
-            entries = re.split(r'ER\s*-\s*\n', ris_content)
-
-            for entry in entries:
-                if entry.strip():
-                    paper = self._ris_entry_to_paper(entry)
-                    if paper:
-                        papers.append(paper)
+            papers = list(self.iter_ris(file_path))
 
             logger.info(f"Parsed {len(papers)} papers from {file_path}")
             return papers
@@ -139,6 +309,66 @@ class CitationParser:
             logger.error(f"RIS parsing failed: {e}")
             return []
 
+    def iter_ris(
+        self,
+        file_path: str,
+        workers: int = 1,
+        chunk_entries: int = 500
+    ) -> Iterator[PaperMetadata]:
+        """
+        Stream papers from a RIS file.
+
+        Args:
+            file_path: Path to .ris file
+            workers: Parsing processes (<=1 parses in-process)
+            chunk_entries: Records per parsing chunk
+
+        Yields:
+            PaperMetadata objects in file order
+        """
+        yield from self._stream_chunks(
+            _ris_chunks(file_path, chunk_entries),
+            _parse_ris_chunk,
+            workers
+        )
+
+    def iter_file(
+        self,
+        file_path: str,
+        workers: int = 1,
+        chunk_entries: int = 500
+    ) -> Iterator[PaperMetadata]:
+        """
+        Stream papers from a BibTeX (.bib/.bibtex) or RIS (anything else) file.
+
+        Args:
+            file_path: Path to bibliography file
+            workers: Parsing processes (<=1 parses in-process)
+            chunk_entries: Entries per parsing chunk
+
+        Yields:
+            PaperMetadata objects in file order
+        """
+        if Path(file_path).suffix.lower() in _BIBTEX_EXTENSIONS:
+            return self.iter_bibtex(file_path, workers, chunk_entries)
+        return self.iter_ris(file_path, workers, chunk_entries)
+
+    def _stream_chunks(self, chunks: Iterator[Any], parse_chunk, workers: int) -> Iterator[PaperMetadata]:
+        """Parse chunks in order, keeping at most two chunks per worker in flight."""
+        if workers <= 1:
+            for chunk in chunks:
+                yield from parse_chunk(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(parse_chunk, chunk))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
     def extract_citations_from_text(self, text: str) -> List[str]:
         """
         Extract citation strings from text using regex patterns.
@@ -203,7 +433,7 @@ class CitationParser:
             # Build PaperMetadata
             paper = PaperMetadata(
                 id=entry.get('ID', ''),
-                source=PaperSource.OTHER,
+                source=PaperSource.UNKNOWN,
                 title=entry.get('title', ''),
                 abstract=entry.get('abstract', ''),
                 authors=authors,
@@ -259,7 +489,7 @@ class CitationParser:
             # Build PaperMetadata
             paper = PaperMetadata(
                 id=data.get('ID', ''),
-                source=PaperSource.OTHER,
+                source=PaperSource.UNKNOWN,
                 title=data.get('TI', ''),
                 abstract=data.get('AB', ''),
                 authors=authors,
@@ -606,17 +836,25 @@ class CitationNetwork:
     """
     Build and analyze citation networks.
 
-    Uses NetworkX for graph analysis.
+    Uses NetworkX for graph analysis, and CitationMatrix (scipy.sparse) for
+    PageRank, betweenness and graphs too large for NetworkX. Betweenness
+    switches from exact to pivot-sampled estimates on large graphs or when a
+    time budget is given. Graph-wide metrics (betweenness,
+    PageRank) are computed once per graph version and cached; code that
+    edits a graph after analysis should bump ``graph.graph["version"]``
+    (node/edge count changes are detected automatically).
     """
 
-    def __init__(self, use_knowledge_graph: bool = False):
+    def __init__(self, use_knowledge_graph: bool = False, workers: Optional[int] = None):
         """
         Initialize citation network.
 
         Args:
             use_knowledge_graph: Whether to integrate with Neo4j
+            workers: Processes for betweenness computation
         """
         self.use_knowledge_graph = use_knowledge_graph
+        self.workers = workers or min(4, os.cpu_count() or 1)
 
         if use_knowledge_graph:
             try:
@@ -626,6 +864,16 @@ class CitationNetwork:
                 logger.warning(f"Knowledge graph unavailable: {e}")
                 self.knowledge_graph = None
 
+        # graph -> (version key, metrics, time budget -> (betweenness, error bound));
+        # entries vanish with their graph
+        self._metrics_cache: "weakref.WeakKeyDictionary[nx.DiGraph, Tuple[tuple, Dict[str, Dict[str, float]], Dict[Optional[float], Tuple[Dict[str, float], float]]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # graph -> (version key, distance index)
+        self._distance_cache: "weakref.WeakKeyDictionary[Any, Tuple[tuple, CitationDistanceIndex]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
         logger.info("Initialized CitationNetwork")
 
     def build_network(
@@ -662,53 +910,106 @@ class CitationNetwork:
                 citation_count=paper.citation_count
             )
 
-        # Add citation edges (if available from knowledge graph)
+        # Add citation edges (if available from knowledge graph), all papers in one query
         if self.use_knowledge_graph and self.knowledge_graph:
-            for paper in papers:
-                try:
-                    citations = self.knowledge_graph.get_citations(
-                        paper.primary_identifier,
-                        depth=1
-                    )
-
-                    for cited in citations:
-                        cited_id = cited["paper"].get("id")
-                        if cited_id:
-                            G.add_edge(paper.primary_identifier, cited_id)
+            try:
+                edges = self.knowledge_graph.get_citation_edges(
+                    [paper.primary_identifier for paper in papers]
+                )
+                G.add_edges_from((citing, cited) for citing, cited in edges if cited)
 
-                except Exception as e:
-                    logger.debug(f"Citation fetch failed: {e}")
+            except Exception as e:
+                logger.debug(f"Citation fetch failed: {e}")
 
         logger.info(f"Built citation network: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
         return G
 
+    def build_matrix(self, papers: List[PaperMetadata]) -> CitationMatrix:
+        """
+        Build a sparse citation matrix (for large networks).
+
+        Args:
+            papers: List of papers
+
+        Returns:
+            CitationMatrix with one node per paper plus cited papers
+
+        Example:
+            ```python
+            matrix = network.build_matrix(papers)
+            seminal = network.identify_seminal_papers(matrix, top_n=10)
+            ```
+        """
+        matrix = CitationMatrix(paper.primary_identifier for paper in papers)
+
+        if self.use_knowledge_graph and self.knowledge_graph:
+            try:
+                matrix.add_edges(self.knowledge_graph.get_citation_edges(
+                    [paper.primary_identifier for paper in papers]
+                ))
+            except Exception as e:
+                logger.debug(f"Citation fetch failed: {e}")
+
+        logger.info(f"Built citation matrix: {matrix.num_nodes} nodes, {matrix.num_edges} edges")
+        return matrix
+
     def get_citation_path(
         self,
-        graph: nx.DiGraph,
+        graph: Union[nx.DiGraph, CitationMatrix],
         paper1_id: str,
-        paper2_id: str
+        paper2_id: str,
+        directed: bool = True,
+        max_depth: Optional[int] = None
     ) -> Optional[List[str]]:
         """
         Find shortest citation path between two papers.
 
+        Uses bidirectional BFS on a distance index built once per graph version.
+
         Args:
-            graph: Citation network graph
+            graph: Citation network graph (NetworkX graph or CitationMatrix)
             paper1_id: First paper ID
             paper2_id: Second paper ID
+            directed: Follow citations only in the citing -> cited direction
+            max_depth: Give up beyond this many hops
 
         Returns:
             List of paper IDs forming path, or None if no path exists
         """
-        try:
-            path = nx.shortest_path(graph, paper1_id, paper2_id)
-            return path
-        except nx.NetworkXNoPath:
-            return None
+        return self.get_distance_index(graph).shortest_path(
+            paper1_id, paper2_id, directed=directed, max_depth=max_depth
+        )
+
+    def get_distance_index(self, graph: Union[nx.DiGraph, CitationMatrix]) -> CitationDistanceIndex:
+        """
+        Get the citation distance index of a graph, built once per graph version.
+
+        Build landmarks on the returned index (``build_landmarks`` or
+        ``load_landmarks``) to bound path searches on large graphs.
+
+        Args:
+            graph: Citation network graph (NetworkX graph or CitationMatrix)
+
+        Returns:
+            CitationDistanceIndex
+        """
+        if isinstance(graph, CitationMatrix):
+            version = (graph.version,)
+        else:
+            version = (graph.graph.get("version", 0), graph.number_of_nodes(), graph.number_of_edges())
+
+        cached = self._distance_cache.get(graph)
+        if cached is None or cached[0] != version:
+            matrix = graph if isinstance(graph, CitationMatrix) else CitationMatrix.from_graph(graph)
+            cached = (version, CitationDistanceIndex(matrix))
+            self._distance_cache[graph] = cached
+        return cached[1]
 
     def analyze_influence(
         self,
         graph: nx.DiGraph,
-        paper_id: str
+        paper_id: str,
+        time_budget: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Analyze paper's influence in citation network.
@@ -716,9 +1017,11 @@ class CitationNetwork:
         Args:
             graph: Citation network
             paper_id: Paper to analyze
+            time_budget: Seconds allowed for betweenness (see CitationMatrix.betweenness)
 
         Returns:
-            Dictionary with influence metrics
+            Dictionary with influence metrics; ``betweenness_error`` is
+            included when betweenness was estimated
 
         Example:
             ```python
@@ -727,20 +1030,17 @@ class CitationNetwork:
             ```
         """
         metrics = {}
+        graph_metrics = self.get_graph_metrics(graph, time_budget=time_budget)
 
         # Betweenness centrality
-        try:
-            betweenness = nx.betweenness_centrality(graph)
-            metrics["betweenness_centrality"] = betweenness.get(paper_id, 0.0)
-        except Exception as e:
-            logger.debug(f"Betweenness calculation failed: {e}")
+        if "betweenness_centrality" in graph_metrics:
+            metrics["betweenness_centrality"] = graph_metrics["betweenness_centrality"].get(paper_id, 0.0)
+            if graph_metrics.get("betweenness_error"):
+                metrics["betweenness_error"] = graph_metrics["betweenness_error"]
 
         # PageRank
-        try:
-            pagerank = nx.pagerank(graph)
-            metrics["pagerank"] = pagerank.get(paper_id, 0.0)
-        except Exception as e:
-            logger.debug(f"PageRank calculation failed: {e}")
+        if "pagerank" in graph_metrics:
+            metrics["pagerank"] = graph_metrics["pagerank"].get(paper_id, 0.0)
 
         # Degree centrality
         metrics["in_degree"] = graph.in_degree(paper_id) if graph.has_node(paper_id) else 0
@@ -750,14 +1050,14 @@ class CitationNetwork:
 
     def identify_seminal_papers(
         self,
-        graph: nx.DiGraph,
+        graph: Union[nx.DiGraph, CitationMatrix],
         top_n: int = 10
     ) -> List[Tuple[str, Dict[str, Any]]]:
         """
         Identify most influential papers.
 
         Args:
-            graph: Citation network
+            graph: Citation network (NetworkX graph or CitationMatrix)
             top_n: Number of papers to return
 
         Returns:
@@ -770,9 +1070,25 @@ class CitationNetwork:
                 print(f"{paper_id}: PageRank={metrics['pagerank']:.4f}")
             ```
         """
+        if isinstance(graph, CitationMatrix):
+            try:
+                in_degree = graph.in_degree()
+                out_degree = graph.out_degree()
+                return [
+                    (paper_id, {
+                        "pagerank": pr_score,
+                        "in_degree": int(in_degree[graph.index[paper_id]]),
+                        "out_degree": int(out_degree[graph.index[paper_id]])
+                    })
+                    for paper_id, pr_score in graph.top_k(graph.pagerank(), top_n)
+                ]
+            except Exception as e:
+                logger.error(f"Seminal paper identification failed: {e}")
+                return []
+
         # Calculate PageRank
         try:
-            pagerank = nx.pagerank(graph)
+            pagerank = self.get_graph_metrics(graph, ["pagerank"])["pagerank"]
 
             # Sort by PageRank
             ranked = sorted(pagerank.items(), key=lambda x: x[1], reverse=True)
@@ -793,6 +1109,84 @@ class CitationNetwork:
             logger.error(f"Seminal paper identification failed: {e}")
             return []
 
+    def get_graph_metrics(
+        self,
+        graph: nx.DiGraph,
+        metrics: Optional[List[str]] = None,
+        time_budget: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Get graph-wide centrality metrics, computed once per graph version.
+
+        Betweenness is cached per time budget: a cached estimate is reused
+        when it is exact or was computed with at least the requested budget.
+
+        Args:
+            graph: Citation network
+            metrics: Metrics to make sure are computed
+                (default: betweenness_centrality and pagerank)
+            time_budget: Seconds allowed for betweenness
+
+        Returns:
+            Dictionary of metric name -> {paper_id: score}, plus
+            ``betweenness_error`` (0.0 when exact); metrics that failed
+            to compute are missing
+
+        Example:
+            ```python
+            scores = network.get_graph_metrics(graph)
+            for paper_id in graph.nodes:
+                print(paper_id, scores["pagerank"][paper_id])
+            ```
+        """
+        metrics = metrics or ["betweenness_centrality", "pagerank"]
+        version = (graph.graph.get("version", 0), graph.number_of_nodes(), graph.number_of_edges())
+
+        cached = self._metrics_cache.get(graph)
+        if cached is None or cached[0] != version:
+            cached = (version, {}, {})
+            self._metrics_cache[graph] = cached
+        computed, betweenness = cached[1], cached[2]
+        result = dict(computed)
+
+        for name in metrics:
+            if name in computed:
+                continue
+            try:
+                if name == "betweenness_centrality":
+                    estimate = self._cached_betweenness(betweenness, time_budget)
+                    if estimate is None:
+                        matrix = CitationMatrix.from_graph(graph)
+                        scores, error = matrix.betweenness(time_budget=time_budget, workers=self.workers)
+                        estimate = betweenness[time_budget] = (matrix.scores_to_dict(scores), error)
+                    result[name], result["betweenness_error"] = estimate
+                    continue
+                elif name == "pagerank":
+                    matrix = CitationMatrix.from_graph(graph)
+                    computed[name] = matrix.scores_to_dict(matrix.pagerank())
+                else:
+                    raise ValueError(f"Unknown metric: {name}")
+                result[name] = computed[name]
+            except Exception as e:
+                logger.debug(f"{name} calculation failed: {e}")
+
+        return result
+
+    @staticmethod
+    def _cached_betweenness(
+        estimates: Dict[Optional[float], Tuple[Dict[str, float], float]],
+        time_budget: Optional[float]
+    ) -> Optional[Tuple[Dict[str, float], float]]:
+        """Pick a cached betweenness estimate at least as good as one computed with time_budget."""
+        if time_budget in estimates:
+            return estimates[time_budget]
+        for budget, estimate in estimates.items():
+            if estimate[1] == 0.0 or (
+                budget is not None and time_budget is not None and budget >= time_budget
+            ):
+                return estimate
+        return None
+
 
 class CitationValidator:
     """
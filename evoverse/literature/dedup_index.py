@@ -0,0 +1,588 @@
+"""
+Indexes for fast duplicate detection.
+
+Provides:
+- Identifier normalization (DOI, arXiv ID, PubMed ID, title)
+- MinHash signatures over title character shingles
+- LSH title blocking index (finds near-duplicate title candidates)
+- Combined identifier + title index used by ReferenceManager
+- Batch near-duplicate title pair search and clustering (DeduplicationEngine)
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+import numpy as np
+
+from evoverse.literature.base_client import PaperMetadata
+
+logger = logging.getLogger(__name__)
+
+_DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', re.IGNORECASE)
+_ARXIV_PREFIX_RE = re.compile(r'^(?:https?://arxiv\.org/(?:abs|pdf)/|arxiv:\s*)', re.IGNORECASE)
+_ARXIV_VERSION_RE = re.compile(r'v\d+$')
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Normalize a DOI (strip resolver prefix, lowercase)."""
+    if not doi:
+        return None
+    doi = _DOI_PREFIX_RE.sub('', doi.strip()).lower()
+    return doi or None
+
+
+def normalize_arxiv_id(arxiv_id: Optional[str]) -> Optional[str]:
+    """Normalize an arXiv ID (strip prefix, ".pdf" and version suffix)."""
+    if not arxiv_id:
+        return None
+    arxiv_id = _ARXIV_PREFIX_RE.sub('', arxiv_id.strip()).lower()
+    if arxiv_id.endswith('.pdf'):
+        arxiv_id = arxiv_id[:-4]
+    arxiv_id = _ARXIV_VERSION_RE.sub('', arxiv_id)
+    return arxiv_id or None
+
+
+def normalize_pubmed_id(pubmed_id: Optional[str]) -> Optional[str]:
+    """Normalize a PubMed ID."""
+    if not pubmed_id:
+        return None
+    pubmed_id = str(pubmed_id).strip().lower()
+    if pubmed_id.startswith('pmid:'):
+        pubmed_id = pubmed_id[5:].strip()
+    return pubmed_id or None
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Normalize a title for blocking (lowercase letters/digits, single spaces)."""
+    if not title:
+        return ""
+    return _NON_WORD_RE.sub(' ', title.lower()).strip()
+
+
+class TitleMinHash:
+    """
+    MinHash signatures over character 3-gram shingles of normalized titles.
+
+    Signatures are split into ``bands`` bands of ``rows`` values for LSH.
+    With the defaults (20 bands x 4 rows) titles with shingle Jaccard 0.6
+    collide in at least one band with probability ~0.93, unrelated titles
+    (Jaccard ~0.1) with probability ~0.002.
+
+    Shingles are encoded arithmetically from their code points (no
+    salted ``hash()``), so signatures are identical across processes.
+    """
+
+    _SHINGLE_MOD = 4294967291  # Largest prime below 2**32
+    _EMPTY = np.uint64(2**64 - 1)
+    _CHUNK = 65536  # Shingles per vectorized block (~40MB of uint64 at 80 permutations)
+
+    def __init__(self, bands: int = 20, rows: int = 4, shingle_size: int = 3, seed: int = 1):
+        """
+        Initialize the hasher.
+
+        Args:
+            bands: Number of LSH bands
+            rows: Signature values per band
+            shingle_size: Character shingle length
+            seed: Seed for the hash permutations
+        """
+        self.bands = bands
+        self.rows = rows
+        self.shingle_size = shingle_size
+        self.num_perm = bands * rows
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 2**63 - 1, size=self.num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.randint(0, 2**63 - 1, size=self.num_perm, dtype=np.uint64)
+        self._band_mult = rng.randint(1, 2**63 - 1, size=rows, dtype=np.uint64) | np.uint64(1)
+
+    def signatures(self, normalized_titles: List[str]) -> np.ndarray:
+        """
+        Compute MinHash signatures for many normalized titles at once.
+
+        All titles are encoded into one code-point array; shingle codes and
+        their permutations are computed vectorized in chunks and reduced per
+        title. Duplicate shingles do not change a minimum, so no per-title
+        dedup is needed.
+
+        Args:
+            normalized_titles: Titles from ``normalize_title``
+
+        Returns:
+            uint64 array of shape (len(titles), num_perm); rows of empty
+            titles are all ``_EMPTY``
+        """
+        k = self.shingle_size
+        n = len(normalized_titles)
+        result = np.full((n, self.num_perm), self._EMPTY, dtype=np.uint64)
+        if n == 0:
+            return result
+
+        # NUL-separated code points; titles shorter than k are space-padded
+        joined = "\x00".join(t.ljust(k) if t else t for t in normalized_titles) + "\x00"
+        codes = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        is_sep = codes == 0
+        title_of = np.cumsum(is_sep) - is_sep  # Title index of each code point
+
+        count = len(codes) - k + 1
+        if count <= 0:
+            return result
+
+        # Rolling code of k consecutive code points, reduced below 2**32
+        values = np.zeros(count, dtype=np.uint64)
+        for i in range(k):
+            values = (values * np.uint64(0x110000) + codes[i:i + count]) % np.uint64(self._SHINGLE_MOD)
+
+        # Drop windows that span a separator
+        sep_cumsum = np.concatenate(([0], np.cumsum(is_sep)))
+        valid = (sep_cumsum[k:k + count] - sep_cumsum[:count]) == 0
+        values = values[valid]
+        owners = title_of[:count][valid]
+
+        for lo in range(0, len(values), self._CHUNK):
+            chunk = values[lo:lo + self._CHUNK]
+            chunk_owners = owners[lo:lo + self._CHUNK]
+            # Multiply-add-shift hash for every shingle/permutation pair
+            # (wrapping uint64 arithmetic is intended)
+            with np.errstate(over='ignore'):
+                permuted = (np.outer(self._a, chunk) + self._b[:, None]) >> np.uint64(32)
+            starts = np.flatnonzero(np.r_[True, chunk_owners[1:] != chunk_owners[:-1]])
+            mins = np.minimum.reduceat(permuted, starts, axis=1).T
+            rows = chunk_owners[starts]
+            # A title may straddle two chunks
+            result[rows] = np.minimum(result[rows], mins)
+
+        return result
+
+    def signature(self, normalized_title: str) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of a normalized title.
+
+        Args:
+            normalized_title: Title from ``normalize_title``
+
+        Returns:
+            uint64 array of length ``num_perm``, or None for empty titles
+        """
+        if not normalized_title:
+            return None
+        return self.signatures([normalized_title])[0]
+
+    def band_hashes(self, signatures: np.ndarray) -> np.ndarray:
+        """
+        Hash each band of each signature to one integer.
+
+        Args:
+            signatures: Array of shape (n, num_perm)
+
+        Returns:
+            uint64 array of shape (n, bands)
+        """
+        banded = signatures.reshape(len(signatures), self.bands, self.rows)
+        # Wrapping uint64 arithmetic is intended here
+        with np.errstate(over='ignore'):
+            return (banded * self._band_mult).sum(axis=2, dtype=np.uint64)
+
+    def band_keys_many(self, normalized_titles: List[str]) -> List[Optional[List[int]]]:
+        """
+        Get per-band LSH keys for many normalized titles.
+
+        Returns:
+            One list of ``bands`` integer keys per title (None for empty titles)
+        """
+        hashes = self.band_hashes(self.signatures(normalized_titles)).tolist()
+        return [h if t else None for t, h in zip(normalized_titles, hashes)]
+
+
+class TitleBlockIndex:
+    """
+    LSH index of titles: returns keys whose titles are likely similar.
+
+    Candidates still need to be verified with an exact similarity check.
+    """
+
+    def __init__(self, minhash: Optional[TitleMinHash] = None):
+        """
+        Initialize the index.
+
+        Args:
+            minhash: Signature hasher (default: ``TitleMinHash()``)
+        """
+        self.minhash = minhash or TitleMinHash()
+        # Per band: band key -> key, or set of keys once shared. Most buckets
+        # hold one title; plain strings keep a million-entry index cheap for the GC.
+        self._buckets: List[Dict[int, Any]] = [{} for _ in range(self.minhash.bands)]
+        self._exact: Dict[str, Set[str]] = {}
+        self._keys: Dict[str, tuple] = {}  # key -> (normalized title, band keys)
+        self._prepared: Dict[str, Optional[List[int]]] = {}  # normalized title -> band keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str, title: Optional[str]):
+        """Index a title under a key (replacing any previous title)."""
+        self.remove(key)
+
+        normalized, band_keys = self._band_keys(title)
+        if band_keys is None:
+            return
+
+        for buckets, band_key in zip(self._buckets, band_keys):
+            bucket = buckets.get(band_key)
+            if bucket is None:
+                buckets[band_key] = key
+            elif isinstance(bucket, str):
+                if bucket != key:
+                    buckets[band_key] = {bucket, key}
+            else:
+                bucket.add(key)
+        self._exact.setdefault(normalized, set()).add(key)
+        self._keys[key] = (normalized, band_keys)
+
+    def remove(self, key: str):
+        """Remove a key from the index."""
+        entry = self._keys.pop(key, None)
+        if entry is None:
+            return
+
+        normalized, band_keys = entry
+        for buckets, band_key in zip(self._buckets, band_keys):
+            bucket = buckets.get(band_key)
+            if bucket is None:
+                continue
+            if isinstance(bucket, str):
+                if bucket == key:
+                    del buckets[band_key]
+            else:
+                bucket.discard(key)
+                if len(bucket) == 1:
+                    buckets[band_key] = bucket.pop()
+
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            exact.discard(key)
+            if not exact:
+                del self._exact[normalized]
+
+    def candidates(self, title: Optional[str]) -> Set[str]:
+        """
+        Get keys whose titles may be near-duplicates of a title.
+
+        Args:
+            title: Title to look up
+
+        Returns:
+            Candidate keys (exact normalized matches are always included)
+        """
+        normalized, band_keys = self._band_keys(title)
+        if band_keys is None:
+            return set()
+
+        found = set(self._exact.get(normalized, ()))
+        for buckets, band_key in zip(self._buckets, band_keys):
+            bucket = buckets.get(band_key)
+            if bucket is None:
+                continue
+            if isinstance(bucket, str):
+                found.add(bucket)
+            else:
+                found.update(bucket)
+        return found
+
+    def prepare(self, titles: Iterable[Optional[str]]):
+        """
+        Precompute band keys for titles about to be looked up or added.
+
+        One vectorized pass is much faster than hashing titles one by one;
+        call ``clear_prepared`` when the batch is done.
+        """
+        normalized = list({normalize_title(t) for t in titles} - self._prepared.keys())
+        self._prepared.update(zip(normalized, self.minhash.band_keys_many(normalized)))
+
+    def clear_prepared(self):
+        """Drop band keys precomputed by ``prepare``."""
+        self._prepared.clear()
+
+    def _band_keys(self, title: Optional[str]) -> tuple:
+        """(normalized title, band keys or None) for a title."""
+        normalized = normalize_title(title)
+        if normalized in self._prepared:
+            return normalized, self._prepared[normalized]
+        return normalized, self.minhash.band_keys_many([normalized])[0]
+
+
+class DuplicateIndex:
+    """
+    Identifier hash indexes plus title blocking for duplicate lookup.
+
+    Maps normalized DOI / arXiv ID / PubMed ID to reference IDs and keeps a
+    ``TitleBlockIndex`` so a lookup compares against a handful of candidates
+    instead of every stored reference.
+    """
+
+    def __init__(self):
+        """Initialize empty indexes."""
+        self._doi: Dict[str, str] = {}
+        self._arxiv: Dict[str, str] = {}
+        self._pubmed: Dict[str, str] = {}
+        self._titles = TitleBlockIndex()
+
+    def add(self, ref_id: str, paper: PaperMetadata):
+        """Index a reference (call again after its metadata changes)."""
+        for index, value in self._identifiers(paper):
+            index.setdefault(value, ref_id)
+        self._titles.add(ref_id, paper.title)
+
+    def remove(self, ref_id: str, paper: PaperMetadata):
+        """Remove a reference from the indexes."""
+        for index, value in self._identifiers(paper):
+            if index.get(value) == ref_id:
+                del index[value]
+        self._titles.remove(ref_id)
+
+    def rebuild(self, references: Dict[str, PaperMetadata]):
+        """Rebuild all indexes from a reference dict."""
+        self._doi.clear()
+        self._arxiv.clear()
+        self._pubmed.clear()
+        self._titles = TitleBlockIndex(self._titles.minhash)
+        self.prepare(references.values())
+        for ref_id, paper in references.items():
+            self.add(ref_id, paper)
+        self.clear_prepared()
+
+    def prepare(self, papers: Iterable[PaperMetadata]):
+        """Precompute title hashes for a batch of papers (see ``TitleBlockIndex.prepare``)."""
+        self._titles.prepare(p.title for p in papers)
+
+    def clear_prepared(self):
+        """Drop title hashes precomputed by ``prepare``."""
+        self._titles.clear_prepared()
+
+    def find(
+        self,
+        paper: PaperMetadata,
+        title_match: Callable[[str], bool]
+    ) -> Optional[str]:
+        """
+        Find the reference a paper duplicates.
+
+        Priority: DOI > arXiv > PubMed > fuzzy title.
+
+        Args:
+            paper: Paper to look up
+            title_match: Callable(ref_id) verifying a title-blocking candidate
+
+        Returns:
+            Reference ID or None
+        """
+        for index, value in self._identifiers(paper):
+            ref_id = index.get(value)
+            if ref_id is not None:
+                return ref_id
+
+        if paper.title:
+            for ref_id in sorted(self._titles.candidates(paper.title)):
+                if title_match(ref_id):
+                    return ref_id
+
+        return None
+
+    def _identifiers(self, paper: PaperMetadata) -> Iterable[tuple]:
+        """(index, normalized value) pairs for a paper's identifiers."""
+        pairs = [
+            (self._doi, normalize_doi(paper.doi)),
+            (self._arxiv, normalize_arxiv_id(paper.arxiv_id)),
+            (self._pubmed, normalize_pubmed_id(paper.pubmed_id)),
+        ]
+        return [(index, value) for index, value in pairs if value]
+
+
+# Batch near-duplicate search
+
+_HIST_BUCKETS = 64  # Character histogram buckets for the vectorized upper bound
+_PARALLEL_MIN_PAIRS = 20000  # Below this, verifying in-process beats pool startup
+
+
+def lsh_candidate_pairs(normalized_titles: List[str], minhash: Optional[TitleMinHash] = None) -> np.ndarray:
+    """
+    Find candidate near-duplicate title pairs by LSH banding.
+
+    Args:
+        normalized_titles: Titles from ``normalize_title``
+        minhash: Signature hasher (default: ``TitleMinHash()``)
+
+    Returns:
+        int64 array of shape (P, 2) with unique pairs (i < j)
+    """
+    minhash = minhash or TitleMinHash()
+    n = len(normalized_titles)
+    if n < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    hashes = minhash.band_hashes(minhash.signatures(normalized_titles))
+    has_title = np.array([bool(t) for t in normalized_titles])
+
+    pair_codes = []
+    for band in range(minhash.bands):
+        idx = np.flatnonzero(has_title)
+        values = hashes[idx, band]
+        order = np.argsort(values, kind='stable')
+        idx, values = idx[order], values[order]
+
+        # Runs of equal band hashes are the LSH buckets
+        boundaries = np.flatnonzero(np.r_[True, values[1:] != values[:-1], True])
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+            if end - start < 2:
+                continue
+            members = idx[start:end]
+            i, j = np.triu_indices(len(members), k=1)
+            pair_codes.append(members[i] * n + members[j])
+
+    if not pair_codes:
+        return np.empty((0, 2), dtype=np.int64)
+
+    codes = np.unique(np.concatenate(pair_codes))
+    return np.stack([codes // n, codes % n], axis=1)
+
+
+def _char_histograms(texts: List[str]) -> np.ndarray:
+    """Character count histograms with code points folded into buckets."""
+    hist = np.zeros((len(texts), _HIST_BUCKETS), dtype=np.int32)
+    for row, text in enumerate(texts):
+        if text:
+            codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32) % _HIST_BUCKETS
+            hist[row] = np.bincount(codes, minlength=_HIST_BUCKETS)
+    return hist
+
+
+def _verify_title_pairs(pairs: List[Tuple[str, str]], threshold: float) -> List[bool]:
+    """
+    Check ``SequenceMatcher(...).ratio() >= threshold`` for string pairs.
+
+    Module-level so it can be shipped to ProcessPoolExecutor workers.
+    """
+    results = []
+    for a, b in pairs:
+        matcher = SequenceMatcher(None, a, b)
+        results.append(matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold)
+    return results
+
+
+def find_similar_title_pairs(
+    titles: List[Optional[str]],
+    threshold: float = 0.9,
+    workers: int = 1,
+    chunk_size: int = 5000
+) -> List[Tuple[int, int]]:
+    """
+    Find pairs of titles whose similarity reaches a threshold.
+
+    Similarity is ``SequenceMatcher`` ratio on lowercased, stripped titles,
+    same as ``DeduplicationEngine._title_similarity``. Identical titles are
+    paired directly; the rest go through LSH blocking, a vectorized upper
+    bound (length and folded character-histogram overlap, never below the
+    true ratio) and finally SequenceMatcher, in a process pool when there
+    are many pairs left.
+
+    Args:
+        titles: Titles (None/empty titles never match)
+        threshold: Similarity threshold (0-1)
+        workers: Processes for the SequenceMatcher stage (<=1 runs in-process)
+        chunk_size: Pairs per worker task
+
+    Returns:
+        List of (i, j) index pairs with i < j
+    """
+    texts = [t.lower().strip() if t else "" for t in titles]
+
+    # Identical titles: pair each with the first occurrence, block only one of each
+    first_index: Dict[str, int] = {}
+    pairs: List[Tuple[int, int]] = []
+    reps: List[int] = []
+    for i, text in enumerate(texts):
+        if not text:
+            continue
+        first = first_index.setdefault(text, i)
+        if first == i:
+            reps.append(i)
+        else:
+            pairs.append((first, i))
+
+    rep_pairs = lsh_candidate_pairs([normalize_title(texts[i]) for i in reps])
+    if not len(rep_pairs):
+        return pairs
+
+    reps_arr = np.array(reps, dtype=np.int64)
+    candidates = reps_arr[rep_pairs]
+
+    # Vectorized upper bounds: 2*min(len)/sum(len) and 2*overlap/sum(len)
+    lengths = np.array([len(t) for t in texts], dtype=np.int64)
+    rep_hist = _char_histograms([texts[i] for i in reps])
+
+    left, right = candidates[:, 0], candidates[:, 1]
+    total = lengths[left] + lengths[right]
+    keep = 2 * np.minimum(lengths[left], lengths[right]) >= threshold * total
+
+    kept = np.flatnonzero(keep)
+    bound_ok = np.zeros(len(candidates), dtype=bool)
+    for lo in range(0, len(kept), 100000):
+        block = kept[lo:lo + 100000]
+        overlap = np.minimum(rep_hist[rep_pairs[block, 0]], rep_hist[rep_pairs[block, 1]]).sum(axis=1)
+        bound_ok[block] = 2 * overlap >= threshold * total[block]
+
+    survivors = candidates[bound_ok].tolist()
+    logger.debug(
+        f"Title pairs: {len(candidates)} LSH candidates, {len(survivors)} after bounds"
+    )
+
+    string_pairs = [(texts[i], texts[j]) for i, j in survivors]
+    chunks = [string_pairs[k:k + chunk_size] for k in range(0, len(string_pairs), chunk_size)]
+
+    if workers > 1 and len(string_pairs) >= _PARALLEL_MIN_PAIRS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_verify_title_pairs, chunks, [threshold] * len(chunks)))
+    else:
+        results = [_verify_title_pairs(chunk, threshold) for chunk in chunks]
+
+    matched = [flag for chunk_result in results for flag in chunk_result]
+    pairs.extend(tuple(pair) for pair, ok in zip(survivors, matched) if ok)
+    return pairs
+
+
+def cluster_pairs(n: int, pairs: Iterable[Tuple[int, int]]) -> List[List[int]]:
+    """
+    Group indices connected by pairs (union-find).
+
+    Args:
+        n: Number of items
+        pairs: (i, j) index pairs
+
+    Returns:
+        Clusters as sorted index lists, ordered by their first index
+    """
+    parent = list(range(n))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # Keep the smaller index as root so clusters are led by the first paper
+            if root_i < root_j:
+                parent[root_j] = root_i
+            else:
+                parent[root_i] = root_j
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(n):
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
@@ -6,24 +6,107 @@ and fallback to abstract when full text is unavailable.
 """
 
 import fitz  # PyMuPDF
-import httpx
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable, Tuple, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+import itertools
 import logging
+import multiprocessing
+import os
+import queue
 import re
+import signal
+import time
 from datetime import datetime
 
 from evoverse.literature.base_client import PaperMetadata
+from evoverse.literature.pdf_store import PDFStore
+from evoverse.literature.text_cache import ExtractedTextCache
+from evoverse.literature.sections import (
+    DocumentSection,
+    StructuredDocument,
+    build_sections,
+    find_headings
+)
 from evoverse.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Bump when extraction/cleaning output changes to invalidate cached texts
+EXTRACTOR_VERSION = "4"
+
+# How often the parse stage checks for finished and overdue parses
+_PARSE_POLL_INTERVAL = 0.1
+
+# Queue a parse pool worker reports parse start times to
+_parse_started_queue = None
+
 
 class PDFExtractionError(Exception):
     """Exception raised for PDF extraction errors."""
     pass
 
 
+def _parse_pdf_bytes(
+    pdf_bytes: bytes,
+    max_chars: Optional[int] = None,
+    until_section: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Parse PDF bytes into cleaned text, page offsets and section headings.
+
+    Module-level so it can be shipped to ProcessPoolExecutor workers.
+
+    Args:
+        pdf_bytes: PDF file bytes
+        max_chars: Stop reading pages once this many characters are extracted
+        until_section: Stop reading pages at this section heading
+
+    Returns:
+        Text cache entry (see ``PDFExtractor._extract_pages_from_doc``)
+    """
+    try:
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        result = PDFExtractor._extract_pages_from_doc(doc, max_chars, until_section)
+        doc.close()
+        return result
+
+    except Exception as e:
+        logger.error(f"Error extracting text from PDF bytes: {e}")
+        return {"text": None, "page_offsets": [], "headings": [], "sections": [], "complete": True}
+
+
+def _init_parse_worker(started_queue):
+    """ProcessPoolExecutor initializer: remember where to report parse starts."""
+    global _parse_started_queue
+    _parse_started_queue = started_queue
+
+
+def _parse_pdf_bytes_reporting(
+    token: int,
+    pdf_bytes: bytes,
+    max_chars: Optional[int] = None,
+    until_section: Optional[str] = None
+) -> Dict[str, Any]:
+    """``_parse_pdf_bytes`` that first reports (token, worker PID, start time) to the parent."""
+    if _parse_started_queue is not None:
+        _parse_started_queue.put((token, os.getpid(), time.monotonic()))
+    return _parse_pdf_bytes(pdf_bytes, max_chars, until_section)
+
+
+@dataclass
+class _ParseTask:
+    """A PDF queued in the parse pool and the papers waiting for it."""
+    pdf_bytes: Optional[bytes]  # Kept for resubmission until the parse finishes
+    papers: List[PaperMetadata]
+    cached: Optional[Dict[str, Any]]
+    future: Any = None
+    token: int = 0
+    pid: Optional[int] = None
+    started_at: Optional[float] = None
+
+
 class PDFExtractor:
     """
     PDF text extraction utility using PyMuPDF.
@@ -32,31 +115,62 @@ class PDFExtractor:
     - URL-based PDF download
     - Local PDF file extraction
     - Text cleaning and normalization
+    - Bounded extraction (first N characters / up to a section)
     - Metadata extraction
     """
 
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        text_cache_dir: Optional[str] = None
+    ):
         """
         Initialize the PDF extractor.
 
         Args:
-            cache_dir: Directory to cache downloaded PDFs
+            cache_dir: Directory of the content-addressed PDF store
+            text_cache_dir: Directory to cache extracted texts
         """
         config = get_config()
         cache_dir = cache_dir or str(Path(config.literature.cache_dir) / "pdfs")
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Extracted text cache, keyed by PDF content hash
+        text_cache_dir = text_cache_dir or str(Path(config.literature.cache_dir) / "texts")
+        self.text_cache = ExtractedTextCache(text_cache_dir, EXTRACTOR_VERSION)
+
         self.download_timeout = config.literature.pdf_download_timeout
+        self.download_workers = config.literature.pdf_download_workers
+        self.parse_workers = config.literature.pdf_parse_workers
+        self.parse_timeout = config.literature.pdf_parse_timeout
+
+        # Downloaded PDFs, deduplicated by content hash and bounded in size;
+        # owns the shared HTTP connection pool
+        self.store = PDFStore(
+            cache_dir,
+            max_size_mb=config.literature.pdf_cache_max_size_mb,
+            download_timeout=self.download_timeout,
+            max_connections=self.download_workers,
+            revalidate_after_hours=config.literature.pdf_revalidate_after_hours
+        )
 
         logger.info(f"Initialized PDF extractor (cache_dir={cache_dir})")
 
-    def extract_from_url(self, url: str, paper_id: Optional[str] = None) -> Optional[str]:
+    def extract_from_url(
+        self,
+        url: str,
+        paper_id: Optional[str] = None,
+        max_chars: Optional[int] = None,
+        until_section: Optional[str] = None
+    ) -> Optional[str]:
         """
         Download and extract text from a PDF URL.
 
         Args:
             url: URL to PDF file
             paper_id: Optional paper ID for caching
+            max_chars: Only extract (at most) the first max_chars characters
+            until_section: Only extract text before this section (e.g. "references")
 
         Returns:
             Extracted text or None if extraction fails
@@ -65,31 +179,19 @@ class PDFExtractor:
             ```python
             extractor = PDFExtractor()
             text = extractor.extract_from_url("https://arxiv.org/pdf/2103.00020.pdf")
+
+            # Only parse as many pages as needed for a 5000-char prompt
+            head = extractor.extract_from_url(url, max_chars=5000)
             ```
         """
         try:
-            # Check cache
-            if paper_id:
-                cached_pdf = self.cache_dir / f"{paper_id}.pdf"
-                if cached_pdf.exists():
-                    logger.debug(f"Using cached PDF for {paper_id}")
-                    return self.extract_from_file(str(cached_pdf))
-
-            # Download PDF
-            logger.info(f"Downloading PDF from {url}")
-            pdf_bytes = self._download_pdf(url)
+            pdf_bytes = self._get_pdf_bytes(url, paper_id)
 
             if not pdf_bytes:
                 return None
 
-            # Save to cache if paper_id provided
-            if paper_id:
-                cached_pdf = self.cache_dir / f"{paper_id}.pdf"
-                with open(cached_pdf, 'wb') as f:
-                    f.write(pdf_bytes)
-
             # Extract text
-            text = self._extract_text_from_bytes(pdf_bytes)
+            text = self._extract_text_from_bytes(pdf_bytes, max_chars, until_section)
 
             if text:
                 logger.info(f"Successfully extracted {len(text)} characters from PDF")
@@ -100,12 +202,19 @@ class PDFExtractor:
             logger.error(f"Error extracting from URL {url}: {e}")
             return None
 
-    def extract_from_file(self, file_path: str) -> Optional[str]:
+    def extract_from_file(
+        self,
+        file_path: str,
+        max_chars: Optional[int] = None,
+        until_section: Optional[str] = None
+    ) -> Optional[str]:
         """
         Extract text from a local PDF file.
 
         Args:
             file_path: Path to PDF file
+            max_chars: Only extract (at most) the first max_chars characters
+            until_section: Only extract text before this section (e.g. "references")
 
         Returns:
             Extracted text or None if extraction fails
@@ -125,7 +234,7 @@ class PDFExtractor:
             with open(pdf_path, 'rb') as f:
                 pdf_bytes = f.read()
 
-            text = self._extract_text_from_bytes(pdf_bytes)
+            text = self._extract_text_from_bytes(pdf_bytes, max_chars, until_section)
 
             if text:
                 logger.info(f"Successfully extracted {len(text)} characters from {file_path}")
@@ -136,6 +245,42 @@ class PDFExtractor:
             logger.error(f"Error extracting from file {file_path}: {e}")
             return None
 
+    def iter_pages(self, url_or_path: str) -> Iterator[str]:
+        """
+        Lazily iterate over the cleaned text of each PDF page.
+
+        Pages are parsed only as they are consumed, so breaking out of the
+        loop early skips the remaining pages.
+
+        Args:
+            url_or_path: URL or file path to PDF
+
+        Yields:
+            Cleaned text of each page (possibly empty)
+
+        Example:
+            ```python
+            for page_text in extractor.iter_pages("paper.pdf"):
+                if "Methods" in page_text:
+                    break
+            ```
+        """
+        if url_or_path.startswith(("http://", "https://")):
+            pdf_bytes = self._get_pdf_bytes(url_or_path)
+        else:
+            with open(url_or_path, 'rb') as f:
+                pdf_bytes = f.read()
+
+        if not pdf_bytes:
+            return
+
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        try:
+            for page in doc:
+                yield self._clean_text(page.get_text())
+        finally:
+            doc.close()
+
     def extract_with_metadata(self, url_or_path: str) -> Dict[str, Any]:
         """
         Extract both text and metadata from PDF.
@@ -157,7 +302,7 @@ class PDFExtractor:
         is_url = url_or_path.startswith(("http://", "https://"))
 
         if is_url:
-            pdf_bytes = self._download_pdf(url_or_path)
+            pdf_bytes = self._get_pdf_bytes(url_or_path)
         else:
             with open(url_or_path, 'rb') as f:
                 pdf_bytes = f.read()
@@ -182,14 +327,75 @@ class PDFExtractor:
             logger.error(f"Error extracting with metadata: {e}")
             return {"text": None, "metadata": {}}
 
-    def extract_paper_text(self, paper: PaperMetadata) -> str:
+    def extract_structured(
+        self,
+        url_or_path: str,
+        paper_id: Optional[str] = None,
+        max_chars: Optional[int] = None,
+        until_section: Optional[str] = None
+    ) -> Optional[StructuredDocument]:
+        """
+        Extract text together with detected sections (abstract, methods,
+        results, discussion, references, ...).
+
+        Sections are detected once at parse time and persisted in the text
+        cache, so consumers can send only the parts they need to an LLM.
+
+        Args:
+            url_or_path: URL or file path to PDF
+            paper_id: Optional paper ID for caching (URLs only)
+            max_chars: Only extract (at most) the first max_chars characters
+            until_section: Only extract text before this section (e.g. "references")
+
+        Returns:
+            StructuredDocument or None if extraction fails
+
+        Example:
+            ```python
+            doc = extractor.extract_structured("paper.pdf", until_section="references")
+            methods = doc.get_section("methods")
+            excerpt = doc.select(["abstract", "results"], max_chars=4000)
+            ```
+        """
+        try:
+            if url_or_path.startswith(("http://", "https://")):
+                pdf_bytes = self._get_pdf_bytes(url_or_path, paper_id)
+            else:
+                with open(url_or_path, 'rb') as f:
+                    pdf_bytes = f.read()
+
+            if not pdf_bytes:
+                return None
+
+            text, sections = self._extract_sections_from_bytes(pdf_bytes, max_chars, until_section)
+            if not text:
+                return None
+
+            return StructuredDocument(
+                text=text,
+                sections=[DocumentSection(**section) for section in sections]
+            )
+
+        except Exception as e:
+            logger.error(f"Error extracting structured text from {url_or_path}: {e}")
+            return None
+
+    def extract_paper_text(
+        self,
+        paper: PaperMetadata,
+        max_chars: Optional[int] = None,
+        until_section: Optional[str] = None
+    ) -> str:
         """
         Extract full text for a PaperMetadata object.
 
-        Falls back to abstract if PDF extraction fails.
+        Falls back to abstract if PDF extraction fails. Detected section
+        spans are stored in ``paper.sections``.
 
         Args:
             paper: PaperMetadata object
+            max_chars: Only extract (at most) the first max_chars characters
+            until_section: Only extract text before this section (e.g. "references")
 
         Returns:
             Full text or abstract
@@ -201,74 +407,383 @@ class PDFExtractor:
         """
         # Try PDF extraction if URL available
         if paper.pdf_url:
-            full_text = self.extract_from_url(
+            document = self.extract_structured(
                 paper.pdf_url,
-                paper_id=paper.primary_identifier.replace("/", "_").replace(":", "_")
+                paper_id=self._cache_id(paper),
+                max_chars=max_chars,
+                until_section=until_section
             )
 
-            if full_text:
+            if document:
                 # Store in paper object
-                paper.full_text = full_text
-                return full_text
+                paper.full_text = document.text
+                paper.sections = document.section_dicts()
+                return document.text
 
         # Fallback to abstract
         logger.debug(f"No PDF available for {paper.id}, using abstract")
         paper.full_text = paper.abstract
         return paper.abstract
 
-    def _download_pdf(self, url: str) -> Optional[bytes]:
+    def extract_papers_text(
+        self,
+        papers: List[PaperMetadata],
+        download_workers: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        parse_timeout: Optional[float] = None,
+        progress_callback: Optional[Callable[[int, int, PaperMetadata], None]] = None,
+        max_chars: Optional[int] = None,
+        until_section: Optional[str] = None
+    ) -> int:
         """
-        Download PDF from URL.
+        Extract full text for many papers with a staged pipeline.
+
+        Stage 1 downloads PDFs concurrently on the shared connection pool
+        (bounded by ``download_workers``); stage 2 parses each PDF in a
+        process pool as soon as its download finishes. PDFs already in the
+        text cache are not parsed again, and identical PDFs reached through
+        different papers are parsed once. Papers whose PDF cannot be
+        downloaded or parsed in time fall back to the abstract, same as
+        ``extract_paper_text``.
+
+        Downloads and parses are collected as they finish, in one loop, so
+        progress is reported and PDF bytes are released while downloads are
+        still running. The parse timeout runs from when a worker starts
+        parsing, not from submission. A parse that overruns it gets its
+        worker killed: the pool is recycled and the other unfinished parses
+        are resubmitted.
+
+        Modifies papers in-place.
 
         Args:
-            url: PDF URL
+            papers: Papers to extract text for (papers with full_text are skipped)
+            download_workers: Concurrent downloads (default: from config)
+            parse_workers: Parser processes (default: from config, <=1 parses in-process)
+            parse_timeout: Per-PDF parse timeout in seconds (default: from config)
+            progress_callback: Optional callable(done, total, paper) called per finished paper
+            max_chars: Only extract (at most) the first max_chars characters per paper
+            until_section: Only extract text before this section (e.g. "references")
 
         Returns:
-            PDF bytes or None if download fails
+            Number of papers with successfully extracted full text
+
+        Example:
+            ```python
+            extractor = get_pdf_extractor()
+            n = extractor.extract_papers_text(papers)
+            print(f"Extracted {n}/{len(papers)} full texts")
+            ```
         """
+        pending = [p for p in papers if p.pdf_url and not p.full_text]
+        if not pending:
+            return 0
+
+        download_workers = download_workers or self.download_workers
+        parse_workers = self.parse_workers if parse_workers is None else parse_workers
+        parse_timeout = parse_timeout or self.parse_timeout
+
+        total = len(pending)
+        done = 0
+        extracted = 0
+        start = time.monotonic()
+
+        def finish(paper: PaperMetadata, text: Optional[str], sections: Optional[List[Dict]] = None):
+            nonlocal done, extracted
+            if text:
+                paper.full_text = text
+                paper.sections = sections or []
+                extracted += 1
+            else:
+                logger.debug(f"No PDF text for {paper.id}, using abstract")
+                paper.full_text = paper.abstract
+            done += 1
+            logger.info(f"PDF extraction progress: {done}/{total}")
+            if progress_callback:
+                try:
+                    progress_callback(done, total, paper)
+                except Exception as e:
+                    logger.debug(f"Progress callback failed: {e}")
+
+        started_queue = multiprocessing.Queue() if parse_workers > 1 else None
+        parse_pool = self._new_parse_pool(parse_workers, started_queue) if parse_workers > 1 else None
+        tokens = itertools.count(1)
+
+        # content_hash -> parse task (papers sharing a PDF wait on one task)
+        parse_tasks: Dict[str, _ParseTask] = {}
+
+        def submit(task: _ParseTask):
+            task.token = next(tokens)
+            task.pid = task.started_at = None
+            task.future = parse_pool.submit(
+                _parse_pdf_bytes_reporting, task.token, task.pdf_bytes, max_chars, until_section
+            )
+
+        def downloaded(paper: PaperMetadata, future):
+            try:
+                pdf_bytes = future.result()
+            except Exception as e:
+                logger.warning(f"Could not download PDF for {paper.id}: {e}")
+                pdf_bytes = None
+
+            if not pdf_bytes:
+                finish(paper, None)
+                return
+
+            content_hash = self.text_cache.content_hash(pdf_bytes)
+
+            if content_hash in parse_tasks:
+                parse_tasks[content_hash].papers.append(paper)
+                return
+
+            cached = self.text_cache.get(content_hash)
+            if self._entry_covers(cached, max_chars, until_section):
+                finish(paper, *self._bound_entry(cached, max_chars, until_section))
+                return
+
+            if parse_pool is None:
+                entry = _parse_pdf_bytes(pdf_bytes, max_chars, until_section)
+                self._store_entry(content_hash, entry, cached)
+                finish(paper, *self._bound_entry(entry, max_chars, until_section))
+            else:
+                parse_tasks[content_hash] = _ParseTask(pdf_bytes, [paper], cached)
+                submit(parse_tasks[content_hash])
+
+        def collect_parses():
+            by_token = {task.token: task for task in parse_tasks.values()}
+            while True:
+                try:
+                    token, pid, started_at = started_queue.get_nowait()
+                except queue.Empty:
+                    break
+                # Reports from recycled workers carry stale tokens
+                if token in by_token:
+                    by_token[token].pid, by_token[token].started_at = pid, started_at
+
+            for content_hash, task in list(parse_tasks.items()):
+                if not task.future.done():
+                    continue
+                del parse_tasks[content_hash]
+                task.pdf_bytes = None
+                try:
+                    entry = task.future.result()
+                    self._store_entry(content_hash, entry, task.cached)
+                    text, sections = self._bound_entry(entry, max_chars, until_section)
+                except Exception as e:
+                    logger.warning(f"Could not parse PDF for {task.papers[0].id}: {e}")
+                    text, sections = None, []
+                for paper in task.papers:
+                    finish(paper, text, sections)
+
+        def kill_overdue_parses():
+            nonlocal parse_pool
+            now = time.monotonic()
+            overdue = [
+                content_hash for content_hash, task in parse_tasks.items()
+                if task.started_at is not None and now - task.started_at > parse_timeout
+            ]
+            if not overdue:
+                return
+
+            for content_hash in overdue:
+                task = parse_tasks.pop(content_hash)
+                logger.warning(f"PDF parsing timed out for {task.papers[0].id} after {parse_timeout}s")
+                self._kill_parse_worker(task.pid)
+                for paper in task.papers:
+                    finish(paper, None)
+
+            # A killed worker breaks the pool (its other workers are stopped
+            # with it); resubmit whatever else was queued or running
+            parse_pool.shutdown(wait=False, cancel_futures=True)
+            parse_pool = self._new_parse_pool(parse_workers, started_queue)
+            for task in parse_tasks.values():
+                submit(task)
+
         try:
-            with httpx.Client(timeout=self.download_timeout, follow_redirects=True) as client:
-                response = client.get(url)
-                response.raise_for_status()
+            with ThreadPoolExecutor(max_workers=min(download_workers, total)) as download_pool:
+                download_futures = {
+                    download_pool.submit(self._get_pdf_bytes, p.pdf_url, self._cache_id(p)): p
+                    for p in pending
+                }
+
+                while download_futures or parse_tasks:
+                    finished, _ = wait(
+                        [*download_futures, *(task.future for task in parse_tasks.values())],
+                        timeout=_PARSE_POLL_INTERVAL if parse_tasks else None,
+                        return_when=FIRST_COMPLETED
+                    )
+                    for future in finished:
+                        paper = download_futures.pop(future, None)
+                        if paper is not None:
+                            downloaded(paper, future)
+
+                    if parse_tasks:
+                        collect_parses()
+                        kill_overdue_parses()
+
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(wait=False, cancel_futures=True)
+            if started_queue is not None:
+                started_queue.close()
+
+        logger.info(
+            f"Extracted full text for {extracted}/{total} papers "
+            f"in {time.monotonic() - start:.1f}s"
+        )
+        return extracted
+
+    def close(self):
+        """Persist the PDF store index and close the shared HTTP connection pool."""
+        self.store.close()
+
+    @staticmethod
+    def _new_parse_pool(parse_workers: int, started_queue) -> ProcessPoolExecutor:
+        """Create a parse pool whose workers report parse start times."""
+        return ProcessPoolExecutor(
+            max_workers=parse_workers,
+            initializer=_init_parse_worker,
+            initargs=(started_queue,)
+        )
+
+    @staticmethod
+    def _kill_parse_worker(pid: Optional[int]):
+        """Kill a parse worker (e.g. one stuck in a pathological PDF) by the PID it reported."""
+        if pid is None:
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError) as e:
+            logger.debug(f"Could not kill parse worker {pid}: {e}")
 
-                # Verify it's a PDF
-                content_type = response.headers.get("content-type", "")
-                if "pdf" not in content_type.lower():
-                    logger.warning(f"URL does not appear to be a PDF: {url}")
+    def _cache_id(self, paper: PaperMetadata) -> str:
+        """Filesystem-safe cache ID for a paper."""
+        return paper.primary_identifier.replace("/", "_").replace(":", "_")
 
-                return response.content
+    def _get_pdf_bytes(self, url: str, paper_id: Optional[str] = None) -> Optional[bytes]:
+        """
+        Get PDF bytes from the PDF store, downloading them if needed.
 
-        except httpx.TimeoutException:
-            logger.error(f"Timeout downloading PDF from {url}")
-            return None
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error downloading PDF from {url}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error downloading PDF from {url}: {e}")
-            return None
+        Args:
+            url: PDF URL
+            paper_id: Optional paper ID to index the PDF under (default: the URL)
 
-    def _extract_text_from_bytes(self, pdf_bytes: bytes) -> Optional[str]:
+        Returns:
+            PDF bytes or None if download fails
+        """
+        return self.store.fetch(url, key=paper_id)
+
+    def _extract_text_from_bytes(
+        self,
+        pdf_bytes: bytes,
+        max_chars: Optional[int] = None,
+        until_section: Optional[str] = None
+    ) -> Optional[str]:
         """
-        Extract text from PDF bytes.
+        Extract text from PDF bytes, using the text cache.
 
         Args:
             pdf_bytes: PDF file bytes
+            max_chars: Only extract (at most) the first max_chars characters
+            until_section: Only extract text before this section
 
         Returns:
             Extracted text or None
         """
-        try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            text = self._extract_text_from_doc(doc)
-            doc.close()
-            return text
+        return self._extract_sections_from_bytes(pdf_bytes, max_chars, until_section)[0]
+
+    def _extract_sections_from_bytes(
+        self,
+        pdf_bytes: bytes,
+        max_chars: Optional[int] = None,
+        until_section: Optional[str] = None
+    ) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """
+        Extract text and section spans from PDF bytes, using the text cache.
 
-        except Exception as e:
-            logger.error(f"Error extracting text from PDF bytes: {e}")
-            return None
+        Args:
+            pdf_bytes: PDF file bytes
+            max_chars: Only extract (at most) the first max_chars characters
+            until_section: Only extract text before this section
 
-    def _extract_text_from_doc(self, doc: fitz.Document) -> Optional[str]:
+        Returns:
+            Tuple of (extracted text or None, section dicts)
+        """
+        content_hash = self.text_cache.content_hash(pdf_bytes)
+
+        cached = self.text_cache.get(content_hash)
+        if self._entry_covers(cached, max_chars, until_section):
+            return self._bound_entry(cached, max_chars, until_section)
+
+        entry = _parse_pdf_bytes(pdf_bytes, max_chars, until_section)
+        self._store_entry(content_hash, entry, cached)
+        return self._bound_entry(entry, max_chars, until_section)
+
+    @staticmethod
+    def _entry_covers(
+        entry: Optional[Dict[str, Any]],
+        max_chars: Optional[int],
+        until_section: Optional[str]
+    ) -> bool:
+        """Check whether a (possibly partial) cache entry satisfies a request."""
+        if entry is None:
+            return False
+        if entry.get("complete", True) or entry.get("text") is None:
+            return True
+        if until_section and any(name == until_section for name, _ in entry.get("headings", [])):
+            return True
+        if max_chars and len(entry["text"]) >= max_chars:
+            return True
+        return False
+
+    @staticmethod
+    def _bound_entry(
+        entry: Dict[str, Any],
+        max_chars: Optional[int],
+        until_section: Optional[str]
+    ) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """Cut a cache entry's text and sections down to the requested bounds."""
+        text = entry.get("text")
+        if not text:
+            return None, []
+
+        if until_section:
+            for name, offset in entry.get("headings", []):
+                if name == until_section and offset > 0:
+                    text = text[:offset].rstrip()
+                    break
+
+        if max_chars:
+            text = text[:max_chars]
+
+        sections = [
+            {**section, "end": min(section["end"], len(text))}
+            for section in entry.get("sections", [])
+            if section["start"] < len(text)
+        ]
+        return text, sections
+
+    def _store_entry(
+        self,
+        content_hash: str,
+        entry: Dict[str, Any],
+        cached: Optional[Dict[str, Any]] = None
+    ):
+        """Store a parse result unless the cache already holds a larger one."""
+        if cached is not None and not entry["complete"]:
+            if len(entry["text"] or "") <= len(cached.get("text") or ""):
+                return
+
+        self.text_cache.set(
+            content_hash,
+            entry["text"],
+            entry["page_offsets"],
+            headings=entry["headings"],
+            sections=entry["sections"],
+            complete=entry["complete"]
+        )
+
+    @staticmethod
+    def _extract_text_from_doc(doc: fitz.Document) -> Optional[str]:
         """
         Extract text from PyMuPDF document.
 
@@ -278,28 +793,83 @@ class PDFExtractor:
         Returns:
             Extracted and cleaned text
         """
-        try:
-            text_parts = []
+        return PDFExtractor._extract_pages_from_doc(doc)["text"]
+
+    @staticmethod
+    def _extract_pages_from_doc(
+        doc: fitz.Document,
+        max_chars: Optional[int] = None,
+        until_section: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract text from PyMuPDF document, tracking page boundaries.
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
-                text_parts.append(text)
+        Pages are cleaned individually and joined with a single space, so
+        page i spans ``text[page_offsets[i]:page_offsets[i + 1]]``. Pages
+        are read in order and reading stops as soon as ``max_chars`` is
+        reached or the ``until_section`` heading is found.
 
-            full_text = "\n\n".join(text_parts)
+        Args:
+            doc: PyMuPDF Document object
+            max_chars: Stop once this many characters are extracted
+            until_section: Stop at this section heading (canonical name)
 
-            # Clean text
-            cleaned_text = self._clean_text(full_text)
+        Returns:
+            Dictionary with 'text' (cleaned text or None), 'page_offsets'
+            (start offset of each page read), 'headings' ([section, offset]
+            pairs), 'sections' (section spans, see ``build_sections``) and
+            'complete' (whether every page was read)
+        """
+        try:
+            text_parts = []
+            page_offsets = []
+            headings = []
+            offset = 0
+            complete = True
 
-            if len(cleaned_text.strip()) < 100:
+            for page_num in range(len(doc)):
+                raw_text = doc[page_num].get_text()
+                stop = False
+
+                for section, raw_index in find_headings(raw_text):
+                    if section == until_section and (offset > 0 or raw_index > 0):
+                        raw_text = raw_text[:raw_index]
+                        stop = True
+                    prefix = PDFExtractor._clean_text(raw_text[:raw_index])
+                    heading_offset = offset + len(prefix) + (1 if prefix else 0)
+                    headings.append([section, heading_offset])
+                    if stop:
+                        break
+
+                page_text = PDFExtractor._clean_text(raw_text)
+
+                page_offsets.append(offset)
+                if page_text:
+                    text_parts.append(page_text)
+                    offset += len(page_text) + 1
+
+                if stop or (max_chars and offset >= max_chars):
+                    complete = page_num == len(doc) - 1 and not stop
+                    break
+
+            cleaned_text = " ".join(text_parts)
+
+            # Only a complete read can tell a scanned PDF from a short prefix
+            if not cleaned_text.strip() or (complete and len(cleaned_text.strip()) < 100):
                 logger.warning("Extracted text is too short, may be scanned/image-based PDF")
-                return None
+                cleaned_text = None
 
-            return cleaned_text
+            return {
+                "text": cleaned_text,
+                "page_offsets": page_offsets,
+                "headings": headings,
+                "sections": build_sections(cleaned_text, page_offsets, headings),
+                "complete": complete
+            }
 
         except Exception as e:
             logger.error(f"Error extracting text from document: {e}")
-            return None
+            return {"text": None, "page_offsets": [], "headings": [], "sections": [], "complete": True}
 
     def _extract_metadata(self, doc: fitz.Document) -> Dict[str, Any]:
         """
@@ -330,7 +900,8 @@ class PDFExtractor:
             logger.error(f"Error extracting metadata: {e}")
             return {}
 
-    def _clean_text(self, text: str) -> str:
+    @staticmethod
+    def _clean_text(text: str) -> str:
         """
         Clean and normalize extracted text.
 
@@ -361,23 +932,14 @@ class PDFExtractor:
         Returns:
             Dictionary with cache statistics
         """
-        pdf_files = list(self.cache_dir.glob("*.pdf"))
-        total_size_mb = sum(f.stat().st_size for f in pdf_files) / (1024 * 1024)
-
         return {
-            "cache_dir": str(self.cache_dir),
-            "file_count": len(pdf_files),
-            "size_mb": round(total_size_mb, 2)
+            **self.store.get_stats(),
+            "text_cache": self.text_cache.get_stats()
         }
 
     def clear_cache(self):
         """Clear all cached PDFs."""
-        count = 0
-        for pdf_file in self.cache_dir.glob("*.pdf"):
-            pdf_file.unlink()
-            count += 1
-
-        logger.info(f"Cleared {count} PDFs from cache")
+        self.store.clear()
 
 
 # Singleton extractor instance
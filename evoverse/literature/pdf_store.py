@@ -0,0 +1,525 @@
+"""
+Content-addressed, size-bounded PDF store.
+
+PDFs are stored once per content hash (``blobs/ab/abcd....pdf``) and looked
+up through an index that maps paper IDs / URLs to hashes. The store is
+bounded by LRU eviction, downloads go through one shared (HTTP/2 when
+available) connection pool, stale entries are revalidated with
+ETag / If-Modified-Since, and interrupted downloads resume with range
+requests.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Optional dependency - h2 (HTTP/2 support for httpx)
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+# Sentinel returned by conditional requests answered with 304
+_NOT_MODIFIED = object()
+
+
+class PDFStore:
+    """
+    Content-addressed PDF store with LRU eviction.
+
+    Layout under ``store_dir``:
+    - ``blobs/{hash[:2]}/{hash}.pdf``: PDF bytes, named by SHA-256
+    - ``partial/{url_hash}.part``: interrupted downloads, resumed via Range
+    - ``index.json``: key -> hash/validators, hash -> size/last access
+    """
+
+    def __init__(
+        self,
+        store_dir: str,
+        max_size_mb: int = 2000,
+        download_timeout: float = 30,
+        max_connections: int = 8,
+        revalidate_after_hours: int = 168
+    ):
+        """
+        Initialize the PDF store.
+
+        Args:
+            store_dir: Directory for blobs, partial downloads and the index
+            max_size_mb: Maximum total blob size before LRU eviction
+            download_timeout: HTTP timeout in seconds (per network operation)
+            max_connections: Size of the shared connection pool
+            revalidate_after_hours: Age after which a stored PDF is revalidated
+                with a conditional request (0 disables revalidation)
+        """
+        self.store_dir = Path(store_dir)
+        self.blob_dir = self.store_dir / "blobs"
+        self.partial_dir = self.store_dir / "partial"
+        self.index_path = self.store_dir / "index.json"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+
+        self.max_size_mb = max_size_mb
+        self.download_timeout = download_timeout
+        self.max_connections = max_connections
+        self.revalidate_after_hours = revalidate_after_hours
+
+        self._lock = threading.RLock()
+        # url_hash -> [lock, users]; one download per URL at a time, since
+        # concurrent fetches would share (and corrupt) the same partial file
+        self._download_locks: Dict[str, List[Any]] = {}
+        self._index = self._load_index()
+        self._last_save = time.monotonic()
+
+        self._client: Optional[httpx.Client] = None
+
+        logger.info(
+            f"Initialized PDF store: dir={store_dir}, max_size={max_size_mb}MB, "
+            f"blobs={len(self._index['blobs'])}, http2={HAS_H2}"
+        )
+
+    # Public API
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get stored PDF bytes for a key without touching the network.
+
+        Args:
+            key: Paper ID or URL
+
+        Returns:
+            PDF bytes or None if not stored
+        """
+        with self._lock:
+            entry = self._index["keys"].get(key)
+
+        if entry is None:
+            return self._import_legacy(key)
+
+        return self._read_blob(entry["hash"])
+
+    def fetch(self, url: str, key: Optional[str] = None) -> Optional[bytes]:
+        """
+        Get PDF bytes from the store, downloading or revalidating as needed.
+
+        Args:
+            url: PDF URL
+            key: Optional paper ID to index the PDF under (default: the URL)
+
+        Returns:
+            PDF bytes or None if unavailable
+        """
+        key = key or url
+
+        with self._lock:
+            entry = self._index["keys"].get(key)
+
+        if entry is None:
+            data = self._import_legacy(key, url)
+            if data is not None:
+                return data
+
+        if entry is not None:
+            data = self._read_blob(entry["hash"])
+            if data is not None and not self._needs_revalidation(entry):
+                return data
+
+            if data is not None:
+                result = self._download(url, etag=entry.get("etag"), last_modified=entry.get("last_modified"))
+
+                if result is _NOT_MODIFIED:
+                    with self._lock:
+                        entry["validated_at"] = datetime.utcnow().isoformat()
+                        self._save_index()
+                    logger.debug(f"PDF not modified: {key}")
+                    return data
+
+                if result is None:
+                    # Network failure: a stale copy beats no copy
+                    return data
+
+                new_data, etag, last_modified = result
+                self.put(key, url, new_data, etag=etag, last_modified=last_modified)
+                return new_data
+
+        logger.info(f"Downloading PDF from {url}")
+        result = self._download(url)
+        if result is None or result is _NOT_MODIFIED:
+            return None
+
+        data, etag, last_modified = result
+        self.put(key, url, data, etag=etag, last_modified=last_modified)
+        return data
+
+    def put(
+        self,
+        key: str,
+        url: Optional[str],
+        data: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> str:
+        """
+        Store PDF bytes under a key.
+
+        Args:
+            key: Paper ID or URL
+            url: Source URL (for revalidation)
+            data: PDF bytes
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+
+        Returns:
+            Content hash of the stored PDF
+        """
+        content_hash = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(content_hash)
+
+        if not blob_path.exists():
+            blob_path.parent.mkdir(exist_ok=True)
+            # Unique temp name: concurrent puts of the same PDF each write their
+            # own file, and replacing an existing blob with identical bytes is harmless
+            with tempfile.NamedTemporaryFile(dir=blob_path.parent, suffix=".tmp", delete=False) as f:
+                f.write(data)
+            try:
+                os.replace(f.name, blob_path)
+            except OSError:
+                Path(f.name).unlink(missing_ok=True)
+                if not blob_path.exists():
+                    raise
+
+        now = datetime.utcnow().isoformat()
+        with self._lock:
+            self._index["keys"][key] = {
+                "hash": content_hash,
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "validated_at": now
+            }
+            self._index["blobs"][content_hash] = {
+                "size": len(data),
+                "last_access": time.time()
+            }
+            self._evict(keep=content_hash)
+            self._save_index()
+
+        return content_hash
+
+    def hash_for(self, key: str) -> Optional[str]:
+        """
+        Get the content hash stored for a key.
+
+        Args:
+            key: Paper ID or URL
+
+        Returns:
+            Hex SHA-256 or None
+        """
+        with self._lock:
+            entry = self._index["keys"].get(key)
+            return entry["hash"] if entry else None
+
+    def blob_path(self, content_hash: str) -> Path:
+        """
+        Get the file path of a stored PDF (the file may have been evicted).
+
+        Args:
+            content_hash: Hex SHA-256 from ``hash_for``
+
+        Returns:
+            Blob path
+        """
+        return self._blob_path(content_hash)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with store statistics
+        """
+        with self._lock:
+            total_bytes = sum(b["size"] for b in self._index["blobs"].values())
+            return {
+                "cache_dir": str(self.store_dir),
+                "file_count": len(self._index["blobs"]),
+                "key_count": len(self._index["keys"]),
+                "size_mb": round(total_bytes / (1024 * 1024), 2),
+                "max_size_mb": self.max_size_mb,
+                "partial_downloads": len(list(self.partial_dir.glob("*.part")))
+            }
+
+    def clear(self):
+        """Remove all stored PDFs and partial downloads."""
+        with self._lock:
+            count = 0
+            for content_hash in list(self._index["blobs"]):
+                self._blob_path(content_hash).unlink(missing_ok=True)
+                count += 1
+            for part in self.partial_dir.glob("*"):
+                part.unlink()
+
+            self._index = {"keys": {}, "blobs": {}}
+            self._save_index()
+
+        logger.info(f"Cleared {count} PDFs from store")
+
+    def flush(self):
+        """Persist the index (access times are otherwise saved lazily)."""
+        with self._lock:
+            self._save_index()
+
+    def close(self):
+        """Persist the index and close the shared connection pool."""
+        self.flush()
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    # Internal helpers
+
+    def _get_client(self) -> httpx.Client:
+        """Get the shared HTTP client, creating it on first use."""
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=self.download_timeout,
+                    follow_redirects=True,
+                    http2=HAS_H2,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections
+                    )
+                )
+            return self._client
+
+    def _download(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """
+        Download a PDF, conditionally and/or resuming a partial download.
+
+        Args:
+            url: PDF URL
+            etag: Stored ETag for If-None-Match
+            last_modified: Stored Last-Modified for If-Modified-Since
+
+        Returns:
+            (bytes, etag, last_modified), _NOT_MODIFIED, or None on failure
+        """
+        url_hash = hashlib.sha256(url.encode()).hexdigest()
+        with self._download_lock(url_hash):
+            return self._download_locked(url, url_hash, etag, last_modified)
+
+    @contextmanager
+    def _download_lock(self, url_hash: str) -> Iterator[None]:
+        """Hold the per-URL download lock, dropping it once no fetch uses it."""
+        with self._lock:
+            slot = self._download_locks.setdefault(url_hash, [threading.Lock(), 0])
+            slot[1] += 1
+        try:
+            with slot[0]:
+                yield
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if not slot[1]:
+                    del self._download_locks[url_hash]
+
+    def _download_locked(
+        self,
+        url: str,
+        url_hash: str,
+        etag: Optional[str],
+        last_modified: Optional[str]
+    ):
+        """Body of ``_download``; the caller holds the URL's download lock."""
+        part_path = self.partial_dir / f"{url_hash}.part"
+        part_meta_path = self.partial_dir / f"{url_hash}.json"
+
+        headers = {}
+        offset = part_path.stat().st_size if part_path.exists() else 0
+
+        if offset:
+            # Resume; If-Range makes the server send the full body if the file changed
+            headers["Range"] = f"bytes={offset}-"
+            try:
+                validator = json.loads(part_meta_path.read_text()).get("validator")
+            except Exception:
+                validator = None
+            if validator:
+                headers["If-Range"] = validator
+        else:
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            with self._get_client().stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    return _NOT_MODIFIED
+
+                if response.status_code == 416:
+                    # Partial file is stale or complete; start over next time
+                    part_path.unlink(missing_ok=True)
+                    part_meta_path.unlink(missing_ok=True)
+                    return None
+
+                response.raise_for_status()
+
+                content_type = response.headers.get("content-type", "")
+                if "pdf" not in content_type.lower() and "octet-stream" not in content_type.lower():
+                    logger.warning(f"URL does not appear to be a PDF: {url}")
+
+                new_etag = response.headers.get("etag")
+                new_last_modified = response.headers.get("last-modified")
+                resumable = response.headers.get("accept-ranges", "").lower() == "bytes"
+
+                if response.status_code == 206 and offset:
+                    mode = 'ab'
+                    logger.info(f"Resuming PDF download at byte {offset}: {url}")
+                else:
+                    mode = 'wb'
+                    part_meta_path.write_text(json.dumps({
+                        "url": url,
+                        "validator": new_etag or new_last_modified
+                    }))
+
+                try:
+                    with open(part_path, mode) as f:
+                        for chunk in response.iter_bytes():
+                            f.write(chunk)
+                except (httpx.TimeoutException, httpx.TransportError):
+                    if not resumable and response.status_code != 206:
+                        part_path.unlink(missing_ok=True)
+                        part_meta_path.unlink(missing_ok=True)
+                    raise
+
+            data = part_path.read_bytes()
+            part_path.unlink(missing_ok=True)
+            part_meta_path.unlink(missing_ok=True)
+            return data, new_etag, new_last_modified
+
+        except httpx.TimeoutException:
+            logger.error(f"Timeout downloading PDF from {url}")
+            return None
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error downloading PDF from {url}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error downloading PDF from {url}: {e}")
+            return None
+
+    def _needs_revalidation(self, entry: Dict[str, Any]) -> bool:
+        """Check whether a stored entry is old enough to revalidate."""
+        if not self.revalidate_after_hours or not entry.get("url"):
+            return False
+        if not (entry.get("etag") or entry.get("last_modified")):
+            # Nothing to validate against; PDFs for a given ID rarely change
+            return False
+
+        validated_at = datetime.fromisoformat(entry["validated_at"])
+        return datetime.utcnow() > validated_at + timedelta(hours=self.revalidate_after_hours)
+
+    def _blob_path(self, content_hash: str) -> Path:
+        """Get the file path for a content hash."""
+        return self.blob_dir / content_hash[:2] / f"{content_hash}.pdf"
+
+    def _read_blob(self, content_hash: str) -> Optional[bytes]:
+        """Read a blob and record the access for LRU."""
+        blob_path = self._blob_path(content_hash)
+        if not blob_path.exists():
+            return None
+
+        data = blob_path.read_bytes()
+
+        with self._lock:
+            blob = self._index["blobs"].get(content_hash)
+            if blob is not None:
+                blob["last_access"] = time.time()
+            # Access times only matter for eviction order; save them lazily
+            if time.monotonic() - self._last_save > 30:
+                self._save_index()
+
+        return data
+
+    def _import_legacy(self, key: str, url: Optional[str] = None) -> Optional[bytes]:
+        """Move a PDF from the old ``{paper_id}.pdf`` layout into the store."""
+        legacy_path = self.store_dir / f"{key}.pdf"
+        if "/" in key or not legacy_path.is_file():
+            return None
+
+        data = legacy_path.read_bytes()
+        self.put(key, url, data)
+        legacy_path.unlink()
+        logger.debug(f"Imported legacy cached PDF: {key}")
+        return data
+
+    def _evict(self, keep: Optional[str] = None):
+        """Evict least recently used blobs (except ``keep``) until under the size limit."""
+        max_bytes = self.max_size_mb * 1024 * 1024
+        total_bytes = sum(b["size"] for b in self._index["blobs"].values())
+        if total_bytes <= max_bytes:
+            return
+
+        evicted = set()
+        for content_hash, blob in sorted(self._index["blobs"].items(), key=lambda x: x[1]["last_access"]):
+            if total_bytes <= max_bytes * 0.9:  # Clean to 90% of max
+                break
+            if content_hash == keep:
+                continue
+            self._blob_path(content_hash).unlink(missing_ok=True)
+            total_bytes -= blob["size"]
+            evicted.add(content_hash)
+
+        for content_hash in evicted:
+            del self._index["blobs"][content_hash]
+        self._index["keys"] = {
+            k: v for k, v in self._index["keys"].items() if v["hash"] not in evicted
+        }
+
+        logger.info(f"Evicted {len(evicted)} PDFs from store")
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index from disk."""
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r') as f:
+                    index = json.load(f)
+                index.setdefault("keys", {})
+                index.setdefault("blobs", {})
+                return index
+            except Exception as e:
+                logger.warning(f"Error reading PDF store index, starting empty: {e}")
+
+        return {"keys": {}, "blobs": {}}
+
+    def _save_index(self):
+        """Write the index to disk atomically (caller holds the lock)."""
+        try:
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(self._index, f)
+            tmp_path.replace(self.index_path)
+            self._last_save = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Error writing PDF store index: {e}")
@@ -10,13 +10,29 @@ Provides:
 
 import logging
 import json
+import os
+from itertools import count
 from typing import List, Dict, Any, Optional, Tuple, Set
 from pathlib import Path
 from difflib import SequenceMatcher
 import hashlib
 
-from evoverse.literature.base_client import PaperMetadata
-from evoverse.literature.citations import CitationFormatter, papers_to_bibtex, papers_to_ris
+from evoverse.literature.base_client import PaperMetadata, PaperSource, Author
+from evoverse.literature.citations import (
+    CitationFormatter,
+    CitationParser,
+    papers_to_bibtex,
+    papers_to_ris
+)
+from evoverse.literature.dedup_index import (
+    DuplicateIndex,
+    cluster_pairs,
+    find_similar_title_pairs,
+    normalize_arxiv_id,
+    normalize_doi,
+    normalize_pubmed_id
+)
+from evoverse.literature.reference_store import ReferenceJournal, ReferenceSearchIndex
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +42,17 @@ class ReferenceManager:
     Manage collections of references with deduplication.
 
     Provides storage, search, deduplication, and export capabilities.
+
+    Storage is a JSON snapshot plus an append-only journal of changes
+    (``<storage_path>.journal``), folded into the snapshot once the journal
+    outgrows the library. The library is loaded on first access.
     """
 
     def __init__(
         self,
         storage_path: Optional[str] = None,
-        auto_deduplicate: bool = True
+        auto_deduplicate: bool = True,
+        compact_threshold: int = 1000
     ):
         """
         Initialize reference manager.
@@ -39,6 +60,7 @@ class ReferenceManager:
         Args:
             storage_path: Path to persistent storage file
             auto_deduplicate: Whether to auto-deduplicate on add
+            compact_threshold: Minimum journal entries before compaction
 
         Example:
             ```python
@@ -51,20 +73,41 @@ class ReferenceManager:
         self.storage_path = Path(storage_path) if storage_path else None
         self.auto_deduplicate = auto_deduplicate
 
-        # Storage: ref_id -> PaperMetadata
-        self.references: Dict[str, PaperMetadata] = {}
+        # Storage: ref_id -> PaperMetadata (see ``references``)
+        self._references: Dict[str, PaperMetadata] = {}
 
         # Citation relationships: citing_id -> [cited_ids]
-        self.citation_links: Dict[str, List[str]] = {}
+        self._citation_links: Dict[str, List[str]] = {}
 
         # Deduplication engine
         self.dedup_engine = DeduplicationEngine()
 
-        # Load from storage if exists
-        if self.storage_path and self.storage_path.exists():
-            self._load_from_storage()
+        # Identifier/title indexes for duplicate lookup (rebuilt on demand when stale)
+        self._dup_index = DuplicateIndex()
+        self._dup_index_stale = False
+
+        # Inverted index for search, and insertion order for stable results
+        self._search_index = ReferenceSearchIndex()
+        self._order: Dict[str, int] = {}
+        self._order_counter = count()
+
+        # Snapshot + journal storage, loaded on first access
+        self._journal = ReferenceJournal(self.storage_path, compact_threshold) if self.storage_path else None
+        self._loaded = self._journal is None or not self._journal.exists()
+
+        logger.info(f"Initialized ReferenceManager (storage={self.storage_path})")
 
-        logger.info(f"Initialized ReferenceManager (refs={len(self.references)})")
+    @property
+    def references(self) -> Dict[str, PaperMetadata]:
+        """Stored references (ref_id -> PaperMetadata), loaded on first access."""
+        self._ensure_loaded()
+        return self._references
+
+    @property
+    def citation_links(self) -> Dict[str, List[str]]:
+        """Citation relationships (citing_id -> [cited_ids]), loaded on first access."""
+        self._ensure_loaded()
+        return self._citation_links
 
     def add_reference(self, paper: PaperMetadata) -> str:
         """
@@ -81,25 +124,11 @@ class ReferenceManager:
             ref_id = manager.add_reference(paper)
             ```
         """
-        # Check for duplicates if auto-dedup enabled
-        if self.auto_deduplicate:
-            existing_id = self._find_duplicate(paper)
-            if existing_id:
-                logger.debug(f"Duplicate found, merging with {existing_id}")
-                self._merge_papers(existing_id, paper)
-                return existing_id
-
-        # Generate reference ID
-        ref_id = self._generate_ref_id(paper)
-
-        # Store reference
-        self.references[ref_id] = paper
+        ref_id = self._add_reference(paper)
 
-        # Save to storage
-        if self.storage_path:
-            self._save_to_storage()
+        # Append to storage journal
+        self._persist(put_ids=[ref_id])
 
-        logger.debug(f"Added reference: {ref_id}")
         return ref_id
 
     def add_references(self, papers: List[PaperMetadata]) -> List[str]:
@@ -118,15 +147,71 @@ class ReferenceManager:
             print(f"Added {len(ref_ids)} references")
             ```
         """
-        ref_ids = []
+        self._ensure_loaded()
+        self._ensure_dup_index()
+        self._dup_index.prepare(papers)
+        try:
+            ref_ids = [self._add_reference(paper) for paper in papers]
+        finally:
+            self._dup_index.clear_prepared()
 
-        for paper in papers:
-            ref_id = self.add_reference(paper)
-            ref_ids.append(ref_id)
+        # One journal append for the whole batch
+        self._persist(put_ids=list(dict.fromkeys(ref_ids)))
 
         logger.info(f"Added {len(ref_ids)} references")
         return ref_ids
 
+    def import_library(
+        self,
+        input_file: str,
+        format: Optional[str] = None,
+        workers: int = 1,
+        batch_size: int = 5000
+    ) -> List[str]:
+        """
+        Import a BibTeX or RIS file, streaming it in batches.
+
+        Entries are parsed in chunks (in a process pool when workers > 1) and
+        added through ``add_references``, so memory stays bounded by the
+        batch size rather than the file size.
+
+        Args:
+            input_file: Input file path
+            format: Import format (bibtex, ris; default: from file extension)
+            workers: Parsing processes
+            batch_size: References per add_references batch
+
+        Returns:
+            List of reference IDs, in file order
+
+        Example:
+            ```python
+            ref_ids = manager.import_library("export.bib", workers=4)
+            ```
+        """
+        parser = CitationParser()
+        if format is None:
+            papers = parser.iter_file(input_file, workers=workers)
+        elif format == "bibtex":
+            papers = parser.iter_bibtex(input_file, workers=workers)
+        elif format == "ris":
+            papers = parser.iter_ris(input_file, workers=workers)
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+
+        ref_ids: List[str] = []
+        batch: List[PaperMetadata] = []
+        for paper in papers:
+            batch.append(paper)
+            if len(batch) >= batch_size:
+                ref_ids.extend(self.add_references(batch))
+                batch = []
+        if batch:
+            ref_ids.extend(self.add_references(batch))
+
+        logger.info(f"Imported {len(ref_ids)} references from {input_file}")
+        return ref_ids
+
     def get_reference(self, ref_id: str) -> Optional[PaperMetadata]:
         """
         Retrieve reference by ID.
@@ -147,12 +232,16 @@ class ReferenceManager:
         """
         Search within reference collection.
 
+        Candidates come from an inverted token index (each query word must
+        occur inside an indexed word) and are then checked for the query as
+        a substring of the field, so results match a plain substring scan.
+
         Args:
             query: Search query
-            fields: Fields to search in
+            fields: Fields to search in (title, authors, keywords, abstract)
 
         Returns:
-            List of matching papers
+            List of matching papers, in insertion order
 
         Example:
             ```python
@@ -163,24 +252,33 @@ class ReferenceManager:
             ```
         """
         query_lower = query.lower()
-        matches = []
+        fields = [f for f in fields if f in ReferenceSearchIndex.FIELDS]
+        references = self.references
+
+        # Narrow down with the inverted index
+        candidate_ids: Optional[Set[str]] = set()
+        for field in fields:
+            if not self._search_index.is_built(field):
+                self._search_index.build(field, references)
+            field_ids = self._search_index.candidates(field, query)
+            if field_ids is None:
+                # No word characters in the query: fall back to a full scan
+                candidate_ids = None
+                break
+            candidate_ids |= field_ids
+
+        if candidate_ids is None:
+            candidates = list(references.items())
+        else:
+            candidates = [(ref_id, references[ref_id]) for ref_id in sorted(candidate_ids, key=self._order.get)]
 
-        for paper in self.references.values():
+        matches = []
+        for ref_id, paper in candidates:
             # Check each field
             for field in fields:
-                if field == "title" and paper.title:
-                    if query_lower in paper.title.lower():
-                        matches.append(paper)
-                        break
-                elif field == "authors" and paper.authors:
-                    author_names = " ".join([a.name for a in paper.authors]).lower()
-                    if query_lower in author_names:
-                        matches.append(paper)
-                        break
-                elif field == "abstract" and paper.abstract:
-                    if query_lower in paper.abstract.lower():
-                        matches.append(paper)
-                        break
+                if query_lower in ReferenceSearchIndex.field_text(paper, field).lower():
+                    matches.append(paper)
+                    break
 
         logger.info(f"Search '{query}' found {len(matches)} results")
         return matches
@@ -223,13 +321,10 @@ class ReferenceManager:
             )
 
         # Rebuild references dict
-        self.references = {}
-        for paper in unique_papers:
-            ref_id = self._generate_ref_id(paper)
-            self.references[ref_id] = paper
+        self._replace_all({self._generate_ref_id(paper): paper for paper in unique_papers})
 
-        # Save changes
-        if self.storage_path:
+        # Everything changed: write a fresh snapshot
+        if self._journal:
             self._save_to_storage()
 
         duplicates_removed = original_count - len(unique_papers)
@@ -278,11 +373,14 @@ class ReferenceManager:
         kept_paper = self.references[keep_id]
         discarded_paper = self.references[discard_id]
 
+        # Unindex before merging: merge_paper_metadata updates kept_paper in place
+        self._remove(keep_id)
+        self._remove(discard_id)
+
         merged_paper = self.dedup_engine.merge_paper_metadata([kept_paper, discarded_paper])
 
         # Update references
-        self.references[keep_id] = merged_paper
-        del self.references[discard_id]
+        self._put(keep_id, merged_paper)
 
         # Update citation links
         if discard_id in self.citation_links:
@@ -293,8 +391,7 @@ class ReferenceManager:
             del self.citation_links[discard_id]
 
         # Save changes
-        if self.storage_path:
-            self._save_to_storage()
+        self._persist(put_ids=[keep_id], deleted_ids=[discard_id], link_ids=[keep_id, discard_id])
 
         logger.info(f"Merged {discard_id} into {keep_id}")
 
@@ -378,85 +475,188 @@ class ReferenceManager:
             title_hash = hashlib.md5(paper.title.encode()).hexdigest()[:8]
             return f"ref_{title_hash}"
 
+    def _add_reference(self, paper: PaperMetadata) -> str:
+        """Add (or merge) a reference without saving to storage."""
+        self._ensure_loaded()
+
+        # Check for duplicates if auto-dedup enabled
+        if self.auto_deduplicate:
+            existing_id = self._find_duplicate(paper)
+            if existing_id:
+                logger.debug(f"Duplicate found, merging with {existing_id}")
+                self._merge_papers(existing_id, paper)
+                return existing_id
+
+        # Generate reference ID
+        ref_id = self._generate_ref_id(paper)
+
+        # Store reference
+        if ref_id in self._references:
+            self._remove(ref_id)
+        self._put(ref_id, paper)
+
+        logger.debug(f"Added reference: {ref_id}")
+        return ref_id
+
     def _find_duplicate(self, paper: PaperMetadata) -> Optional[str]:
-        """Find if paper is a duplicate of existing reference."""
-        for ref_id, existing_paper in self.references.items():
-            if self.dedup_engine.is_duplicate(existing_paper, paper):
-                return ref_id
-        return None
+        """
+        Find if paper is a duplicate of existing reference.
+
+        Identifiers are looked up in hash indexes; titles are only compared
+        against candidates from the title blocking index.
+        """
+        def title_match(ref_id: str) -> bool:
+            existing = self.references.get(ref_id)
+            return existing is not None and self.dedup_engine._titles_match(existing.title, paper.title)
+
+        self._ensure_dup_index()
+        return self._dup_index.find(paper, title_match)
 
     def _merge_papers(self, ref_id: str, new_paper: PaperMetadata):
         """Merge new paper data into existing reference."""
-        existing_paper = self.references[ref_id]
+        existing_paper = self._references[ref_id]
+        # Unindex before merging: merge_paper_metadata updates existing_paper in place
+        self._remove(ref_id)
         merged_paper = self.dedup_engine.merge_paper_metadata([existing_paper, new_paper])
-        self.references[ref_id] = merged_paper
+        self._put(ref_id, merged_paper)
+
+    def _put(self, ref_id: str, paper: PaperMetadata):
+        """Store a (new) reference and index it."""
+        self._references[ref_id] = paper
+        self._order[ref_id] = next(self._order_counter)
+        if not self._dup_index_stale:
+            self._dup_index.add(ref_id, paper)
+        self._search_index.add(ref_id, paper)
+
+    def _remove(self, ref_id: str) -> PaperMetadata:
+        """Remove a reference and unindex it."""
+        paper = self._references.pop(ref_id)
+        del self._order[ref_id]
+        if not self._dup_index_stale:
+            self._dup_index.remove(ref_id, paper)
+        self._search_index.remove(ref_id, paper)
+        return paper
+
+    def _replace_all(self, references: Dict[str, PaperMetadata]):
+        """Replace all references; indexes are rebuilt when next needed."""
+        self._references = references
+        self._order = {ref_id: next(self._order_counter) for ref_id in references}
+        self._dup_index_stale = True
+        self._search_index.clear()
+
+    def _ensure_dup_index(self):
+        """Rebuild the duplicate index if the library was replaced."""
+        if self._dup_index_stale:
+            self._dup_index.rebuild(self._references)
+            self._dup_index_stale = False
+
+    def _ensure_loaded(self):
+        """Load the library from storage on first access."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._load_from_storage()
+
+    def _persist(
+        self,
+        put_ids: List[str] = (),
+        deleted_ids: List[str] = (),
+        link_ids: List[str] = ()
+    ):
+        """Append changes to the storage journal, compacting when it grows large."""
+        if self._journal is None:
+            return
+
+        try:
+            entries = [
+                {"op": "put", "ref_id": ref_id, "paper": self._paper_to_record(self._references[ref_id])}
+                for ref_id in put_ids
+            ]
+            entries += [{"op": "delete", "ref_id": ref_id} for ref_id in deleted_ids]
+            entries += [
+                {"op": "links", "ref_id": ref_id, "cited": self._citation_links.get(ref_id)}
+                for ref_id in link_ids
+            ]
+            self._journal.append(entries)
+
+            if self._journal.needs_compaction(len(self._references)):
+                self._save_to_storage()
+
+        except Exception as e:
+            logger.error(f"Failed to save to storage: {e}")
 
     def _save_to_storage(self):
-        """Save references to disk."""
+        """Write a full snapshot of the library and truncate the journal."""
         try:
-            data = {
-                "references": {},
-                "citation_links": self.citation_links
+            records = {
+                ref_id: self._paper_to_record(paper)
+                for ref_id, paper in self._references.items()
             }
-
-            # Serialize papers
-            for ref_id, paper in self.references.items():
-                data["references"][ref_id] = {
-                    "id": paper.id,
-                    "source": paper.source.value,
-                    "title": paper.title,
-                    "abstract": paper.abstract,
-                    "authors": [{"name": a.name} for a in paper.authors],
-                    "year": paper.year,
-                    "doi": paper.doi,
-                    "arxiv_id": paper.arxiv_id,
-                    "pubmed_id": paper.pubmed_id,
-                    "url": paper.url,
-                    "journal": paper.journal,
-                    "citation_count": paper.citation_count
-                }
-
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._journal.compact(records, self._citation_links)
 
         except Exception as e:
             logger.error(f"Failed to save to storage: {e}")
 
     def _load_from_storage(self):
-        """Load references from disk."""
+        """Load references from the snapshot and replay the journal."""
         try:
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
+            records, citation_links = self._journal.load()
 
-            # Deserialize papers
-            from evoverse.literature.base_client import PaperSource, Author
+            self._replace_all({
+                ref_id: self._record_to_paper(paper_data)
+                for ref_id, paper_data in records.items()
+            })
+            self._citation_links = citation_links
 
-            for ref_id, paper_data in data.get("references", {}).items():
-                authors = [Author(name=a["name"]) for a in paper_data.get("authors", [])]
+            logger.info(f"Loaded {len(self._references)} references from storage")
 
-                paper = PaperMetadata(
-                    id=paper_data.get("id", ""),
-                    source=PaperSource(paper_data.get("source", "other")),
-                    title=paper_data.get("title", ""),
-                    abstract=paper_data.get("abstract", ""),
-                    authors=authors,
-                    year=paper_data.get("year"),
-                    doi=paper_data.get("doi"),
-                    arxiv_id=paper_data.get("arxiv_id"),
-                    pubmed_id=paper_data.get("pubmed_id"),
-                    url=paper_data.get("url"),
-                    journal=paper_data.get("journal"),
-                    citation_count=paper_data.get("citation_count", 0)
-                )
-
-                self.references[ref_id] = paper
+        except Exception as e:
+            logger.error(f"Failed to load from storage: {e}")
 
-            self.citation_links = data.get("citation_links", {})
+    @staticmethod
+    def _paper_to_record(paper: PaperMetadata) -> Dict[str, Any]:
+        """Serialize a paper for storage."""
+        return {
+            "id": paper.id,
+            "source": paper.source.value,
+            "title": paper.title,
+            "abstract": paper.abstract,
+            "authors": [{"name": a.name} for a in paper.authors],
+            "year": paper.year,
+            "doi": paper.doi,
+            "arxiv_id": paper.arxiv_id,
+            "pubmed_id": paper.pubmed_id,
+            "url": paper.url,
+            "journal": paper.journal,
+            "keywords": paper.keywords,
+            "citation_count": paper.citation_count
+        }
 
-            logger.info(f"Loaded {len(self.references)} references from storage")
+    @staticmethod
+    def _record_to_paper(paper_data: Dict[str, Any]) -> PaperMetadata:
+        """Deserialize a stored paper."""
+        authors = [Author(name=a["name"]) for a in paper_data.get("authors", [])]
 
-        except Exception as e:
-            logger.error(f"Failed to load from storage: {e}")
+        try:
+            source = PaperSource(paper_data.get("source", "unknown"))
+        except ValueError:
+            source = PaperSource.UNKNOWN
+
+        return PaperMetadata(
+            id=paper_data.get("id", ""),
+            source=source,
+            title=paper_data.get("title", ""),
+            abstract=paper_data.get("abstract", ""),
+            authors=authors,
+            year=paper_data.get("year"),
+            doi=paper_data.get("doi"),
+            arxiv_id=paper_data.get("arxiv_id"),
+            pubmed_id=paper_data.get("pubmed_id"),
+            url=paper_data.get("url"),
+            journal=paper_data.get("journal"),
+            keywords=paper_data.get("keywords"),
+            citation_count=paper_data.get("citation_count", 0)
+        )
 
     def _export_json(self, papers: List[PaperMetadata], output_file: str):
         """Export to JSON format."""
@@ -503,11 +703,20 @@ class DeduplicationEngine:
     """
     Advanced reference deduplication.
 
-    Supports multiple strategies for duplicate detection.
+    Supports multiple strategies for duplicate detection. Batch title
+    deduplication uses LSH blocking instead of all-pairs comparison, so it
+    scales to 100k+ records.
     """
 
-    def __init__(self):
-        """Initialize deduplication engine."""
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Initialize deduplication engine.
+
+        Args:
+            workers: Processes for batch title verification
+                (default: min(4, CPU count))
+        """
+        self.workers = workers or min(4, os.cpu_count() or 1)
         logger.debug("Initialized DeduplicationEngine")
 
     def deduplicate_by_doi(
@@ -552,6 +761,11 @@ class DeduplicationEngine:
         """
         Deduplicate by fuzzy title matching.
 
+        Papers whose titles reach the threshold (directly or through other
+        papers) form one cluster, merged with ``merge_paper_metadata`` into
+        its first paper. Candidate pairs come from LSH blocking (see
+        ``find_similar_title_pairs``) rather than comparing all pairs.
+
         Args:
             papers: List of papers
             threshold: Similarity threshold (0-1)
@@ -559,30 +773,12 @@ class DeduplicationEngine:
         Returns:
             Tuple of (unique_papers, duplicate_groups)
         """
-        unique_papers = []
-        duplicate_groups = {}
-        processed_titles = []
-
-        for paper in papers:
-            is_duplicate = False
-
-            for i, existing_title in enumerate(processed_titles):
-                similarity = self._title_similarity(paper.title, existing_title)
-
-                if similarity >= threshold:
-                    # Duplicate found
-                    is_duplicate = True
-                    group_key = existing_title
-                    if group_key in duplicate_groups:
-                        duplicate_groups[group_key].append(paper.title)
-                    break
-
-            if not is_duplicate:
-                unique_papers.append(paper)
-                processed_titles.append(paper.title)
-                duplicate_groups[paper.title] = [paper.title]
-
-        return unique_papers, duplicate_groups
+        pairs = find_similar_title_pairs(
+            [paper.title for paper in papers],
+            threshold=threshold,
+            workers=self.workers
+        )
+        return self._merge_clusters(papers, cluster_pairs(len(papers), pairs))
 
     def comprehensive_deduplication(
         self,
@@ -591,7 +787,9 @@ class DeduplicationEngine:
         """
         Multi-level deduplication.
 
-        Priority: DOI > arXiv > PubMed > fuzzy title
+        Papers sharing a normalized DOI, arXiv ID or PubMed ID, or with
+        fuzzy-matching titles, are clustered and merged into the first
+        paper of each cluster.
 
         Args:
             papers: List of papers
@@ -599,63 +797,45 @@ class DeduplicationEngine:
         Returns:
             Tuple of (unique_papers, duplicate_groups)
         """
-        # Track seen identifiers
-        seen_dois = set()
-        seen_arxiv = set()
-        seen_pubmed = set()
-        seen_titles = []
-
+        pairs = self._identifier_pairs(papers)
+        pairs.extend(find_similar_title_pairs(
+            [paper.title for paper in papers],
+            threshold=0.9,
+            workers=self.workers
+        ))
+        return self._merge_clusters(papers, cluster_pairs(len(papers), pairs))
+
+    def _identifier_pairs(self, papers: List[PaperMetadata]) -> List[Tuple[int, int]]:
+        """Pair each paper with the first paper sharing one of its identifiers."""
+        pairs = []
+        for normalize, attr in (
+            (normalize_doi, "doi"),
+            (normalize_arxiv_id, "arxiv_id"),
+            (normalize_pubmed_id, "pubmed_id")
+        ):
+            first_seen: Dict[str, int] = {}
+            for i, paper in enumerate(papers):
+                value = normalize(getattr(paper, attr))
+                if value:
+                    first = first_seen.setdefault(value, i)
+                    if first != i:
+                        pairs.append((first, i))
+        return pairs
+
+    def _merge_clusters(
+        self,
+        papers: List[PaperMetadata],
+        clusters: List[List[int]]
+    ) -> Tuple[List[PaperMetadata], Dict[str, List[str]]]:
+        """Merge each cluster into one paper; group titles by the kept title."""
         unique_papers = []
         duplicate_groups = {}
 
-        for paper in papers:
-            is_duplicate = False
-            group_key = None
-
-            # Check DOI
-            if paper.doi and paper.doi in seen_dois:
-                is_duplicate = True
-                group_key = f"DOI:{paper.doi}"
-
-            # Check arXiv
-            elif paper.arxiv_id and paper.arxiv_id in seen_arxiv:
-                is_duplicate = True
-                group_key = f"arXiv:{paper.arxiv_id}"
-
-            # Check PubMed
-            elif paper.pubmed_id and paper.pubmed_id in seen_pubmed:
-                is_duplicate = True
-                group_key = f"PubMed:{paper.pubmed_id}"
-
-            # Check fuzzy title
-            elif paper.title:
-                for existing_title in seen_titles:
-                    if self._title_similarity(paper.title, existing_title) >= 0.9:
-                        is_duplicate = True
-                        group_key = f"Title:{existing_title}"
-                        break
-
-            if is_duplicate:
-                # Add to duplicate group
-                if group_key not in duplicate_groups:
-                    duplicate_groups[group_key] = []
-                duplicate_groups[group_key].append(paper.title)
-            else:
-                # Add to unique papers
-                unique_papers.append(paper)
-
-                # Track identifiers
-                if paper.doi:
-                    seen_dois.add(paper.doi)
-                if paper.arxiv_id:
-                    seen_arxiv.add(paper.arxiv_id)
-                if paper.pubmed_id:
-                    seen_pubmed.add(paper.pubmed_id)
-                if paper.title:
-                    seen_titles.append(paper.title)
-
-                # Initialize group
-                duplicate_groups[paper.title] = [paper.title]
+        for cluster in clusters:
+            members = [papers[i] for i in cluster]
+            group_key = members[0].title
+            duplicate_groups[group_key] = [paper.title for paper in members]
+            unique_papers.append(self.merge_paper_metadata(members))
 
         return unique_papers, duplicate_groups
 
@@ -746,7 +926,7 @@ class DeduplicationEngine:
 
         # Check fuzzy title
         if paper1.title and paper2.title:
-            if self._title_similarity(paper1.title, paper2.title) >= 0.9:
+            if self._titles_match(paper1.title, paper2.title):
                 return True
 
         return False
@@ -763,6 +943,29 @@ class DeduplicationEngine:
         # Calculate similarity
         return SequenceMatcher(None, t1, t2).ratio()
 
+    def _titles_match(self, title1: str, title2: str, threshold: float = 0.9) -> bool:
+        """
+        Check whether title similarity reaches a threshold.
+
+        Same result as ``_title_similarity(...) >= threshold``, but rejects
+        clearly different titles with SequenceMatcher's cheap upper bounds
+        before computing the full ratio.
+        """
+        if not title1 or not title2:
+            return False
+
+        t1 = title1.lower().strip()
+        t2 = title2.lower().strip()
+        if not t1 or not t2:
+            return False
+
+        # Same bound as real_quick_ratio(), without building the matcher
+        if 2.0 * min(len(t1), len(t2)) / (len(t1) + len(t2)) < threshold:
+            return False
+
+        matcher = SequenceMatcher(None, t1, t2)
+        return matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold
+
 
 # Singleton instance
 _reference_manager: Optional[ReferenceManager] = None
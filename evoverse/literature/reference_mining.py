@@ -0,0 +1,534 @@
+"""
+Reference mining from extracted full texts.
+
+Turns the reference lists of stored full texts into citation edges
+without per-paper API calls:
+- Locate the references section and split it into reference strings
+- Extract DOIs, arXiv IDs and PubMed IDs from each reference
+- Resolve identifiers against a local identifier index
+- Emit (citing_id, cited_id) CITES edges for bulk graph loading
+
+Parsing runs in a process pool; workers read texts straight from the
+extracted-text cache so only hashes and results cross process boundaries.
+Cached texts that stop before the reference list (partial extractions,
+e.g. ``until_section="references"``) are re-extracted in full from the
+stored PDF.
+"""
+
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+
+from evoverse.literature.base_client import PaperMetadata
+from evoverse.literature.dedup_index import (
+    normalize_arxiv_id,
+    normalize_doi,
+    normalize_pubmed_id
+)
+from evoverse.literature.pdf_store import PDFStore
+from evoverse.literature.text_cache import ExtractedTextCache
+
+logger = logging.getLogger(__name__)
+
+# Trailing punctuation is stripped after matching (DOIs may legally contain it)
+_DOI_RE = re.compile(r'\b10\.\d{4,9}/[^\s"<>{}\[\]]+', re.IGNORECASE)
+_ARXIV_RE = re.compile(
+    r'(?:arxiv(?:\s*preprint)?\s*(?:abs/)?:?\s*|arxiv\.org/(?:abs|pdf)/)'
+    r'(\d{4}\.\d{4,5}(?:v\d+)?|[a-z\-]+(?:\.[a-z]{2})?/\d{7}(?:v\d+)?)',
+    re.IGNORECASE
+)
+_PMID_RE = re.compile(r'\bPMID:?\s*(\d{1,9})\b', re.IGNORECASE)
+
+# Reference list markers in whitespace-collapsed text: "[12] ..." or "12. Author"
+_BRACKET_MARKER_RE = re.compile(r'\[(\d{1,4})\]\s')
+_NUMBER_MARKER_RE = re.compile(r'(?:^|\s)(\d{1,4})\.\s(?=[A-Z])')
+_REFERENCES_HEADING_RE = re.compile(r'\b(?:References|REFERENCES|Bibliography|BIBLIOGRAPHY)\b')
+
+_MIN_MARKERS = 3  # Fewer numbered markers than this: treat the section as unsplittable
+
+# Text cache of a pool worker process
+_worker_text_cache: Optional[ExtractedTextCache] = None
+
+
+@dataclass
+class ReferenceString:
+    """A reference list entry and the identifiers found in it."""
+    text: str
+    dois: List[str] = field(default_factory=list)
+    arxiv_ids: List[str] = field(default_factory=list)
+    pubmed_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class MinedReferences:
+    """References mined from one paper's full text."""
+    paper_id: str
+    references: List[ReferenceString] = field(default_factory=list)
+    cited_ids: List[str] = field(default_factory=list)  # Resolved, in reference order
+    unresolved: List[ReferenceString] = field(default_factory=list)
+    skipped: Optional[str] = None  # Why the text could not be mined ("no_text", "incomplete")
+
+
+def extract_identifiers(text: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Extract normalized identifiers from a reference string.
+
+    Args:
+        text: Reference text
+
+    Returns:
+        Tuple of (DOIs, arXiv IDs, PubMed IDs), each deduplicated in order
+    """
+    dois = [normalize_doi(m.group(0).rstrip('.,;:)')) for m in _DOI_RE.finditer(text)]
+    arxiv_ids = [normalize_arxiv_id(m.group(1)) for m in _ARXIV_RE.finditer(text)]
+    pubmed_ids = [normalize_pubmed_id(m.group(1)) for m in _PMID_RE.finditer(text)]
+    return (
+        list(dict.fromkeys(d for d in dois if d)),
+        list(dict.fromkeys(a for a in arxiv_ids if a)),
+        list(dict.fromkeys(p for p in pubmed_ids if p))
+    )
+
+
+def find_references_section(text: Optional[str], sections: Optional[List[Dict[str, Any]]] = None) -> str:
+    """
+    Get the references section of a full text.
+
+    Uses detected section spans when available, otherwise the text after
+    the last "References"/"Bibliography" heading word.
+
+    Args:
+        text: Cleaned full text
+        sections: Section spans (see ``sections.build_sections``)
+
+    Returns:
+        References section text ("" if none found)
+    """
+    if not text:
+        return ""
+
+    for section in sections or []:
+        if section.get("name") == "references":
+            return text[section["start"]:section["end"]]
+
+    last = None
+    for last in _REFERENCES_HEADING_RE.finditer(text):
+        pass
+    return text[last.end():] if last else ""
+
+
+def split_references(section_text: str) -> List[str]:
+    """
+    Split a references section into individual reference strings.
+
+    Extracted text has its line breaks collapsed, so entries are split on
+    numbering markers ("[n]" or "n.") that count up from 1. Sections without
+    such numbering (author-year styles) are returned as a single string;
+    ``ReferenceMiner`` resolves every identifier in it (see
+    ``IdentifierIndex.resolve_all``), so each cited paper still gets an edge.
+
+    Args:
+        section_text: References section text
+
+    Returns:
+        List of reference strings
+    """
+    section_text = section_text.strip()
+    if not section_text:
+        return []
+
+    for marker_re in (_BRACKET_MARKER_RE, _NUMBER_MARKER_RE):
+        # Keep markers that continue the 1, 2, 3, ... sequence
+        starts = []
+        expected = 1
+        for match in marker_re.finditer(section_text):
+            if int(match.group(1)) == expected:
+                starts.append(match.start(1) - (1 if marker_re is _BRACKET_MARKER_RE else 0))
+                expected += 1
+        if len(starts) >= _MIN_MARKERS:
+            bounds = starts + [len(section_text)]
+            return [
+                section_text[bounds[i]:bounds[i + 1]].strip()
+                for i in range(len(starts))
+                if section_text[bounds[i]:bounds[i + 1]].strip()
+            ]
+
+    return [section_text]
+
+
+def parse_references(text: Optional[str], sections: Optional[List[Dict[str, Any]]] = None) -> List[ReferenceString]:
+    """
+    Parse the reference list of a full text.
+
+    Args:
+        text: Cleaned full text
+        sections: Section spans, if detected
+
+    Returns:
+        List of ReferenceString objects
+    """
+    references = []
+    for reference in split_references(find_references_section(text, sections)):
+        dois, arxiv_ids, pubmed_ids = extract_identifiers(reference)
+        references.append(ReferenceString(reference, dois, arxiv_ids, pubmed_ids))
+    return references
+
+
+def _get_worker_text_cache(cache_dir: str, extractor_version: str) -> ExtractedTextCache:
+    """Get this process's text cache."""
+    global _worker_text_cache
+    cache = _worker_text_cache
+    if cache is None or str(cache.cache_dir) != str(cache_dir) or cache.extractor_version != extractor_version:
+        cache = _worker_text_cache = ExtractedTextCache(cache_dir, extractor_version)
+    return cache
+
+
+def _extract_full_entry(
+    cache: ExtractedTextCache,
+    content_hash: str,
+    pdf_path: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """Parse a stored PDF without section or length bounds and cache the result."""
+    if not pdf_path or not Path(pdf_path).is_file():
+        return None
+
+    # PyMuPDF is only needed when a partial text has to be re-extracted
+    from evoverse.literature.pdf_extractor import _parse_pdf_bytes
+
+    entry = _parse_pdf_bytes(Path(pdf_path).read_bytes())
+    cache.set(
+        content_hash,
+        entry["text"],
+        entry["page_offsets"],
+        headings=entry["headings"],
+        sections=entry["sections"],
+        complete=entry["complete"]
+    )
+    return entry
+
+
+def _parse_cached_texts(
+    cache_dir: str,
+    extractor_version: str,
+    items: List[Tuple[str, Optional[str], Optional[str]]]
+) -> List[Tuple[str, List[ReferenceString], Optional[str]]]:
+    """
+    Parse references of texts stored in an ExtractedTextCache.
+
+    Entries extracted only partially (``complete`` is False) usually end
+    before the reference list; they are re-extracted in full from the
+    stored PDF when its path is given, and reported as skipped otherwise.
+
+    Module-level so it can be shipped to ProcessPoolExecutor workers.
+
+    Args:
+        cache_dir: Text cache directory
+        extractor_version: Text cache version tag
+        items: (paper_id, content_hash, stored PDF path or None) tuples
+
+    Returns:
+        List of (paper_id, references, skip reason or None)
+    """
+    cache = _get_worker_text_cache(cache_dir, extractor_version)
+
+    results = []
+    for paper_id, content_hash, pdf_path in items:
+        entry = cache.get(content_hash) if content_hash else None
+        if content_hash and (entry is None or entry.get("complete") is False):
+            entry = _extract_full_entry(cache, content_hash, pdf_path) or entry
+
+        if not entry or not entry.get("text"):
+            results.append((paper_id, [], "no_text"))
+        elif entry.get("complete") is False:
+            results.append((paper_id, [], "incomplete"))
+        else:
+            results.append((paper_id, parse_references(entry["text"], entry.get("sections")), None))
+    return results
+
+
+def _parse_texts(
+    items: List[Tuple[str, Optional[str], Optional[List[Dict[str, Any]]]]]
+) -> List[Tuple[str, List[ReferenceString], Optional[str]]]:
+    """
+    Parse references of in-memory texts.
+
+    Module-level so it can be shipped to ProcessPoolExecutor workers.
+    """
+    return [
+        (paper_id, parse_references(text, sections), None if text else "no_text")
+        for paper_id, text, sections in items
+    ]
+
+
+class IdentifierIndex:
+    """
+    Local lookup from normalized DOI / arXiv ID / PubMed ID to paper ID.
+
+    Paper IDs are ``PaperMetadata.primary_identifier`` values, i.e. the node
+    IDs used by the knowledge graph.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._doi: Dict[str, str] = {}
+        self._arxiv: Dict[str, str] = {}
+        self._pubmed: Dict[str, str] = {}
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[PaperMetadata]) -> "IdentifierIndex":
+        """
+        Build an index over papers.
+
+        Args:
+            papers: Papers to index
+
+        Returns:
+            IdentifierIndex
+        """
+        index = cls()
+        for paper in papers:
+            index.add(paper.primary_identifier, paper.doi, paper.arxiv_id, paper.pubmed_id)
+        return index
+
+    def __len__(self) -> int:
+        return len(set(self._doi.values()) | set(self._arxiv.values()) | set(self._pubmed.values()))
+
+    def add(
+        self,
+        paper_id: str,
+        doi: Optional[str] = None,
+        arxiv_id: Optional[str] = None,
+        pubmed_id: Optional[str] = None
+    ):
+        """
+        Index a paper's identifiers (the first paper registered for an identifier wins).
+
+        Args:
+            paper_id: Paper ID to resolve to
+            doi: DOI
+            arxiv_id: arXiv ID
+            pubmed_id: PubMed ID
+        """
+        for table, value in (
+            (self._doi, normalize_doi(doi)),
+            (self._arxiv, normalize_arxiv_id(arxiv_id)),
+            (self._pubmed, normalize_pubmed_id(pubmed_id)),
+        ):
+            if value:
+                table.setdefault(value, paper_id)
+
+    def resolve_all(self, reference: ReferenceString) -> List[str]:
+        """
+        Resolve every identifier in a reference (DOIs, then arXiv, then PubMed).
+
+        Needed for unsplit author-year reference lists, where one string
+        holds the identifiers of many cited papers.
+
+        Args:
+            reference: Parsed reference
+
+        Returns:
+            Distinct paper IDs, in identifier order
+        """
+        paper_ids: Dict[str, None] = {}
+        for table, values in (
+            (self._doi, reference.dois),
+            (self._arxiv, reference.arxiv_ids),
+            (self._pubmed, reference.pubmed_ids),
+        ):
+            for value in values:
+                paper_id = table.get(value)
+                if paper_id is not None:
+                    paper_ids[paper_id] = None
+        return list(paper_ids)
+
+    def resolve(self, reference: ReferenceString) -> Optional[str]:
+        """
+        Resolve a reference to a paper ID (DOI first, then arXiv, then PubMed).
+
+        Args:
+            reference: Parsed reference
+
+        Returns:
+            Paper ID or None
+        """
+        for table, values in (
+            (self._doi, reference.dois),
+            (self._arxiv, reference.arxiv_ids),
+            (self._pubmed, reference.pubmed_ids),
+        ):
+            for value in values:
+                paper_id = table.get(value)
+                if paper_id is not None:
+                    return paper_id
+        return None
+
+
+class ReferenceMiner:
+    """
+    Batch pipeline from stored full texts to CITES edges.
+
+    Reference parsing (section location, splitting, identifier regexes) runs
+    in worker processes in chunks; identifier resolution runs in the parent
+    against the shared IdentifierIndex. Results stream in input order with a
+    bounded number of chunks in flight.
+    """
+
+    def __init__(
+        self,
+        identifier_index: IdentifierIndex,
+        workers: int = 1,
+        chunk_size: int = 64
+    ):
+        """
+        Initialize the miner.
+
+        Args:
+            identifier_index: Index to resolve references against
+            workers: Parsing processes (<=1 parses in-process)
+            chunk_size: Papers per worker task
+
+        Example:
+            ```python
+            index = IdentifierIndex.from_papers(library_papers)
+            miner = ReferenceMiner(index, workers=4)
+            edges = miner.citation_edges(miner.mine_extracted(extractor, papers))
+            graph.create_citations(edges)
+            ```
+        """
+        self.identifier_index = identifier_index
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    def mine_texts(
+        self,
+        documents: Iterable[Tuple[str, Optional[str], Optional[List[Dict[str, Any]]]]]
+    ) -> Iterator[MinedReferences]:
+        """
+        Mine references from in-memory texts.
+
+        Args:
+            documents: (paper_id, cleaned text, section spans or None) tuples
+
+        Yields:
+            MinedReferences per document, in input order
+        """
+        yield from self._run(_parse_texts, (), documents)
+
+    def mine_cached(
+        self,
+        text_cache: ExtractedTextCache,
+        paper_hashes: Iterable[Tuple[str, Optional[str]]],
+        pdf_store: Optional[PDFStore] = None
+    ) -> Iterator[MinedReferences]:
+        """
+        Mine references from texts in an extracted-text cache.
+
+        Args:
+            text_cache: Extracted-text cache
+            paper_hashes: (paper_id, PDF content hash) pairs
+            pdf_store: Store holding the PDFs, to re-extract partial texts in full
+                (without it, partial texts are reported as skipped)
+
+        Yields:
+            MinedReferences per paper, in input order
+        """
+        def items():
+            for paper_id, content_hash in paper_hashes:
+                pdf_path = None
+                if pdf_store is not None and content_hash:
+                    pdf_path = str(pdf_store.blob_path(content_hash))
+                yield paper_id, content_hash, pdf_path
+
+        yield from self._run(
+            _parse_cached_texts,
+            (str(text_cache.cache_dir), text_cache.extractor_version),
+            items()
+        )
+
+    def mine_extracted(self, extractor, papers: Iterable[PaperMetadata]) -> Iterator[MinedReferences]:
+        """
+        Mine references of papers whose PDFs a PDFExtractor has stored.
+
+        Results are keyed by ``primary_identifier``, the ID the identifier
+        index resolves cited papers to.
+
+        Args:
+            extractor: PDFExtractor
+            papers: Papers whose PDFs were fetched through the extractor
+
+        Yields:
+            MinedReferences per paper, in input order
+        """
+        yield from self.mine_cached(
+            extractor.text_cache,
+            (
+                (paper.primary_identifier, extractor.store.hash_for(extractor._cache_id(paper)))
+                for paper in papers
+            ),
+            pdf_store=extractor.store
+        )
+
+    @staticmethod
+    def citation_edges(results: Iterable[MinedReferences]) -> List[Tuple[str, str]]:
+        """
+        Collect unique CITES edges from mining results.
+
+        Args:
+            results: MinedReferences (e.g. from ``mine_texts``)
+
+        Returns:
+            List of (citing_id, cited_id), ready for ``KnowledgeGraph.create_citations``
+        """
+        edges = {}
+        for result in results:
+            for cited_id in result.cited_ids:
+                edges[(result.paper_id, cited_id)] = None
+        return list(edges)
+
+    def _run(self, parse_chunk, args: tuple, items: Iterable[Any]) -> Iterator[MinedReferences]:
+        """Parse items in chunks (in a process pool if configured) and resolve them in order."""
+        chunks = self._chunks(items)
+        if self.workers <= 1:
+            for chunk in chunks:
+                yield from self._resolve(parse_chunk(*args, chunk))
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(parse_chunk, *args, chunk))
+                if len(pending) >= self.workers * 2:
+                    yield from self._resolve(pending.popleft().result())
+            while pending:
+                yield from self._resolve(pending.popleft().result())
+
+    def _chunks(self, items: Iterable[Any]) -> Iterator[List[Any]]:
+        """Group items into lists of chunk_size."""
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _resolve(self, parsed: List[Tuple[str, List[ReferenceString], Optional[str]]]) -> Iterator[MinedReferences]:
+        """Resolve parsed references against the identifier index."""
+        for paper_id, references, skipped in parsed:
+            result = MinedReferences(paper_id=paper_id, references=references, skipped=skipped)
+            seen = set()
+            for reference in references:
+                cited_ids = self.identifier_index.resolve_all(reference)
+                if not cited_ids:
+                    if reference.dois or reference.arxiv_ids or reference.pubmed_ids:
+                        result.unresolved.append(reference)
+                for cited_id in cited_ids:
+                    if cited_id != paper_id and cited_id not in seen:
+                        seen.add(cited_id)
+                        result.cited_ids.append(cited_id)
+            yield result
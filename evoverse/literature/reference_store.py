@@ -0,0 +1,254 @@
+"""
+Persistent storage and search index for ReferenceManager.
+
+Provides:
+- Append-only journal on top of a JSON snapshot, with compaction
+- Inverted token index for searching references by field
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+import logging
+
+from evoverse.literature.base_client import PaperMetadata
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class ReferenceJournal:
+    """
+    Snapshot + append-only journal storage.
+
+    The snapshot keeps the original library format
+    (``{"references": {...}, "citation_links": {...}}``); changes since the
+    last snapshot are appended as JSON lines to ``<snapshot>.journal``:
+
+    - ``{"op": "put", "ref_id": ..., "paper": {...}}``
+    - ``{"op": "delete", "ref_id": ...}``
+    - ``{"op": "links", "ref_id": ..., "cited": [...] | null}``
+
+    Appends are O(1); ``compact`` folds the journal back into the snapshot.
+    """
+
+    def __init__(self, snapshot_path: Path, compact_threshold: int = 1000):
+        """
+        Initialize the journal.
+
+        Args:
+            snapshot_path: Path to the JSON snapshot (the library file)
+            compact_threshold: Minimum journal entries before compaction is due
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_name(self.snapshot_path.name + ".journal")
+        self.compact_threshold = compact_threshold
+        self.entry_count = 0
+
+    def exists(self) -> bool:
+        """Check whether any stored data exists."""
+        return self.snapshot_path.exists() or self.journal_path.exists()
+
+    def load(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]]]:
+        """
+        Load the snapshot and replay the journal.
+
+        Returns:
+            Tuple of (ref_id -> paper record, citation_links)
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        citation_links: Dict[str, List[str]] = {}
+
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, 'r') as f:
+                data = json.load(f)
+            records = data.get("references", {})
+            citation_links = data.get("citation_links", {})
+
+        self.entry_count = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write at the end of the journal
+                        logger.warning("Skipping unreadable journal entry")
+                        continue
+
+                    op = entry.get("op")
+                    ref_id = entry.get("ref_id")
+                    if op == "put":
+                        records[ref_id] = entry["paper"]
+                    elif op == "delete":
+                        records.pop(ref_id, None)
+                    elif op == "links":
+                        if entry.get("cited") is None:
+                            citation_links.pop(ref_id, None)
+                        else:
+                            citation_links[ref_id] = entry["cited"]
+                    self.entry_count += 1
+
+        return records, citation_links
+
+    def append(self, entries: List[Dict[str, Any]]):
+        """
+        Append entries to the journal.
+
+        Args:
+            entries: Journal entries (see class docstring)
+        """
+        if not entries:
+            return
+
+        with open(self.journal_path, 'a') as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+            f.flush()
+
+        self.entry_count += len(entries)
+
+    def needs_compaction(self, live_count: int) -> bool:
+        """Check whether the journal has grown past the library size."""
+        return self.entry_count >= max(self.compact_threshold, live_count)
+
+    def compact(self, records: Dict[str, Dict[str, Any]], citation_links: Dict[str, List[str]]):
+        """
+        Write a fresh snapshot and truncate the journal.
+
+        Args:
+            records: ref_id -> paper record
+            citation_links: Citation relationships
+        """
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({"references": records, "citation_links": citation_links}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(self.snapshot_path)
+
+        # Snapshot is durable, journal entries are now redundant
+        self.journal_path.unlink(missing_ok=True)
+        self.entry_count = 0
+
+        logger.debug(f"Compacted reference storage ({len(records)} references)")
+
+
+class ReferenceSearchIndex:
+    """
+    Inverted token index over reference fields.
+
+    Per-field indexes are built on first search of that field and kept up
+    to date afterwards, so libraries that are never searched pay nothing.
+    Query tokens match indexed tokens they are a substring of ("net" finds
+    "resnet"), so candidates cover every plain substring match; the scan
+    runs over the (much smaller) vocabulary, not the texts.
+    """
+
+    FIELDS = ("title", "authors", "keywords", "abstract")
+
+    def __init__(self):
+        """Initialize an empty index."""
+        # field -> token -> ref_ids
+        self._postings: Dict[str, Dict[str, Set[str]]] = {}
+        # field -> vocabulary (None when stale)
+        self._vocab: Dict[str, Optional[List[str]]] = {}
+
+    @staticmethod
+    def field_text(paper: PaperMetadata, field: str) -> str:
+        """Get the searchable text of a paper field."""
+        if field == "title":
+            return paper.title or ""
+        if field == "authors":
+            return " ".join(a.name for a in paper.authors or [])
+        if field == "keywords":
+            return " ".join(paper.keywords or [])
+        if field == "abstract":
+            return paper.abstract or ""
+        return ""
+
+    def is_built(self, field: str) -> bool:
+        """Check whether a field is indexed."""
+        return field in self._postings
+
+    def build(self, field: str, references: Dict[str, PaperMetadata]):
+        """Index a field for all references."""
+        self._postings[field] = {}
+        self._vocab[field] = None
+        for ref_id, paper in references.items():
+            self._add_field(field, ref_id, paper)
+
+    def add(self, ref_id: str, paper: PaperMetadata):
+        """Index a reference in every built field."""
+        for field in self._postings:
+            self._add_field(field, ref_id, paper)
+
+    def remove(self, ref_id: str, paper: PaperMetadata):
+        """Remove a reference from every built field."""
+        for field, postings in self._postings.items():
+            for token in set(tokenize(self.field_text(paper, field))):
+                ref_ids = postings.get(token)
+                if ref_ids is not None:
+                    ref_ids.discard(ref_id)
+                    if not ref_ids:
+                        del postings[token]
+                        self._vocab[field] = None
+
+    def clear(self):
+        """Drop all field indexes."""
+        self._postings.clear()
+        self._vocab.clear()
+
+    def candidates(self, field: str, query: str) -> Optional[Set[str]]:
+        """
+        Get references whose field contains every query token (as a substring of a word).
+
+        Args:
+            field: Built field name
+            query: Search query
+
+        Returns:
+            Set of ref_ids, or None if the query has no tokens
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+
+        result: Optional[Set[str]] = None
+        for token in sorted(set(tokens), key=len, reverse=True):
+            matched = self._substring_postings(field, token)
+            result = matched if result is None else result & matched
+            if not result:
+                return set()
+        return result
+
+    def _add_field(self, field: str, ref_id: str, paper: PaperMetadata):
+        """Index one field of one reference."""
+        postings = self._postings[field]
+        for token in set(tokenize(self.field_text(paper, field))):
+            ref_ids = postings.get(token)
+            if ref_ids is None:
+                postings[token] = {ref_id}
+                self._vocab[field] = None
+            else:
+                ref_ids.add(ref_id)
+
+    def _substring_postings(self, field: str, fragment: str) -> Set[str]:
+        """Union of postings of all tokens containing fragment."""
+        postings = self._postings[field]
+        vocab = self._vocab.get(field)
+        if vocab is None:
+            vocab = self._vocab[field] = list(postings)
+
+        matched: Set[str] = set()
+        for token in vocab:
+            if fragment in token:
+                matched |= postings[token]
+        return matched
@@ -0,0 +1,198 @@
+"""
+Section detection for extracted paper text.
+
+Finds section headings (abstract, methods, results, discussion,
+references, ...) in raw PDF page text, turns them into character spans
+over the cleaned full text, and builds section-limited prompt excerpts.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Canonical section names -> heading variants (lowercase)
+SECTION_ALIASES: Dict[str, List[str]] = {
+    "abstract": ["abstract", "summary"],
+    "introduction": ["introduction", "background"],
+    "methods": [
+        "methods", "method", "methodology", "materials and methods",
+        "methods and materials", "experimental", "experimental setup",
+        "experiments", "approach"
+    ],
+    "results": ["results", "experimental results", "results and discussion", "findings", "evaluation"],
+    "discussion": ["discussion", "general discussion"],
+    "conclusion": ["conclusion", "conclusions", "concluding remarks", "summary and conclusions"],
+    "references": ["references", "bibliography", "literature cited", "works cited"],
+}
+
+_HEADING_LOOKUP = {
+    variant: section
+    for section, variants in SECTION_ALIASES.items()
+    for variant in variants
+}
+
+# Optional numbering ("3", "3.", "III.", "3.1") followed by a short title on its own line
+_HEADING_RE = re.compile(
+    r'^[ \t]*(?:(?:\d+(?:\.\d+)*|[IVX]+)\.?[ \t]+)?([A-Za-z][A-Za-z &]{2,40}?)[ \t]*:?[ \t]*$',
+    re.MULTILINE
+)
+
+
+def find_headings(raw_text: str) -> List[Tuple[str, int]]:
+    """
+    Find known section headings in raw (uncleaned) page text.
+
+    Args:
+        raw_text: Page text as returned by PyMuPDF, with line breaks
+
+    Returns:
+        List of (canonical section name, index into raw_text) tuples
+    """
+    headings = []
+    for match in _HEADING_RE.finditer(raw_text):
+        name = re.sub(r'\s+', ' ', match.group(1)).strip().lower()
+        section = _HEADING_LOOKUP.get(name)
+        if section:
+            headings.append((section, match.start()))
+    return headings
+
+
+def build_sections(
+    text: Optional[str],
+    page_offsets: List[int],
+    headings: List[List[Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Turn detected headings into contiguous section spans.
+
+    The first occurrence of each canonical section is kept; text before the
+    first heading becomes a "front_matter" section (title, authors and, for
+    papers without an explicit heading, the abstract).
+
+    Args:
+        text: Cleaned full text
+        page_offsets: Start offset of each page within text
+        headings: [section, offset] pairs in reading order
+
+    Returns:
+        List of section dicts with name, start, end, page_start, page_end
+        (pages are 1-based)
+    """
+    if not text:
+        return []
+
+    spans = []
+    seen = set()
+    last_offset = -1
+    for name, offset in sorted(headings, key=lambda h: h[1]):
+        if name in seen or offset <= last_offset or offset >= len(text):
+            continue
+        seen.add(name)
+        spans.append((name, offset))
+        last_offset = offset
+
+    if not spans or spans[0][1] > 0:
+        spans.insert(0, ("front_matter", 0))
+
+    def page_at(offset: int) -> int:
+        return max(1, bisect_right(page_offsets, offset))
+
+    sections = []
+    for i, (name, start) in enumerate(spans):
+        end = spans[i + 1][1] if i + 1 < len(spans) else len(text)
+        sections.append({
+            "name": name,
+            "start": start,
+            "end": end,
+            "page_start": page_at(start),
+            "page_end": page_at(max(start, end - 1))
+        })
+    return sections
+
+
+def select_sections(
+    text: str,
+    sections: List[Dict[str, Any]],
+    names: List[str],
+    max_chars: Optional[int] = None
+) -> str:
+    """
+    Build a prompt excerpt from selected sections of a paper.
+
+    The character budget is shared in order: each section gets at most an
+    equal share of what is left, so short sections (e.g. the abstract)
+    leave room for later ones. "abstract" falls back to the front matter
+    when the paper has no explicit abstract heading.
+
+    Args:
+        text: Cleaned full text
+        sections: Section spans (see ``build_sections``)
+        names: Canonical section names to include, in output order
+        max_chars: Optional total character budget
+
+    Returns:
+        Labelled excerpt, or an empty string if none of the sections exist
+
+    Example:
+        ```python
+        excerpt = select_sections(
+            paper.full_text, paper.sections,
+            ["abstract", "methods", "results"], max_chars=5000
+        )
+        ```
+    """
+    by_name = {s["name"]: s for s in sections}
+    chosen = []
+    for name in names:
+        section = by_name.get(name)
+        if section is None and name == "abstract":
+            section = by_name.get("front_matter")
+        if section is not None and section not in chosen:
+            chosen.append(section)
+
+    parts = []
+    remaining = max_chars
+    for i, section in enumerate(chosen):
+        body = text[section["start"]:section["end"]].strip()
+        if remaining is not None:
+            share = remaining // (len(chosen) - i)
+            body = body[:share]
+            remaining -= len(body)
+        if body:
+            parts.append(f"[{section['name'].replace('_', ' ').title()}]\n{body}")
+
+    return "\n\n".join(parts)
+
+
+@dataclass
+class DocumentSection:
+    """A detected section of a paper's full text."""
+    name: str  # Canonical name (abstract, methods, results, ...) or "front_matter"
+    start: int  # Character offset into the full text
+    end: int
+    page_start: int  # 1-based
+    page_end: int
+
+
+@dataclass
+class StructuredDocument:
+    """Cleaned full text of a PDF together with its section spans."""
+    text: str
+    sections: List[DocumentSection]
+
+    def get_section(self, name: str) -> Optional[str]:
+        """Get the text of a section, or None if it was not detected."""
+        for section in self.sections:
+            if section.name == name:
+                return self.text[section.start:section.end].strip()
+        return None
+
+    def select(self, names: List[str], max_chars: Optional[int] = None) -> str:
+        """Build a labelled excerpt of the given sections (see ``select_sections``)."""
+        return select_sections(self.text, self.section_dicts(), names, max_chars)
+
+    def section_dicts(self) -> List[Dict[str, Any]]:
+        """Sections as plain dicts, e.g. for ``PaperMetadata.sections``."""
+        return [asdict(section) for section in self.sections]
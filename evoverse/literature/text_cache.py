@@ -0,0 +1,160 @@
+"""
+Extracted-text cache for PDFs.
+
+Stores cleaned full text and per-page offsets keyed by the SHA-256 of the
+PDF bytes and the extractor version, so a PDF is parsed at most once no
+matter how many paper IDs point at it.
+"""
+
+import gzip
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractedTextCache:
+    """
+    Disk-based cache for text extracted from PDFs.
+
+    Each entry is a gzip-compressed JSON file named
+    ``{content_hash}_{extractor_version}.json.gz``. Bumping the extractor
+    version invalidates all earlier entries without touching them.
+    """
+
+    def __init__(self, cache_dir: str, extractor_version: str):
+        """
+        Initialize the text cache.
+
+        Args:
+            cache_dir: Directory to store cache files
+            extractor_version: Version tag of the extraction/cleaning logic
+        """
+        self.cache_dir = Path(cache_dir)
+        self.extractor_version = extractor_version
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Initialized text cache: dir={cache_dir}, version={extractor_version}")
+
+    @staticmethod
+    def content_hash(pdf_bytes: bytes) -> str:
+        """
+        Compute the content hash used as cache key.
+
+        Args:
+            pdf_bytes: PDF file bytes
+
+        Returns:
+            Hexadecimal SHA-256 digest
+        """
+        return hashlib.sha256(pdf_bytes).hexdigest()
+
+    def _get_cache_path(self, content_hash: str) -> Path:
+        """
+        Get the file path for a content hash.
+
+        Args:
+            content_hash: PDF content hash
+
+        Returns:
+            Path to cache file
+        """
+        subdir = self.cache_dir / content_hash[:2]
+        subdir.mkdir(exist_ok=True)
+
+        return subdir / f"{content_hash}_{self.extractor_version}.json.gz"
+
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve extracted text for a PDF.
+
+        Args:
+            content_hash: PDF content hash
+
+        Returns:
+            Dictionary with 'text' (None for unextractable PDFs) and
+            'page_offsets', or None on cache miss
+        """
+        cache_path = self._get_cache_path(content_hash)
+
+        if not cache_path.exists():
+            return None
+
+        try:
+            with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+
+            logger.debug(f"Text cache hit: {content_hash[:12]}")
+            return entry
+
+        except Exception as e:
+            logger.warning(f"Error reading text cache: {e}")
+            cache_path.unlink(missing_ok=True)
+            return None
+
+    def set(
+        self,
+        content_hash: str,
+        text: Optional[str],
+        page_offsets: List[int],
+        **extra: Any
+    ):
+        """
+        Store extracted text for a PDF.
+
+        Args:
+            content_hash: PDF content hash
+            text: Cleaned text (None records that the PDF had no usable text)
+            page_offsets: Start offset of each page within text
+            **extra: Additional JSON-serializable fields to store
+        """
+        cache_path = self._get_cache_path(content_hash)
+
+        try:
+            entry = {
+                "text": text,
+                "page_offsets": page_offsets,
+                "extractor_version": self.extractor_version,
+                "cached_at": datetime.utcnow().isoformat(),
+                **extra
+            }
+
+            tmp_path = cache_path.with_suffix(".tmp")
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(entry, f)
+            tmp_path.replace(cache_path)
+
+        except Exception as e:
+            logger.warning(f"Error writing text cache: {e}")
+
+    def clear(self):
+        """Clear all cached texts."""
+        count = 0
+        for cache_file in self.cache_dir.rglob("*.json.gz"):
+            cache_file.unlink()
+            count += 1
+
+        logger.info(f"Cleared {count} cached texts")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get text cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        cache_files = list(self.cache_dir.rglob("*.json.gz"))
+        current = [f for f in cache_files if f.name.endswith(f"_{self.extractor_version}.json.gz")]
+        total_size_mb = sum(f.stat().st_size for f in cache_files) / (1024 * 1024)
+
+        return {
+            "cache_dir": str(self.cache_dir),
+            "extractor_version": self.extractor_version,
+            "total_entries": len(cache_files),
+            "current_version_entries": len(current),
+            "size_mb": round(total_size_mb, 2)
+        }
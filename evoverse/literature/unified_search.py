@@ -77,6 +77,8 @@ class UnifiedLiteratureSearch:
         year_to: Optional[int] = None,
         deduplicate: bool = True,
         extract_full_text: bool = False,
+        full_text_max_chars: Optional[int] = None,
+        full_text_until_section: Optional[str] = None,
         sources: Optional[List[PaperSource]] = None,
         **kwargs
     ) -> List[PaperMetadata]:
@@ -92,6 +94,10 @@ class UnifiedLiteratureSearch:
             year_to: Optional end year filter
             deduplicate: Whether to deduplicate results by DOI/arXiv/title
             extract_full_text: Whether to extract full PDF text for results
+            full_text_max_chars: If set, only extract the first N characters of each
+                PDF (pages beyond that are never parsed)
+            full_text_until_section: If set, stop extracting each PDF at this section
+                heading (e.g. "references")
             sources: Optional list of specific sources to search (if None, uses all enabled)
             **kwargs: Additional source-specific parameters
 
@@ -175,7 +181,11 @@ class UnifiedLiteratureSearch:
 
         # Extract full text if requested
         if extract_full_text:
-            self._extract_full_text(all_papers)
+            self._extract_full_text(
+                all_papers,
+                max_chars=full_text_max_chars,
+                until_section=full_text_until_section
+            )
 
         return all_papers
 
@@ -467,18 +477,31 @@ class UnifiedLiteratureSearch:
 
         return [paper for paper, _ in papers_with_scores]
 
-    def _extract_full_text(self, papers: List[PaperMetadata]):
+    def _extract_full_text(
+        self,
+        papers: List[PaperMetadata],
+        max_chars: Optional[int] = None,
+        until_section: Optional[str] = None
+    ):
         """
         Extract full text for papers with PDF URLs.
 
+        Downloads run concurrently and parsing runs in a process pool
+        (see ``PDFExtractor.extract_papers_text``), so the total time is
+        roughly that of the slowest paper rather than the sum of all.
+
         Modifies papers in-place.
 
         Args:
             papers: List of papers to extract text for
+            max_chars: Optional cap on extracted characters per paper
+            until_section: Optional section heading to stop extraction at
         """
-        for paper in papers:
-            if paper.pdf_url and not paper.full_text:
-                try:
-                    self.pdf_extractor.extract_paper_text(paper)
-                except Exception as e:
-                    logger.warning(f"Could not extract PDF for {paper.id}: {e}")
+        try:
+            self.pdf_extractor.extract_papers_text(
+                papers,
+                max_chars=max_chars,
+                until_section=until_section
+            )
+        except Exception as e:
+            logger.warning(f"Could not extract PDFs: {e}")